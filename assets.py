@@ -0,0 +1,120 @@
+import hashlib
+import os
+import struct
+
+import pygame
+
+ASSET_DIR = "assets"
+CACHE_DIR = ".asset_cache"
+
+# Cache file layout (little endian): magic "EAST" | source mtime ns u64 |
+# width u32 | height u32 | bytes per pixel u8, then the raw RGB/RGBA pixels
+CACHE_HEADER = struct.Struct("<4sQIIB")
+CACHE_MAGIC = b"EAST"
+
+
+class AssetManager:
+    """Loads each image once and shares the surface.
+
+    Images are requested with the processing they need (target size or
+    scale factor, alpha, horizontal flip). Each variant is built on first
+    request: loaded, converted to the display format, then scaled. The
+    result is shared by every later caller, so callers must not draw on
+    it. Built variants are also written to an on-disk cache as raw pixels,
+    so later runs skip the PNG decoding and rescaling. A cache entry is
+    rebuilt when its source file's mtime changes.
+
+    Needs the display mode to be set before the first request.
+    """
+
+    def __init__(self, asset_dir=ASSET_DIR, cache_dir=CACHE_DIR):
+        self.asset_dir = asset_dir
+        self.cache_dir = cache_dir
+        self._images = {}
+        self._decoded = {}  # decode() results waiting for image()
+
+    def image(self, name, size=None, scale=None, alpha=True, flip=False):
+        """Surface for assets/`name`, resized to `size` or by `scale`.
+        Raises like pygame.image.load when the file is missing"""
+        key = (name, size, scale, alpha, flip)
+        surface = self._images.get(key)
+        if surface is None:
+            surface = self._images[key] = self._load(key)
+        return surface
+
+    def decode(self, name, size=None, scale=None, alpha=True, flip=False):
+        """Read and decode an image variant ahead of image() with the same
+        arguments, which then only has to convert it. Touches files but not
+        the display, so unlike image() it may run off the main thread"""
+        key = (name, size, scale, alpha, flip)
+        if key not in self._images and key not in self._decoded:
+            self._decoded[key] = self._decode(key)
+
+    def _decode(self, key):
+        """(surface, done, cache path, mtime): the cached variant (done) or
+        else the decoded source image, not yet in the display format"""
+        name, _, _, alpha, _ = key
+        path = os.path.join(self.asset_dir, name)
+        mtime = os.stat(path).st_mtime_ns
+        cache_path = None
+        if self.cache_dir:
+            digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+            cache_path = os.path.join(
+                self.cache_dir, f"{os.path.splitext(name)[0]}-{digest}.raw")
+            surface = self._read_cache(cache_path, mtime, alpha)
+            if surface is not None:
+                return surface, True, cache_path, mtime
+        return pygame.image.load(path), False, cache_path, mtime
+
+    def _load(self, key):
+        _, size, scale, alpha, flip = key
+        decoded = self._decoded.pop(key, None) or self._decode(key)
+        surface, done, cache_path, mtime = decoded
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        if done:
+            return surface
+
+        if scale is not None:
+            size = (int(surface.get_width() * scale), int(surface.get_height() * scale))
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+        if flip:
+            surface = pygame.transform.flip(surface, True, False)
+
+        if cache_path:
+            self._write_cache(cache_path, mtime, surface, alpha)
+        return surface
+
+    def _read_cache(self, path, mtime, alpha):
+        try:
+            with open(path, "rb") as f:
+                header = f.read(CACHE_HEADER.size)
+                pixels = f.read()
+        except OSError:
+            return None
+        if len(header) < CACHE_HEADER.size:
+            return None
+        magic, cached_mtime, width, height, depth = CACHE_HEADER.unpack(header)
+        if (magic != CACHE_MAGIC or cached_mtime != mtime
+                or depth != (4 if alpha else 3) or len(pixels) != width * height * depth):
+            return None
+        return pygame.image.frombytes(pixels, (width, height), "RGBA" if alpha else "RGB")
+
+    def _write_cache(self, path, mtime, surface, alpha):
+        # A cache that cannot be written (read-only checkout...) only costs
+        # the speedup next time
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            width, height = surface.get_size()
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(CACHE_HEADER.pack(CACHE_MAGIC, mtime, width, height,
+                                          4 if alpha else 3))
+                f.write(pygame.image.tobytes(surface, "RGBA" if alpha else "RGB"))
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+# Shared by the game, player and whale
+ASSETS = AssetManager()
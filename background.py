@@ -0,0 +1,97 @@
+import pygame
+
+
+class ParallaxBackground:
+    """Draws the scrolling background layers, each tiled twice (at its
+    position and one screen width further).
+
+    When every layer is opaque and as tall as the screen, a layer hides
+    everything under it, so each screen column only needs its topmost
+    covering layer. The columns are worked out per frame and drawn as
+    sub-rectangle blits straight from the layer images (shared ones
+    included), about one screen of pixels instead of one per tile.
+
+    Every frame covers the whole screen, so nothing drawn on top can leave
+    trails: columns no tile covers (an image narrower than the screen
+    leaves a gap at the end of each tile) are drawn from a backdrop of
+    `fill`, by default the back layer's average colour.
+    """
+
+    def __init__(self, layers, width, height, fill=None):
+        # layers: dicts with "img" and "speed", back to front
+        self.layers = layers
+        self.width = width
+        self.height = height
+        self.occluding = all(self.is_opaque(layer["img"]) for layer in layers)
+        if fill is None:
+            fill = pygame.transform.average_color(layers[0]["img"])[:3]
+        self.fill = fill
+        self.backdrop = pygame.Surface((width, height))
+        self.backdrop.fill(fill)
+
+    def is_opaque(self, image):
+        return (not image.get_flags() & pygame.SRCALPHA
+                and image.get_colorkey() is None and image.get_alpha() is None
+                and image.get_height() >= self.height)
+
+    def plan(self, positions):
+        """(image, screen x, source area) blits for the visible parts of the
+        layers, and of the backdrop where no layer reaches"""
+        uncovered = [(0, self.width)]
+        blits = []
+        # Front to back, each layer takes what is still uncovered
+        for layer, position in reversed(list(zip(self.layers, positions))):
+            image = layer["img"]
+            x = int(position)
+            tiles = ((x, x + image.get_width()),
+                     (x + self.width, x + self.width + image.get_width()))
+            remaining = []
+            for start, end in uncovered:
+                for tile_start, tile_end in tiles:
+                    left = max(start, tile_start)
+                    right = min(end, tile_end)
+                    if left < right:
+                        blits.append((image, (left, 0), pygame.Rect(
+                            left - tile_start, 0, right - left, self.height)))
+                remaining.extend(self.subtract(start, end, tiles))
+            uncovered = remaining
+            if not uncovered:
+                break
+        blits.extend((self.backdrop, (start, 0), pygame.Rect(start, 0, end - start, self.height))
+                     for start, end in uncovered)
+        return blits
+
+    @staticmethod
+    def subtract(start, end, tiles):
+        """Parts of [start, end) outside the tiles (sorted, disjoint)"""
+        parts = []
+        for tile_start, tile_end in tiles:
+            if tile_start > start:
+                parts.append((start, min(end, tile_start)))
+            start = max(start, tile_end)
+            if start >= end:
+                return parts
+        parts.append((start, end))
+        return [(a, b) for a, b in parts if a < b]
+
+    def blits(self, positions, layers=None):
+        """Blits drawing the background with at most the front `layers`
+        layers (default all).
+
+        Opaque layers always all take part: each screen column is drawn
+        once whichever layer it comes from, so dropping the back layers
+        saves nothing and would only leave their columns undrawn.
+        Translucent layers are drawn whole, front `layers` only, over the
+        backdrop.
+        """
+        if self.occluding:
+            return self.plan(positions)
+        entries = [(self.backdrop, (0, 0))]
+        visible = list(zip(self.layers, positions))[-(layers or len(self.layers)):]
+        for layer, position in visible:
+            entries.append((layer["img"], (int(position), 0)))
+            entries.append((layer["img"], (int(position) + self.width, 0)))
+        return entries
+
+    def draw(self, screen, positions, layers=None):
+        screen.blits(self.blits(positions, layers), doreturn=False)
@@ -0,0 +1,468 @@
+"""Lockstep simulation of many independent runs with NumPy arrays.
+
+BatchSim plays N games at once, one row per run, following the rules of
+Game.spawn_objects and Game.update: player physics, jetpack, dash,
+obstacle and power-up spawning and motion (shared with entity_store),
+pickups, timers, magnet, scoring and difficulty milestones. Runs stop
+at their first game over and report survival distance and score.
+
+Not simulated: drawing, sounds, decorations and the whale, which never
+collides with the player. Runs use their own NumPy random stream, so a
+batch reproduces Game's statistics, not its exact runs for a given seed.
+
+Game tests collisions against sprite masks; here obstacles hit a player
+rect inset by 5px (swept over the frame, like Game's) and power-ups the
+full rect. The player's pixels fill only part of its rect, so runs end
+slightly early: with the jumper policy, mean survival distance was 535
+(+-3, 20000 runs) here against 554 (+-11, 1600 runs) in Game, medians 396
+and 409. A hitbox of the mask's bounding rect is further off (511), and
+with the idle policy both agree within noise (218 and 225 +-5).
+
+Throughput grows with the batch size, as per-step overhead is shared by
+more runs. On one core, 1000 runs step at 4-6M frames per minute, and
+4000 to 20000 runs at 7-8.5M (jumper and idle policies).
+"""
+import numpy as np
+
+from entity_store import (
+    CLOCK,
+    DEEPFAKE,
+    DOUBLE,
+    DRONE,
+    FIELDS,
+    FUEL,
+    LASER,
+    MAGNET,
+    OBSTACLE,
+    SHIELD,
+    advance,
+    field_arrays,
+    round_rect_coord,
+)
+from game import DIFFICULTY
+from replay import PRESSED_SHIFT
+
+WIDTH = 1200
+HEIGHT = 600
+GROUND_Y = HEIGHT - 50
+
+# Player rect: fixed x, top edge in BatchSim.y
+PLAYER_X = 125
+PLAYER_WIDTH = 60
+PLAYER_HEIGHT = 80
+
+# Policy actions are per-run key masks laid out like replay files
+HOLD_SPACE = 1
+PRESS_SPACE = 1 << PRESSED_SHIFT
+PRESS_JETPACK = 2 << PRESSED_SHIFT
+PRESS_DASH = 4 << PRESSED_SHIFT
+JUMP = HOLD_SPACE | PRESS_SPACE
+
+# Regular obstacle types: server, competitor, regulation
+OBSTACLE_WIDTHS = np.array([30, 40, 50])
+OBSTACLE_MIN_HEIGHTS = np.array([60, 40, 30])
+OBSTACLE_MAX_HEIGHTS = np.array([90, 70, 50])
+
+# Regular power-ups, in Game.spawn_objects order, with their size and
+# spawn height range
+POWERUP_KINDS = np.array([FUEL, SHIELD, CLOCK, MAGNET, DOUBLE])
+POWERUP_SIZES = np.array([25, 25, 30, 30, 30])
+POWERUP_MIN_Y = np.array([HEIGHT - 300, HEIGHT - 250, HEIGHT - 300,
+                          HEIGHT - 300, HEIGHT - 300])
+POWERUP_MAX_Y = np.array([HEIGHT - 100, HEIGHT - 150, HEIGHT - 100,
+                          HEIGHT - 100, HEIGHT - 100])
+
+
+def idle(sim):
+    """Policy that never touches the keyboard"""
+    return np.zeros(sim.n, np.uint8)
+
+
+def jumper(sim):
+    """Policy that jumps when an obstacle is about to reach the player"""
+    e = sim.obstacles
+    ahead = e.valid & (e.x + e.w > PLAYER_X) & \
+        (e.x < PLAYER_X + PLAYER_WIDTH + 10 * sim.game_speed[:, None])
+    return np.where(ahead.any(axis=1), JUMP, 0).astype(np.uint8)
+
+
+class BatchSim:
+    def __init__(self, n, seed=None, capacity=16, **params):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+
+        # Difficulty settings (see game.DIFFICULTY), one value per run
+        for name in params:
+            if name not in DIFFICULTY:
+                raise TypeError(f"Unknown difficulty setting: {name}")
+        for name, default in DIFFICULTY.items():
+            value = np.asarray(params.get(name, default), float)
+            setattr(self, name, np.broadcast_to(value, (n,)).copy())
+
+        # Outcome of every run by its original index, filled in as runs end.
+        # Finished runs are periodically dropped from the state arrays below;
+        # ids maps the remaining rows back to their run
+        self.results = {"distance": np.zeros(n), "score": np.zeros(n),
+                        "frames": np.zeros(n, np.int64)}
+        self.ids = np.arange(n)
+
+        # Game state
+        self.alive = np.ones(n, bool)
+        self.frames = np.zeros(n, np.int64)  # frames survived
+        self.score = np.zeros(n)
+        self.distance = np.zeros(n)
+        self.game_speed = self.base_game_speed.copy()
+        self.spawn_timer = np.zeros(n)
+        self.difficulty_level = np.ones(n)
+        self.next_milestone = self.milestone_step.copy()
+        self.shield_active = np.zeros(n, bool)
+        self.shield_timer = np.zeros(n)
+        self.slow_timer = np.zeros(n)
+        self.magnet_active = np.zeros(n, bool)
+        self.magnet_timer = np.zeros(n)
+        self.double_points_active = np.zeros(n, bool)
+        self.double_points_timer = np.zeros(n)
+
+        # Player
+        self.y = np.full(n, float(GROUND_Y - PLAYER_HEIGHT))
+        self.velocity_y = np.zeros(n)
+        self.is_jumping = np.zeros(n, bool)
+        self.is_using_jetpack = np.zeros(n, bool)
+        self.jetpack_fuel = np.full(n, 50.0)
+        self.can_dash = np.ones(n, bool)
+        self.dash_cooldown = np.zeros(n)
+        self.is_dashing = np.zeros(n, bool)
+        self.dash_duration = np.zeros(n)
+        self.invincible = np.zeros(n, bool)
+        self.invincible_timer = np.zeros(n)
+
+        # Entity slots, one row per run
+        self.obstacles = self.slots(capacity)
+        self.powerups = self.slots(capacity)
+        self.powerups.amount = np.zeros((n, capacity))  # jetpack fuel
+
+    def slots(self, capacity):
+        e = field_arrays((self.n, capacity))
+        e.valid = np.zeros((self.n, capacity), bool)
+        return e
+
+    def run(self, policy=idle, max_frames=36000):
+        """Step until every run is over or max_frames have passed.
+        Returns (distance, score) arrays in run order; frames survived are
+        in results["frames"]"""
+        frame = 0
+        while frame < max_frames and self.alive.any():
+            self.step(policy(self))
+            frame += 1
+            if self.alive.sum() <= self.n // 2:
+                self.compact()
+        self.record(np.ones(self.n, bool))  # including runs still going
+        return self.results["distance"], self.results["score"]
+
+    def record(self, rows):
+        for name, result in self.results.items():
+            result[self.ids[rows]] = getattr(self, name)[rows]
+
+    def compact(self):
+        """Record finished runs and drop their rows, so later steps only
+        pay for runs still going"""
+        self.record(~self.alive)
+        keep = self.alive.copy()
+        n = self.n
+        for holder in (self, self.obstacles, self.powerups):
+            for name, value in vars(holder).items():
+                if isinstance(value, np.ndarray) and value.shape[:1] == (n,):
+                    setattr(holder, name, value[keep])
+        self.n = int(keep.sum())
+
+    def step(self, actions):
+        """Advance every live run one frame with the given key masks"""
+        actions = np.asarray(actions)
+        alive = self.alive
+        self.frames += alive
+        self.handle_input(alive & (actions & PRESS_SPACE != 0),
+                          alive & (actions & PRESS_JETPACK != 0),
+                          alive & (actions & PRESS_DASH != 0))
+        self.spawn_objects(alive)
+        self.update(alive, actions & HOLD_SPACE != 0)
+
+    def handle_input(self, space, jetpack, dash):
+        # Same order as the key events Game dispatches
+        jump = space & ~self.is_using_jetpack & ~self.is_jumping
+        self.velocity_y[jump] = -15
+        self.is_jumping |= jump
+
+        toggle = jetpack & (self.jetpack_fuel >= 5)
+        self.is_using_jetpack ^= toggle
+
+        dash = dash & self.can_dash & ~self.is_dashing
+        self.is_dashing |= dash
+        self.dash_duration[dash] = 20
+        self.can_dash &= ~dash
+        self.dash_cooldown[dash] = 180
+        self.invincible |= dash
+        self.invincible_timer[dash] = 25
+
+    def spawn_objects(self, alive):
+        self.spawn_timer += alive
+        spawn_rate = np.maximum(20, 50 - self.game_speed * 2)
+        rightmost = np.maximum(self.rightmost(self.obstacles),
+                               self.rightmost(self.powerups))
+        spawning = alive & (self.spawn_timer >= spawn_rate) & \
+            (rightmost < WIDTH - self.obstacle_gap)
+        self.spawn_timer[spawning] = 0
+
+        rows = np.flatnonzero(spawning)
+        if not len(rows):
+            return
+        rng = self.rng
+        chance = rng.random(len(rows))
+        obstacle_chance = self.obstacle_chance[rows]
+        is_obstacle = chance < obstacle_chance
+        is_powerup = ~is_obstacle & (chance < obstacle_chance + 0.2)
+
+        # Obstacles: 4 in 6 regular (the "mine" choice is one too), then
+        # drone and laser
+        rows_o = rows[is_obstacle]
+        choice = rng.integers(0, 6, len(rows_o))
+        kind = np.select([choice == 4, choice == 5], [DRONE, LASER], OBSTACLE)
+        regular = rng.integers(0, 3, len(rows_o))
+        height = rng.integers(OBSTACLE_MIN_HEIGHTS[regular],
+                              OBSTACLE_MAX_HEIGHTS[regular] + 1)
+        flying_y = rng.integers(100, HEIGHT - 150 + 1, len(rows_o))
+        w = np.select([kind == DRONE, kind == LASER],
+                      [40, WIDTH], OBSTACLE_WIDTHS[regular])
+        h = np.select([kind == DRONE, kind == LASER], [40, 5], height)
+        y = np.where(kind == OBSTACLE, GROUND_Y - height, flying_y)
+        self.insert(self.obstacles, rows_o, kind, y, w, h,
+                    vx=rng.choice([-2, 2], len(rows_o)),
+                    vy=rng.choice([-2, 2], len(rows_o)),
+                    active=kind != LASER)
+
+        # Power-ups, a share of them deepfakes
+        rows_p = rows[is_powerup]
+        deepfake = rng.random(len(rows_p)) < self.deepfake_chance[rows_p]
+        choice = rng.integers(0, 5, len(rows_p))
+        kind = np.where(deepfake, DEEPFAKE, POWERUP_KINDS[choice])
+        size = np.where(deepfake, 30, POWERUP_SIZES[choice])
+        y = rng.integers(np.where(deepfake, HEIGHT - 300, POWERUP_MIN_Y[choice]),
+                         np.where(deepfake, HEIGHT - 100, POWERUP_MAX_Y[choice]) + 1)
+        float_speed = np.select(
+            [kind == DEEPFAKE, kind == FUEL, kind == DOUBLE],
+            [rng.uniform(0.03, 0.07, len(rows_p)),
+             rng.uniform(0.05, 0.1, len(rows_p)),
+             rng.uniform(0.01, 0.03, len(rows_p))], 0)
+        self.insert(self.powerups, rows_p, kind, y, size, size,
+                    base_y=y, float_speed=float_speed, active=True,
+                    amount=rng.integers(20, 35 + 1, len(rows_p)))
+
+    def rightmost(self, e):
+        return np.where(e.valid, e.x + e.w, 0).max(axis=1)
+
+    def insert(self, e, rows, kind, y, w, h, **values):
+        """New entities at the right edge, in the first free slot of each row.
+        Rows with no free slot drop their spawn"""
+        slot = np.argmin(e.valid[rows], axis=1)
+        free = ~e.valid[rows, slot]
+        rows, slot = rows[free], slot[free]
+        for name in FIELDS:
+            getattr(e, name)[rows, slot] = 0
+        e.valid[rows, slot] = True
+        e.kind[rows, slot] = kind[free]
+        e.x[rows, slot] = WIDTH
+        e.y[rows, slot] = y[free]
+        e.w[rows, slot] = np.broadcast_to(w, free.shape)[free]
+        e.h[rows, slot] = np.broadcast_to(h, free.shape)[free]
+        for name, value in values.items():
+            getattr(e, name)[rows, slot] = np.broadcast_to(value, free.shape)[free]
+
+    def update(self, alive, space_held):
+        start_y = self.y.copy()
+        self.update_player(space_held)
+        moved_y = self.y - start_y
+
+        # Obstacles, +5 for each one passed
+        obstacles = self.obstacles
+        player_center = (PLAYER_X + PLAYER_WIDTH // 2,
+                         (self.y + PLAYER_HEIGHT // 2)[:, None])
+        advance(obstacles, self.game_speed[:, None], player_center, HEIGHT)
+        passed = obstacles.valid & (obstacles.x + obstacles.w < 0)
+        obstacles.valid &= ~passed
+        self.score += 5 * (passed.sum(axis=1) * alive)
+
+        # Collision with the player hitbox, swept over the frame, ends the
+        # run on the spot
+        vulnerable = ~self.shield_active & ~self.invincible
+        hit = alive & vulnerable & self.sweeping(
+            obstacles, PLAYER_X + 5, self.y + 5,
+            PLAYER_WIDTH - 10, PLAYER_HEIGHT - 10, moved_y).any(axis=1)
+        self.alive &= ~hit
+        alive = alive & ~hit
+
+        # Power-ups
+        powerups = self.powerups
+        advance(powerups, self.game_speed[:, None], player_center, HEIGHT)
+        powerups.valid &= powerups.x + powerups.w >= 0
+
+        # Revealed deepfakes are hazards, swept like obstacles; pickups
+        # only count where they end up
+        kind = powerups.kind
+        hazard = (kind == DEEPFAKE) & powerups.revealed
+        picked = np.where(
+            hazard,
+            self.sweeping(powerups, PLAYER_X, self.y, PLAYER_WIDTH, PLAYER_HEIGHT, moved_y),
+            self.overlapping(powerups, PLAYER_X, self.y, PLAYER_WIDTH, PLAYER_HEIGHT))
+        picked &= alive[:, None]
+        powerups.valid &= ~picked
+
+        # A revealed deepfake ends the run once this frame is done
+        caught = vulnerable & (picked & hazard).any(axis=1)
+
+        fuel = np.where(picked & (kind == FUEL), powerups.amount, 0).sum(axis=1)
+        self.jetpack_fuel = np.minimum(100, self.jetpack_fuel + fuel)
+
+        got = (picked & (kind == SHIELD)).any(axis=1)
+        self.shield_active |= got
+        self.shield_timer[got] = 4 * 60
+
+        # Each clock picked up halves the speed again
+        clocks = (picked & (kind == CLOCK)).sum(axis=1)
+        for k in range(clocks.max(initial=0)):
+            slowed = clocks > k
+            self.game_speed[slowed] = np.maximum(2, self.game_speed[slowed] / 2)
+            self.slow_timer[slowed] = 5 * 60
+
+        got = (picked & (kind == MAGNET)).any(axis=1)
+        self.magnet_active |= got
+        self.magnet_timer[got] = 10 * 60
+
+        got = (picked & (kind == DOUBLE)).any(axis=1)
+        self.double_points_active |= got
+        self.double_points_timer[got] = 10 * 60
+
+        # Timers
+        ticking = alive & self.shield_active
+        self.shield_timer -= ticking
+        self.shield_active &= ~(ticking & (self.shield_timer <= 0))
+
+        ticking = alive & (self.slow_timer > 0)
+        self.slow_timer -= ticking
+        done = ticking & (self.slow_timer <= 0)
+        self.game_speed[done] = self.base_game_speed[done]
+
+        ticking = alive & self.magnet_active
+        self.magnet_timer -= ticking
+        self.magnet_active &= ~(ticking & (self.magnet_timer <= 0))
+
+        ticking = alive & self.double_points_active
+        self.double_points_timer -= ticking
+        self.double_points_active &= ~(ticking & (self.double_points_timer <= 0))
+
+        # Magnet pulls power-ups within 50px towards the player
+        pulling = alive & self.magnet_active
+        if pulling.any():
+            near = self.overlapping(powerups, PLAYER_X - 50, self.y - 50,
+                                    PLAYER_WIDTH + 100, PLAYER_HEIGHT + 100)
+            near &= pulling[:, None]
+            powerups.x += np.where(near, np.where(powerups.x > PLAYER_X, -5, 5), 0)
+            powerups.y += np.where(near, np.where(powerups.y > self.y[:, None], -5, 5), 0)
+
+        # Distance, score and difficulty milestones
+        self.distance += np.where(alive, self.game_speed / 10, 0)
+        self.score += np.where(alive, 0.1, 0)
+        self.score += np.where(alive & self.double_points_active, 0.1, 0)
+        self.increase_difficulty(alive & (self.distance >= self.next_milestone))
+
+        self.alive &= ~caught
+
+    def update_player(self, space_held):
+        # Mirrors Player.update; dead runs keep moving but are never read
+        self.is_using_jetpack &= self.jetpack_fuel > 0
+
+        ticking = ~self.can_dash
+        self.dash_cooldown -= ticking
+        self.can_dash |= ticking & (self.dash_cooldown <= 0)
+
+        ticking = self.is_dashing
+        self.dash_duration -= ticking
+        self.is_dashing &= ~(ticking & (self.dash_duration <= 0))
+
+        ticking = self.invincible
+        self.invincible_timer -= ticking
+        self.invincible &= ~(ticking & (self.invincible_timer <= 0))
+
+        vy = self.velocity_y
+        flying = self.is_using_jetpack & (self.jetpack_fuel > 0)
+        self.jetpack_fuel -= np.where(flying, 15 / 60, 0)
+        thrust = flying & space_held
+        vy[thrust & (self.y + PLAYER_HEIGHT >= GROUND_Y)] = -5
+        vy[thrust] -= 0.4
+        vy[thrust] = np.maximum(vy[thrust], -10)
+        ceiling = thrust & (self.y <= 50)
+        self.y[ceiling] = 50
+        vy[ceiling] = 0
+        vy += np.where(flying & ~space_held, 0.8 * 0.3, 0)
+        vy += np.where(~flying, 0.8, 0)
+        np.minimum(vy, 15, out=vy)
+
+        self.y = round_rect_coord(self.y + vy)
+        landed = self.y + PLAYER_HEIGHT >= GROUND_Y
+        self.y[landed] = GROUND_Y - PLAYER_HEIGHT
+        vy[landed] = 0
+        self.is_jumping &= ~landed
+
+    def overlapping(self, e, x, y, w, h):
+        """Valid slots whose rect overlaps the per-run rect (x, y, w, h)"""
+        y = np.asarray(y, float)[..., None] if np.ndim(y) else y
+        return e.valid & (e.x < x + w) & (e.x + e.w > x) & \
+            (e.y < y + h) & (e.y + e.h > y)
+
+    def sweeping(self, e, x, y, w, h, moved_y):
+        """Valid slots whose rect overlapped the per-run rect (x, y, w, h)
+        at some point of the frame, that rect having moved down by moved_y
+        and each entity by its moved_x, moved_y (see collision.sweep). The
+        rect must not move sideways"""
+        # Only entities whose path crosses the rect's columns can hit it
+        start_x = e.x - e.moved_x
+        near = e.valid & (np.minimum(e.x, start_x) < x + w) & \
+            (np.maximum(e.x, start_x) + e.w > x)
+        rows, slots = np.nonzero(near)
+        if not len(rows):
+            return near
+        y = np.asarray(y, float)[rows]
+        start = np.zeros(len(rows))
+        end = np.ones(len(rows))
+        for now, velocity, low, high in (
+                (e.x[rows, slots] - x, e.moved_x[rows, slots], -e.w[rows, slots], w),
+                (e.y[rows, slots] - y, e.moved_y[rows, slots] - moved_y[rows],
+                 -e.h[rows, slots], h)):
+            # Entity offset from the rect at the start of the frame; they
+            # overlap while low < offset < high
+            offset = now - velocity
+            still = velocity == 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                enter = (low - offset) / velocity
+                leave = (high - offset) / velocity
+            inside = (low < offset) & (offset < high)
+            np.maximum(start, np.where(still, np.where(inside, -np.inf, np.inf),
+                                       np.minimum(enter, leave)), out=start)
+            np.minimum(end, np.where(still, np.inf, np.maximum(enter, leave)), out=end)
+        near[rows, slots] = start < end
+        return near
+
+    def increase_difficulty(self, rows):
+        if not rows.any():
+            return
+        self.difficulty_level[rows] += 1
+        self.next_milestone[rows] += self.milestone_step[rows] * self.difficulty_level[rows]
+
+        faster = rows & (self.base_game_speed < self.max_game_speed)
+        self.base_game_speed[faster] += self.speed_step[faster]
+        self.game_speed[faster] = self.base_game_speed[faster]
+
+        self.obstacle_chance[rows] = np.minimum(
+            self.max_obstacle_chance, self.obstacle_chance + self.obstacle_chance_step)[rows]
+        self.deepfake_chance[rows] = np.minimum(
+            self.max_deepfake_chance, self.deepfake_chance + self.deepfake_chance_step)[rows]
+        self.obstacle_gap[rows] = np.maximum(
+            self.min_obstacle_gap, self.obstacle_gap - self.obstacle_gap_step)[rows]
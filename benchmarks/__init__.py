@@ -0,0 +1,12 @@
+"""Performance benchmarks: seeded stress scenarios played through both
+update and draw on a dummy SDL display.
+
+    python -m benchmarks                       # all scenarios
+    python -m benchmarks entities_500 --frames 300
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --baseline baseline.json --threshold 0.15
+
+Each scenario reports frames per second and the mean microseconds of the
+profiler phases; with --baseline, fps drops or phase slowdowns beyond the
+threshold are listed and the exit status is 1.
+"""
@@ -0,0 +1,82 @@
+import argparse
+import os
+import sys
+
+# Benchmarks always render off-screen and without sound
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from benchmarks.runner import compare, load_baseline, run_scenario, save_baseline  # noqa: E402
+from benchmarks.scenarios import SCENARIOS  # noqa: E402
+from quality import QUALITY_TIERS, QualityGovernor  # noqa: E402
+
+REPORTED_PHASES = ("update", "spawn", "draw", "flip")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Seeded game benchmarks")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help="scenarios to run (default: all): "
+                             + ", ".join(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=600,
+                        help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=60,
+                        help="frames run before measuring")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vectorized", action="store_true",
+                        help="benchmark the NumPy entity stores")
+    parser.add_argument("--dirty", action="store_true",
+                        help="benchmark dirty-rectangle rendering")
+    parser.add_argument("--quality", default="high",
+                        choices=[tier["name"] for tier in QUALITY_TIERS],
+                        help="fixed rendering quality tier")
+    parser.add_argument("--baseline", metavar="PATH", default=None,
+                        help="compare against this baseline; exits with "
+                             "status 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown against the baseline (fraction)")
+    parser.add_argument("--save", metavar="PATH", default=None,
+                        help="write the results as a new baseline")
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}")
+    return args
+
+
+def main():
+    args = parse_args()
+    names = args.scenarios or list(SCENARIOS)
+
+    print(f"{'scenario':<22}{'fps':>8}" + "".join(
+        f"{phase + ' us':>12}" for phase in REPORTED_PHASES))
+    tier = [tier["name"] for tier in QUALITY_TIERS].index(args.quality)
+    results = {}
+    for name in names:
+        # Quiet, as Game prints a line on every crash, which would break up the table
+        report = run_scenario(name, args.frames, args.warmup, args.seed,
+                              vectorized=args.vectorized,
+                              dirty_rendering=args.dirty,
+                              quality=QualityGovernor(tier=tier, adaptive=False),
+                              quiet=True)
+        results[name] = report
+        print(f"{name:<22}{report['fps']:>8.0f}" + "".join(
+            f"{report['phases'][phase]['mean_us']:>12.0f}"
+            for phase in REPORTED_PHASES), flush=True)
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"Baseline written to {args.save}")
+    if args.baseline:
+        regressions = compare(results, load_baseline(args.baseline), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import json
+import random
+import time
+
+from controls import NO_INPUT
+from game import Game
+from profiler import PHASES, FrameProfiler
+
+from benchmarks.scenarios import SCENARIOS
+
+# Phase means below this many microseconds are too small to compare reliably
+NOISE_FLOOR_US = 20
+
+
+def run_scenario(name, frames=600, warmup=60, seed=0, **game_options):
+    """Play a scenario with drawing and return its report: fps plus mean and
+    p95 microseconds per profiler phase, over `frames` after `warmup`"""
+    setup, difficulty = SCENARIOS[name]
+    game = Game(seed=seed, difficulty=difficulty, **game_options)
+    hook = setup(game, random.Random(seed))
+
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            game.profiler = FrameProfiler(window=frames)
+        frame_start = time.perf_counter()
+        if hook:
+            hook(game)
+        game.step(NO_INPUT)
+        game.timed("draw", game.draw)
+        game.timed("flip", game.present)
+        if game.profiler:
+            game.profiler.end_frame(frame_start)
+
+    summary = game.profiler.summary()
+    frame_ms = summary["frame"]["mean_ms"]
+    return {
+        "fps": round(1000 / frame_ms, 1) if frame_ms else 0.0,
+        "entities": len(game.obstacles) + len(game.powerups),
+        "phases": {phase: {"mean_us": round(summary[phase]["mean_ms"] * 1000, 1),
+                           "p95_us": round(summary[phase]["p95_ms"] * 1000, 1)}
+                   for phase in PHASES},
+    }
+
+
+def compare(results, baseline, threshold):
+    """Regressions of `results` against `baseline`, as readable lines. A
+    scenario regresses when its fps drops, or a phase's mean time grows,
+    by more than `threshold` (a fraction)"""
+    regressions = []
+    for name, report in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if report["fps"] < base["fps"] * (1 - threshold):
+            regressions.append(f"{name}: {report['fps']:.0f} fps, "
+                               f"baseline {base['fps']:.0f}")
+        for phase, stats in report["phases"].items():
+            base_us = base["phases"].get(phase, {}).get("mean_us")
+            if base_us is None or max(stats["mean_us"], base_us) < NOISE_FLOOR_US:
+                continue
+            if stats["mean_us"] > base_us * (1 + threshold):
+                regressions.append(f"{name}: {phase} {stats['mean_us']:.0f} us, "
+                                   f"baseline {base_us:.0f} us")
+    return regressions
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
@@ -0,0 +1,141 @@
+"""Seeded stress scenarios.
+
+A scenario is a setup(game, rng) function that puts a freshly built Game
+into the state to measure and returns a hook called before every frame
+(or None). Entities are added through Game.spawn and appended to the
+entity lists, so they go through the same pools and, with --vectorized,
+the same entity stores as spawned ones. Scenarios that would otherwise
+end in a crash keep the shield up.
+"""
+from game_objects import (
+    DeepfakePowerUp,
+    DoublePointsPowerUp,
+    FlyingDrone,
+    InvestmentBonus,
+    JetpackFuel,
+    LaserBeam,
+    MagnetPowerUp,
+    Obstacle,
+    ShieldPowerUp,
+    TimeSlowPowerUp,
+)
+
+FOREVER = 10**9
+
+# Spawn as much as the game allows: no gap between objects and every
+# spawn roll an obstacle or power-up
+DENSE = {
+    "base_game_speed": 12,
+    "obstacle_chance": 0.8,
+    "max_obstacle_chance": 0.8,
+    "obstacle_gap": 0,
+    "min_obstacle_gap": 0,
+}
+
+
+def protect(game):
+    game.shield_active = True
+    game.shield_timer = FOREVER
+
+
+def spawn_random(game, rng, x):
+    """One entity of a random kind at x, like spawn_objects would make it"""
+    height = game.HEIGHT
+    kind = rng.randrange(10)
+    y = rng.randint(height - 300, height - 100)
+    if kind == 0:
+        game.obstacles.append(game.spawn(Obstacle, x, height - 50, rng))
+    elif kind == 1:
+        game.obstacles.append(game.spawn(FlyingDrone, x, y, height, rng))
+    elif kind == 2:
+        game.obstacles.append(game.spawn(LaserBeam, x, y, game.WIDTH))
+    elif kind == 3:
+        game.powerups.append(game.spawn(DeepfakePowerUp, x, y, rng))
+    elif kind == 4:
+        game.powerups.append(game.spawn(JetpackFuel, x, y, rng))
+    elif kind == 5:
+        game.powerups.append(game.spawn(InvestmentBonus, x, y, rng))
+    elif kind == 6:
+        game.powerups.append(game.spawn(ShieldPowerUp, x, y))
+    elif kind == 7:
+        game.powerups.append(game.spawn(MagnetPowerUp, x, y))
+    elif kind == 8:
+        game.powerups.append(game.spawn(DoublePointsPowerUp, x, y, rng))
+    else:
+        game.powerups.append(game.spawn(TimeSlowPowerUp, x, y))
+
+
+def empty_track(game, rng):
+    """Nothing but the player, the background and decorations"""
+    game.spawn_timer = -FOREVER
+
+
+def max_spawn_density(game, rng):
+    """Spawn rolls every frame, limited only by the DENSE settings"""
+    protect(game)
+
+    def spawn_now(game):
+        game.spawn_timer = FOREVER
+    return spawn_now
+
+
+def entities_500(game, rng):
+    """500 entities on screen at all times, refilled at the right edge"""
+    protect(game)
+    game.spawn_timer = -FOREVER
+    for _ in range(500):
+        spawn_random(game, rng, rng.randint(0, game.WIDTH + 200))
+
+    def refill(game):
+        for _ in range(500 - len(game.obstacles) - len(game.powerups)):
+            spawn_random(game, rng, rng.randint(game.WIDTH, game.WIDTH + 200))
+    return refill
+
+
+def magnet_pickups(game, rng):
+    """Magnet on with 150 pickups in range being pulled in and collected"""
+    protect(game)
+    game.magnet_active = True
+    game.magnet_timer = FOREVER
+    game.spawn_timer = -FOREVER
+
+    def refill(game):
+        for _ in range(150 - len(game.powerups)):
+            x = rng.randint(game.player.rect.x, game.WIDTH)
+            y = rng.randint(game.HEIGHT - 300, game.HEIGHT - 100)
+            cls = rng.choice((JetpackFuel, InvestmentBonus))
+            game.powerups.append(game.spawn(cls, x, y, rng))
+    refill(game)
+    return refill
+
+
+def deepfakes_glitching(game, rng):
+    """A stream of deepfakes spawning close enough to start glitching"""
+    protect(game)
+    game.spawn_timer = -FOREVER
+
+    def refill(game):
+        for _ in range(12 - len(game.powerups)):
+            x = rng.randint(game.player.rect.right + 100, game.player.rect.right + 280)
+            y = rng.randint(game.HEIGHT - 300, game.HEIGHT - 100)
+            game.powerups.append(game.spawn(DeepfakePowerUp, x, y, rng))
+    refill(game)
+    return refill
+
+
+def game_over_idle(game, rng):
+    """The game over screen waiting for a restart"""
+    for _ in range(6):
+        spawn_random(game, rng, rng.randint(300, game.WIDTH))
+    game.game_over = True
+
+
+# name -> (setup, Game difficulty overrides)
+SCENARIOS = {
+    "empty_track": (empty_track, None),
+    "max_spawn_density": (max_spawn_density, DENSE),
+    "entities_500": (entities_500, None),
+    "magnet_pickups": (magnet_pickups, None),
+    "deepfakes_glitching": (deepfakes_glitching, None),
+    "game_over_idle": (game_over_idle, None),
+}
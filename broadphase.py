@@ -0,0 +1,60 @@
+from bisect import bisect_left
+from operator import attrgetter
+
+_left = attrgetter("rect.left")
+
+
+class SweepAndPrune:
+    """Broadphase over entity rects, sorted along the scroll (x) axis.
+
+    Entities spawn at the right edge in order and scroll left together, so
+    the lists handed to rebuild() are already nearly sorted and the sort is
+    close to linear. Queries bisect on left edges and only test entities in
+    the matching x window. Entities wider than `wide_width` (laser beams
+    span the whole screen) would widen every window, so they are kept apart
+    and always tested.
+    """
+
+    def __init__(self, wide_width=200):
+        self.wide_width = wide_width
+        self.entities = []
+        self.lefts = []
+        self.wide = []
+        self.max_width = 0
+
+    def rebuild(self, entities):
+        self.entities = []
+        self.wide = []
+        for entity in entities:
+            if entity.rect.width > self.wide_width:
+                self.wide.append(entity)
+            else:
+                self.entities.append(entity)
+        self.entities.sort(key=_left)
+        self.lefts = [entity.rect.left for entity in self.entities]
+        self.max_width = max(
+            (entity.rect.width for entity in self.entities), default=0)
+
+    def colliding(self, rect):
+        """Entities whose rect overlaps `rect`"""
+        lo = bisect_left(self.lefts, rect.left - self.max_width + 1)
+        hi = bisect_left(self.lefts, rect.right)
+        hits = [entity for entity in self.entities[lo:hi]
+                if rect.colliderect(entity.rect)]
+        hits.extend(entity for entity in self.wide
+                    if rect.colliderect(entity.rect))
+        return hits
+
+    def within(self, rect, radius):
+        """Entities overlapping `rect` grown by `radius` on every side"""
+        return self.colliding(rect.inflate(2 * radius, 2 * radius))
+
+    def remove(self, entity):
+        if entity in self.wide:
+            self.wide.remove(entity)
+            return
+        i = bisect_left(self.lefts, entity.rect.left)
+        while self.entities[i] is not entity:
+            i += 1
+        del self.entities[i]
+        del self.lefts[i]
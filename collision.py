@@ -0,0 +1,94 @@
+import math
+
+import pygame
+
+# Longest step, in pixels of relative motion, between two mask tests along
+# a sweep; under the thinnest hazard (5px laser beams)
+SWEEP_STEP = 2
+
+
+def swept_bounds(rect, moved):
+    """Rect covering `rect` over the last frame, given where it is now and
+    how far it moved"""
+    return rect.union(rect.move(-moved[0], -moved[1]))
+
+
+def sweep(a, a_moved, b, b_moved):
+    """Part of the last frame during which rects a and b overlapped, as
+    (start, end) fractions of the frame, or None if they never did.
+
+    Both rects are given where they are now, after moving in a straight
+    line by a_moved and b_moved. Like Rect.colliderect, touching edges do
+    not count.
+    """
+    start, end = 0.0, 1.0
+    for axis in (0, 1):
+        # b's offset from a at the start of the frame and its relative motion
+        velocity = b_moved[axis] - a_moved[axis]
+        offset = b[axis] - a[axis] - velocity
+        low, high = -b[axis + 2], a[axis + 2]  # overlap while low < offset < high
+        if velocity == 0:
+            if not low < offset < high:
+                return None
+            continue
+        enter = (low - offset) / velocity
+        leave = (high - offset) / velocity
+        if enter > leave:
+            enter, leave = leave, enter
+        start = max(start, enter)
+        end = min(end, leave)
+        if start >= end:
+            return None
+    return start, end
+
+
+class MaskCache:
+    """Collision masks for sprite surfaces, built on first use.
+
+    Entities collide with the sprite they are drawn with, and those
+    surfaces are already shared per visual state (SPRITES keys, ASSETS
+    images, Player.load_sprites), so keying masks by surface builds one
+    mask per sprite and animation state. Masks are only needed once two
+    rects overlap; the common no-contact case never builds or tests one.
+    """
+
+    def __init__(self):
+        self._masks = {}
+
+    def get(self, surface):
+        mask = self._masks.get(surface)
+        if mask is None:
+            mask = self._masks[surface] = pygame.mask.from_surface(surface)
+        return mask
+
+    def overlap(self, a, b):
+        """Whether two (surface, position) hit sprites share an opaque pixel"""
+        (surface_a, (ax, ay)), (surface_b, (bx, by)) = a, b
+        return self.get(surface_a).overlap(
+            self.get(surface_b), (bx - ax, by - ay)) is not None
+
+    def swept_overlap(self, a, a_moved, b, b_moved, span=(0.0, 1.0)):
+        """Whether hit sprites a and b, given where they are now after
+        moving by a_moved and b_moved, shared an opaque pixel at some point
+        of `span` of the last frame (see sweep). The masks are tested every
+        SWEEP_STEP pixels of relative motion"""
+        (surface_a, (ax, ay)), (surface_b, (bx, by)) = a, b
+        mask_a, mask_b = self.get(surface_a), self.get(surface_b)
+        vx = b_moved[0] - a_moved[0]
+        vy = b_moved[1] - a_moved[1]
+        start, end = span
+        steps = math.ceil(max(abs(vx), abs(vy)) * (end - start) / SWEEP_STEP)
+        for step in range(steps + 1):
+            t = end - (end - start) * step / steps if steps else end
+            # b's offset from a at time t, latest first
+            offset = (round(bx - ax - vx * (1 - t)), round(by - ay - vy * (1 - t)))
+            if mask_a.overlap(mask_b, offset) is not None:
+                return True
+        return False
+
+    def __len__(self):
+        return len(self._masks)
+
+
+# Shared by the game and its entities
+MASKS = MaskCache()
@@ -0,0 +1,29 @@
+import os
+import random
+
+import pytest
+
+# Tests render off-screen and without sound
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from controls import FrameInput  # noqa: E402
+
+
+@pytest.fixture
+def script():
+    """Seeded random play for Game.step: jumps, jetpack bursts, dashes,
+    drops and restarts after a game over"""
+    rng = random.Random(7)
+
+    def frame_input(frame):
+        roll = rng.random()
+        held = [pygame.K_SPACE] if roll < 0.3 else []
+        pressed = ([pygame.K_SPACE] if roll < 0.05 else [pygame.K_j] if roll < 0.06
+                   else [pygame.K_d] if roll < 0.07 else [pygame.K_r] if roll < 0.08
+                   else [])
+        return FrameInput(held, pressed)
+
+    return frame_input
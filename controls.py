@@ -0,0 +1,43 @@
+import pygame
+
+# Keys the game reacts to. Presses within one frame are dispatched in this order
+TRACKED_KEYS = (pygame.K_SPACE, pygame.K_j, pygame.K_d, pygame.K_r)
+
+
+class FrameInput:
+    """Keyboard input for one simulation frame.
+
+    `held` are the keys down at the end of the frame and `pressed` the keys
+    that went down during it. Live play, headless scripts and replays all
+    feed the game through this same snapshot.
+    """
+
+    def __init__(self, held=(), pressed=()):
+        self.held = frozenset(held)
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        # Lets a FrameInput stand in for pygame.key.get_pressed()
+        return key in self.held
+
+    def key_events(self):
+        return [pygame.event.Event(pygame.KEYDOWN, key=key)
+                for key in TRACKED_KEYS if key in self.pressed]
+
+
+NO_INPUT = FrameInput()
+
+
+def poll_input():
+    """Read the pygame event queue. Returns (FrameInput, quit_requested)"""
+    pressed = []
+    quit_requested = False
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            quit_requested = True
+        elif event.type == pygame.KEYDOWN and event.key in TRACKED_KEYS:
+            pressed.append(event.key)
+
+    keys = pygame.key.get_pressed()
+    held = [key for key in TRACKED_KEYS if keys[key]]
+    return FrameInput(held, pressed), quit_requested
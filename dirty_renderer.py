@@ -0,0 +1,86 @@
+import pygame
+
+
+class DirtyRenderer:
+    """Tracks changed screen regions and pushes only those to the display.
+
+    Works like pygame.sprite.LayeredDirty over a static background. Each
+    frame the owner passes the bounds of everything that moves (last frame's
+    bounds are remembered) plus its HUD items; begin() restores the
+    background under all of that, and under any HUD item that changed or is
+    touched by a dirty region. The owner then redraws the moving elements,
+    draw_hud() redraws the affected HUD items, and present() hands the dirty
+    rectangles to pygame.display.update.
+
+    HUD items are redrawn onto freshly restored background, never onto
+    themselves, so antialiased and translucent surfaces stay correct.
+    """
+
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.background = background
+
+        self.previous = []  # moving-element bounds drawn last frame
+        self.hud = {}       # slot -> (surface, rect) currently on screen
+        self.redraw = set()
+        self.dirty = []
+
+        self.force_full = True
+        self.state = None  # owner-defined; a change forces a full redraw
+
+    def begin(self, world_rects, hud_items):
+        """Restore the background wherever this frame will draw"""
+        if self.force_full:
+            self.force_full = False
+            dirty = [self.screen_rect.copy()]
+            self.hud = {}
+        else:
+            dirty = self.previous + [rect.clip(self.screen_rect)
+                                     for rect in world_rects]
+            visible = {slot: (surface, pygame.Rect(position, surface.get_size()))
+                       for slot, surface, position in hud_items}
+            for slot, (surface, rect) in list(self.hud.items()):
+                if visible.get(slot) != (surface, rect):
+                    dirty.append(rect)
+                    del self.hud[slot]
+
+        # Any HUD item touching a dirty region is redrawn whole, which can
+        # in turn dirty the items beneath it
+        self.redraw = set()
+        changed = True
+        while changed:
+            changed = False
+            for slot, surface, position in hud_items:
+                if slot in self.redraw:
+                    continue
+                rect = pygame.Rect(position, surface.get_size())
+                if slot not in self.hud or rect.collidelist(dirty) != -1:
+                    self.redraw.add(slot)
+                    dirty.append(rect)
+                    changed = True
+
+        # Things that did not move leave the same rect twice
+        dirty = list({tuple(rect): rect for rect in dirty}.values())
+        for rect in dirty:
+            self.screen.blit(self.background, rect, rect)
+        self.dirty = dirty
+        self.previous = [rect.clip(self.screen_rect) for rect in world_rects]
+
+    def mark(self, rect):
+        """Record an opaque element drawn on top of everything this frame"""
+        rect = rect.clip(self.screen_rect)
+        if rect.width and rect.height:
+            self.previous.append(rect)
+            self.dirty.append(rect)
+
+    def draw_hud(self, hud_items):
+        for slot, surface, position in hud_items:
+            if slot in self.redraw:
+                self.screen.blit(surface, position)
+                self.hud[slot] = (surface, pygame.Rect(position, surface.get_size()))
+
+    def present(self):
+        if self.dirty:
+            pygame.display.update(self.dirty)
+            self.dirty = []
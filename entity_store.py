@@ -0,0 +1,313 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from game_objects import (
+    FRAME_MS,
+    DeepfakePowerUp,
+    DoublePointsPowerUp,
+    FlyingDrone,
+    InvestmentBonus,
+    JetpackFuel,
+    LaserBeam,
+    MagnetPowerUp,
+    Obstacle,
+    ShieldPowerUp,
+    TimeSlowPowerUp,
+)
+
+# Entity kinds
+OBSTACLE, DRONE, LASER, DEEPFAKE, FUEL, BONUS, SHIELD, MAGNET, DOUBLE, CLOCK = range(10)
+KINDS = {
+    Obstacle: OBSTACLE,
+    FlyingDrone: DRONE,
+    LaserBeam: LASER,
+    DeepfakePowerUp: DEEPFAKE,
+    JetpackFuel: FUEL,
+    InvestmentBonus: BONUS,
+    ShieldPowerUp: SHIELD,
+    MagnetPowerUp: MAGNET,
+    DoublePointsPowerUp: DOUBLE,
+    TimeSlowPowerUp: CLOCK,
+}
+
+# Kinds sharing a behaviour, as lookup tables indexed by kind
+FLOATING = np.zeros(len(KINDS), bool)
+FLOATING[[DEEPFAKE, FUEL, BONUS, DOUBLE]] = True
+FLOAT_AMPLITUDE = np.zeros(len(KINDS))
+FLOAT_AMPLITUDE[[DEEPFAKE, FUEL, DOUBLE]] = 8
+FLOAT_AMPLITUDE[BONUS] = 10
+ROTATING = np.zeros(len(KINDS), bool)
+ROTATING[[DEEPFAKE, BONUS, DOUBLE, CLOCK]] = True
+SCROLL = np.ones(len(KINDS))
+SCROLL[DOUBLE] = 0.5  # double points coins drift at half speed
+
+FLOAT_FIELDS = ("x", "y", "w", "h", "base_y", "float_speed", "angle",
+                "rotation_speed", "anim", "pulse", "pulse_dir", "vx", "vy",
+                "timer", "intensity", "moved_x", "moved_y")
+INT_FIELDS = ("kind", "age")
+BOOL_FIELDS = ("active", "transforming", "revealed")
+FIELDS = FLOAT_FIELDS + INT_FIELDS + BOOL_FIELDS
+
+
+def field_arrays(shape):
+    """Zeroed array per name in FIELDS, as a namespace"""
+    return SimpleNamespace(**{name: np.zeros(shape, field_dtype(name)) for name in FIELDS})
+
+
+def field_dtype(name):
+    if name in FLOAT_FIELDS:
+        return float
+    return np.int64 if name in INT_FIELDS else bool
+
+
+def round_rect_coord(values):
+    # pygame.Rect rounds float coordinates half away from zero
+    return np.trunc(values + np.copysign(0.5, values))
+
+
+def overlap_mask(x, y, w, h, rect):
+    # Same test as pygame.Rect.colliderect, empty rects never collide
+    return ((x < rect.right) & (x + w > rect.left) &
+            (y < rect.bottom) & (y + h > rect.top) &
+            (w > 0) & (h > 0) & (rect.width > 0) & (rect.height > 0))
+
+
+def advance(e, speed, player_center, game_height):
+    """Advance entity arrays one frame, mirroring the entities' update() methods.
+
+    `e` holds one array per name in FIELDS, all of the same shape: (n,) for
+    an EntityStore, (runs, slots) for batch_sim. `speed` and the player
+    centre are scalars or broadcast per row. Arrays are updated in place.
+    """
+    kind = e.kind
+    x, y, w, h = e.x, e.y, e.w, e.h
+    start_x, start_y = x.copy(), y.copy()
+
+    # Lasers charge in place for a second before sweeping left
+    charging = (kind == LASER) & ~e.active
+    e.timer[charging] += 1
+    e.active[charging & (e.timer >= 60)] = True
+
+    # Scrolling
+    moving = ~charging
+    x[moving] = round_rect_coord(x - speed * SCROLL[kind])[moving]
+
+    # Drones wander and bounce between the sky limit and the ground
+    drone = kind == DRONE
+    if drone.any():
+        vy = e.vy
+        x[drone] += e.vx[drone]
+        y[drone] += vy[drone]
+        top = drone & (y < 100)
+        y[top] = 100
+        vy[top] *= -1
+        floor = game_height - 50
+        bottom = drone & (y + h > floor)
+        y[bottom] = (floor - h)[bottom]
+        vy[bottom] *= -1
+
+    # Server lights
+    obstacle = kind == OBSTACLE
+    e.anim[obstacle] += 0.1
+    e.anim[obstacle & (e.anim >= 4)] = 0
+
+    # Floating pickups
+    floating = FLOATING[kind]
+    e.age[floating] += 1
+    offset = np.sin(e.age[floating] * FRAME_MS * e.float_speed[floating]) * \
+        FLOAT_AMPLITUDE[kind[floating]]
+    y[floating] = e.base_y[floating] + np.trunc(offset)
+
+    # Rotation
+    rotating = ROTATING[kind]
+    e.angle[rotating] += e.rotation_speed[rotating]
+    e.angle[rotating & (e.angle >= 360)] = 0
+
+    # Shield pulse
+    shield = kind == SHIELD
+    if shield.any():
+        e.pulse[shield] += 0.1 * e.pulse_dir[shield]
+        e.pulse_dir[shield & ((e.pulse >= 1) | (e.pulse <= 0))] *= -1
+
+    deepfake = kind == DEEPFAKE
+    if deepfake.any():
+        # Start glitching when the player gets close
+        player_cx, player_cy = player_center
+        dx = player_cx - (x + w // 2)
+        dy = player_cy - (y + h // 2)
+        near = np.sqrt(dx * dx + dy * dy) < 300
+        start = deepfake & ~e.transforming & ~e.revealed & near
+        e.transforming[start] = True
+        e.timer[start] = 45
+
+        # DeepfakePowerUp.update runs its glitch countdown twice per frame
+        for _ in range(2):
+            ticking = deepfake & e.transforming
+            e.timer[ticking] -= 1
+            e.intensity[ticking] = e.timer[ticking] / 45
+            done = ticking & (e.timer <= 0)
+            e.revealed[done] = True
+            e.transforming[done] = False
+
+    # How far each entity moved this frame, for swept collisions
+    np.subtract(x, start_x, out=e.moved_x)
+    np.subtract(y, start_y, out=e.moved_y)
+
+
+class EntityStore:
+    """Struct-of-arrays mirror of an entity list with vectorized motion.
+
+    `objects` is the game's own list (obstacles or power-ups), kept in step
+    with the arrays: entities appended to it are adopted on the next
+    step(), and removals compact both in the same order. The per-object
+    rects and animation attributes are only written back by sync(), which
+    the game calls before drawing.
+    """
+
+    def __init__(self, objects, game_height, capacity=64):
+        self.objects = objects
+        self.game_height = game_height
+        self.n = 0
+        self.capacity = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        old_n = self.n
+        for name in FIELDS:
+            array = np.zeros(capacity, field_dtype(name))
+            if self.capacity:
+                array[:old_n] = getattr(self, name)[:old_n]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def adopt(self):
+        """Load entities appended to `objects` since the last call"""
+        total = len(self.objects)
+        if total > self.capacity:
+            self._grow(max(total, self.capacity * 2))
+        for i in range(self.n, total):
+            self._load(i, self.objects[i])
+        self.n = total
+
+    def _load(self, i, obj):
+        kind = KINDS[type(obj)]
+        self.kind[i] = kind
+        self.x[i], self.y[i], self.w[i], self.h[i] = obj.rect
+        self.age[i] = getattr(obj, "age", 0)
+        self.base_y[i] = getattr(obj, "base_y", obj.rect.y)
+        self.float_speed[i] = getattr(obj, "float_speed", 0)
+        self.angle[i] = getattr(obj, "angle", 0)
+        self.rotation_speed[i] = getattr(obj, "rotation_speed", 0)
+        self.anim[i] = getattr(obj, "animation_frame", 0)
+        self.pulse[i] = getattr(obj, "pulse", 0)
+        self.pulse_dir[i] = getattr(obj, "pulse_direction", 0)
+        self.vx[i] = getattr(obj, "speed_x", 0)
+        self.vy[i] = getattr(obj, "speed_y", 0)
+        self.active[i] = getattr(obj, "active", True)
+        self.moved_x[i], self.moved_y[i] = getattr(obj, "moved", (0, 0))
+        if kind == DEEPFAKE:
+            self.timer[i] = obj.glitch_timer
+            self.intensity[i] = obj.glitch_intensity
+            self.transforming[i] = obj.is_transforming
+            self.revealed[i] = obj.display_type == obj.real_type
+        else:
+            self.timer[i] = getattr(obj, "timer", 0)
+            self.intensity[i] = 0
+            self.transforming[i] = False
+            self.revealed[i] = False
+
+    def step(self, speed, player_rect):
+        """Advance every entity one frame, mirroring their update() methods"""
+        self.adopt()
+        if self.n:
+            advance(self.view(), speed, player_rect.center, self.game_height)
+
+    def view(self):
+        """Namespace of the live part of every array"""
+        n = self.n
+        return SimpleNamespace(**{name: getattr(self, name)[:n] for name in FIELDS})
+
+    def glitch_started(self):
+        """Whether a deepfake began its glitch on its first countdown tick"""
+        n = self.n
+        return bool((self.transforming[:n] & (self.timer[:n] == 44)).any())
+
+    def rightmost(self):
+        n = self.n
+        return float((self.x[:n] + self.w[:n]).max()) if n else 0
+
+    def offscreen(self):
+        """Indices of entities that scrolled past the left edge"""
+        n = self.n
+        return np.flatnonzero(self.x[:n] + self.w[:n] < 0)
+
+    def overlapping(self, rect):
+        """Indices of entities whose rect overlaps `rect`"""
+        n = self.n
+        return np.flatnonzero(overlap_mask(
+            self.x[:n], self.y[:n], self.w[:n], self.h[:n], rect))
+
+    def attract(self, rect, radius, pull):
+        """Move entities near `rect` by `pull` pixels towards its corner"""
+        n = self.n
+        zone = rect.inflate(2 * radius, 2 * radius)
+        near = overlap_mask(self.x[:n], self.y[:n], self.w[:n], self.h[:n], zone)
+        if near.any():
+            x, y = self.x[:n], self.y[:n]
+            x[near] += np.where(x[near] > rect.x, -pull, pull)
+            y[near] += np.where(y[near] > rect.y, -pull, pull)
+
+    def remove(self, indices):
+        """Drop entities by index, keeping the order of the rest.
+        Returns the removed objects"""
+        if not len(indices):
+            return []
+        n = self.n
+        keep = np.ones(n, bool)
+        keep[indices] = False
+        removed = [self.objects[i] for i in indices]
+        for name in FIELDS:
+            array = getattr(self, name)
+            remaining = array[:n][keep]
+            array[:len(remaining)] = remaining
+        self.objects[:] = [obj for obj, k in zip(self.objects, keep) if k]
+        self.n = len(self.objects)
+        return removed
+
+    def clear(self):
+        self.n = 0
+
+    def sync_one(self, i):
+        """Write array state back onto object i"""
+        obj = self.objects[i]
+        obj.rect.x = int(self.x[i])
+        obj.rect.y = int(self.y[i])
+        obj.moved = (int(self.moved_x[i]), int(self.moved_y[i]))
+        kind = self.kind[i]
+        if kind == OBSTACLE:
+            obj.animation_frame = self.anim[i]
+        elif kind == DRONE:
+            obj.speed_y = int(self.vy[i])
+        elif kind == LASER:
+            obj.active = bool(self.active[i])
+            obj.timer = int(self.timer[i])
+        elif kind == SHIELD:
+            obj.pulse = self.pulse[i]
+            obj.pulse_direction = int(self.pulse_dir[i])
+        if ROTATING[kind]:
+            obj.angle = self.angle[i]
+        if FLOATING[kind]:
+            obj.age = int(self.age[i])
+            obj.float_offset = obj.rect.y - obj.base_y
+        if kind == DEEPFAKE:
+            obj.glitch_timer = int(self.timer[i])
+            obj.glitch_intensity = self.intensity[i]
+            obj.is_transforming = bool(self.transforming[i])
+            obj.display_type = obj.real_type if self.revealed[i] else "bonus"
+        return obj
+
+    def sync(self):
+        """Write array state back onto every object, for drawing"""
+        for i in range(self.n):
+            self.sync_one(i)
@@ -0,0 +1,157 @@
+"""Frame export without image encoding.
+
+FrameExporter takes the screen as a NumPy view (pygame.surfarray.pixels3d),
+optionally downsamples it (every Nth pixel, which is still a view) and
+converts it to grayscale, and writes it into a ring of slots in a
+multiprocessing.shared_memory block. FrameReader, in any process, attaches
+to the block by name and hands out the newest frame as an array backed by
+the shared memory itself.
+
+Block layout: a header of int64s followed by `slots` frames of uint8
+
+    magic | slots | height | width | channels | frames written
+    then per slot: number of the frame in it (-1 while being written)
+
+The writer never waits for readers. A reader that holds on to a slot while
+the ring wraps around sees it overwritten; check still_valid(frame) after
+using a frame when that matters.
+"""
+import contextlib
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pygame
+
+MAGIC = 0x45524D46  # "FMRE"
+HEADER_FIELDS = 6
+GRAY_WEIGHTS = (77, 150, 29)  # ITU-R 601 luma in 1/256ths
+
+# Blocks exported from this process, which readers here must not untrack
+_exported = set()
+
+
+@contextlib.contextmanager
+def screen_view(surface):
+    """(height, width, 3) uint8 view of the surface's pixels. The surface
+    stays locked (cannot be blitted or flipped) until the block exits"""
+    pixels = pygame.surfarray.pixels3d(surface)
+    try:
+        yield pixels.transpose(1, 0, 2)
+    finally:
+        del pixels
+
+
+def frame_shape(size, downsample=1, grayscale=False):
+    width, height = size
+    height = -(-height // downsample)
+    width = -(-width // downsample)
+    return (height, width) if grayscale else (height, width, 3)
+
+
+def convert(view, out, downsample=1, grayscale=False):
+    """Write a (height, width, 3) view into `out`, shaped by frame_shape"""
+    if downsample > 1:
+        view = view[::downsample, ::downsample]
+    if not grayscale:
+        # One channel at a time is ~5x faster than copying the strided
+        # (width-major, 4 bytes per pixel) view in one go
+        for channel in range(3):
+            out[..., channel] = view[..., channel]
+        return out
+    r, g, b = GRAY_WEIGHTS
+    # Widened first: uint8 times a small scalar stays uint8 (and wraps)
+    # under NumPy 1.x casting rules
+    luma = view[..., 0].astype(np.uint16) * r
+    luma += view[..., 1].astype(np.uint16) * g
+    luma += view[..., 2].astype(np.uint16) * b
+    luma >>= 8
+    out[...] = luma
+    return out
+
+
+class FrameExporter:
+    def __init__(self, size, downsample=1, grayscale=False, slots=4, name=None):
+        self.downsample = downsample
+        self.grayscale = grayscale
+        self.shape = frame_shape(size, downsample, grayscale)
+        self.slots = slots
+        frame_bytes = int(np.prod(self.shape))
+        header_bytes = (HEADER_FIELDS + slots) * 8
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=True, size=header_bytes + slots * frame_bytes)
+        self.name = self.shm.name
+        _exported.add(self.name)
+        self.header = np.ndarray(HEADER_FIELDS + slots, np.int64, buffer=self.shm.buf)
+        self.frames = np.ndarray((slots,) + self.shape, np.uint8,
+                                 buffer=self.shm.buf, offset=header_bytes)
+        channels = 1 if grayscale else 3
+        self.header[:HEADER_FIELDS] = (MAGIC, slots, self.shape[0], self.shape[1],
+                                       channels, 0)
+        self.header[HEADER_FIELDS:] = -1
+
+    def export(self, surface):
+        """Copy the surface into the next slot. Returns the frame number"""
+        frame = int(self.header[5])
+        slot = frame % self.slots
+        self.header[HEADER_FIELDS + slot] = -1
+        with screen_view(surface) as view:
+            convert(view, self.frames[slot], self.downsample, self.grayscale)
+        self.header[HEADER_FIELDS + slot] = frame
+        self.header[5] = frame + 1
+        return frame
+
+    def close(self):
+        if self.shm is None:
+            return
+        del self.header, self.frames
+        self.shm.close()
+        self.shm.unlink()
+        _exported.discard(self.name)
+        self.shm = None
+
+
+class FrameReader:
+    def __init__(self, name):
+        self.shm = shared_memory.SharedMemory(name=name)
+        # The exporter owns the block; without this Python (before 3.13)
+        # would unlink it when this process exits
+        if name not in _exported:
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+        header = np.ndarray(HEADER_FIELDS, np.int64, buffer=self.shm.buf)
+        magic, slots, height, width, channels, _ = (int(v) for v in header)
+        if magic != MAGIC:
+            self.shm.close()
+            raise ValueError(f"{name} is not a frame export buffer")
+        self.slots = slots
+        self.shape = (height, width) if channels == 1 else (height, width, channels)
+        self.header = np.ndarray(HEADER_FIELDS + slots, np.int64, buffer=self.shm.buf)
+        self.frames = np.ndarray((slots,) + self.shape, np.uint8, buffer=self.shm.buf,
+                                 offset=(HEADER_FIELDS + slots) * 8)
+
+    @property
+    def frames_written(self):
+        return int(self.header[5])
+
+    def latest(self):
+        """(frame number, pixels) of the newest complete frame, or
+        (None, None) before the first one. The pixels are not a copy"""
+        frame = self.frames_written - 1
+        if frame < 0:
+            return None, None
+        return frame, self.frames[frame % self.slots]
+
+    def get(self, frame):
+        """Pixels of an older frame, or None once it has been overwritten"""
+        if not self.still_valid(frame):
+            return None
+        return self.frames[frame % self.slots]
+
+    def still_valid(self, frame):
+        return frame >= 0 and self.header[HEADER_FIELDS + frame % self.slots] == frame
+
+    def close(self):
+        if self.shm is None:
+            return
+        del self.header, self.frames
+        self.shm.close()
+        self.shm = None
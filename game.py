@@ -1,10 +1,20 @@
+import io
 import math
 import os
 import random
 import sys
+import threading
+import time
 
 import pygame
 
+from assets import ASSETS
+from background import ParallaxBackground
+from broadphase import SweepAndPrune
+from collision import MASKS, sweep, swept_bounds
+from controls import NO_INPUT, poll_input
+from dirty_renderer import DirtyRenderer
+from entity_store import EntityStore
 from game_objects import (
     DeepfakePowerUp,
     DoublePointsPowerUp,
@@ -17,21 +27,100 @@ from game_objects import (
     ShieldPowerUp,
     TimeSlowPowerUp,
 )
+from particles import ParticleSystem, game_effects
 from player import Player
+from pool import ObjectPool
+from quality import QualityGovernor
+from render_queue import (
+    BACKGROUND,
+    CLOUDS,
+    EFFECTS,
+    ENTITIES,
+    GROUND,
+    HUD,
+    PLAYER,
+    SHIELD,
+    TREES,
+    WHALE,
+    RenderQueue,
+)
+from replay import ReplayRecorder
+from text_cache import FONT_PATH, TEXT_CACHE
+from timestep import FixedTimestep
 from whale import Whale
 
+# Starting difficulty and how each milestone raises it. Game(difficulty=...)
+# overrides any of these, e.g. for the tuner; they become Game attributes
+DIFFICULTY = {
+    "base_game_speed": 7,
+    "max_game_speed": 12,
+    "speed_step": 0.5,
+    "obstacle_chance": 0.5,
+    "obstacle_chance_step": 0.05,
+    "max_obstacle_chance": 0.7,
+    "deepfake_chance": 0.2,  # 20% de chance de um power-up ser um deepfake
+    "deepfake_chance_step": 0.02,
+    "max_deepfake_chance": 0.15,
+    "obstacle_gap": 300,
+    "obstacle_gap_step": 20,
+    "min_obstacle_gap": 200,
+    "milestone_step": 500,  # distance to the first milestone, growing per level
+}
+
+# SDL drivers for headless games: no window and no sound device
+HEADLESS_DRIVERS = {"SDL_VIDEODRIVER": "dummy", "SDL_AUDIODRIVER": "dummy"}
+
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, headless=False, seed=None, record_to=None, profiler=None,
+                 dirty_rendering=False, vectorized=False, tick_rate=60,
+                 render_fps=60, difficulty=None, frame_exporter=None,
+                 startup_profiler=None, quality=None, quiet=False):
+        # Headless mode runs the simulation without a window, sound or frame cap
+        self.headless = headless
+        # Quiet mode drops console messages (crashes, missing assets), for
+        # tools that play many games in a row
+        self.quiet = quiet
+
+        # All simulation randomness comes from this seeded generator, so the
+        # same seed and inputs always replay the same run
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Decorations draw from their own stream so asset availability
+        # never shifts the simulation sequence
+        self.decor_rng = random.Random(seed + 1)
+
+        # Simulation frame counter, used instead of wall-clock time
+        self.frame = 0
+
+        # Optional time-to-first-frame breakdown (profiler.StartupProfiler)
+        self.startup_profiler = startup_profiler
+
+        # Only the display (and with it input) is needed for the first
+        # frame. Fonts start on first use, sound and decorations load in
+        # the background (see load_secondary)
+        self.init_display()
         self.WIDTH = 1200
         self.HEIGHT = 600
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         pygame.display.set_caption("Sam Altman's DeepSeek Escape")
-
-        # Initialize clock
+        self.mark_startup("display")
+
+        # Initialize clock. The simulation advances in fixed ticks of
+        # 1/FPS seconds (see run); every rule (gravity, speeds, timers counted
+        # in frames) is tuned per tick at 60 Hz, so another tick rate plays
+        # the game proportionally faster or slower rather than smoother.
+        # Smoothness on high refresh displays comes from interpolating
+        # between ticks when drawing, at up to render_fps. 0 leaves the frame
+        # rate uncapped, which keeps a CPU core busy redrawing; only worth it
+        # for measuring.
         self.clock = pygame.time.Clock()
-        self.FPS = 60
+        self.FPS = tick_rate
+        self.render_fps = render_fps
+        self.previous_positions = None
+        self.max_lerp = 100  # pixels per tick; longer moves are not blended
 
         # Create assets folder if it doesn't exist
         os.makedirs("assets", exist_ok=True)
@@ -39,17 +128,44 @@ class Game:
         # Load background images/layers for parallax
         self.backgrounds = self.load_backgrounds()
         self.bg_positions = [0, 0, 0]
+        self.background = ParallaxBackground(self.backgrounds, self.WIDTH, self.HEIGHT)
+        self.mark_startup("backgrounds")
 
         # Create player (Sam Altman)
         self.player = Player(125, self.HEIGHT - 50)
 
         # Create the pursuing whale (DeepSeek)
         self.whale = Whale(self.WIDTH, self.HEIGHT)
+        self.mark_startup("player and whale")
 
         # Game objects
         self.obstacles = []
         self.powerups = []
 
+        # Recycled entity instances, one pool per class
+        self.pools = {cls: ObjectPool(cls) for cls in (
+            Obstacle, FlyingDrone, LaserBeam, DeepfakePowerUp, JetpackFuel,
+            ShieldPowerUp, TimeSlowPowerUp, MagnetPowerUp, DoublePointsPowerUp,
+            InvestmentBonus)}
+
+        # Broadphase indexes for player collision and magnet queries
+        self.obstacle_broadphase = SweepAndPrune()
+        self.powerup_broadphase = SweepAndPrune()
+
+        # Optional struct-of-arrays mirrors that move obstacles and power-ups
+        # with NumPy instead of per-object update() calls
+        self.obstacle_store = None
+        self.powerup_store = None
+        if vectorized:
+            self.obstacle_store = EntityStore(self.obstacles, self.HEIGHT)
+            self.powerup_store = EntityStore(self.powerups, self.HEIGHT)
+
+        # Cosmetic particles (whale splash, jetpack flame, deepfake glitch),
+        # advanced per tick when drawn, with their own random stream
+        self.particles = ParticleSystem(seed=seed + 2)
+        self.effects = game_effects(self.particles)
+        self.effects_frame = 0
+
         # Add decorative elements lists
         self.clouds = []
         self.trees = []
@@ -58,35 +174,25 @@ class Game:
         self.cloud_spawn_timer = 0
         self.tree_spawn_timer = 0
 
-        self.deepfake_chance = 0.2  # 20% de chance de um power-up ser um deepfake
         self.glitch_sound = None
 
-        try:
-            cloud_original = pygame.image.load(
-                "assets/cloud.png").convert_alpha()
-            tree_original = pygame.image.load(
-                "assets/tree.png").convert_alpha()
-
-            cloud_width = int(cloud_original.get_width() * 0.3)
-            cloud_height = int(cloud_original.get_height() * 0.3)
-            tree_width = int(tree_original.get_width() * 0.2)
-            tree_height = int(tree_original.get_height() * 0.2)
-
-            self.cloud_image = pygame.transform.scale(
-                cloud_original, (cloud_width, cloud_height))
-            self.tree_image = pygame.transform.scale(
-                tree_original, (tree_width, tree_height))
-        except:
-            print("Warning: Could not load cloud or tree assets")
-            self.cloud_image = None
-            self.tree_image = None
+        # Decorations only spawn once their images are in (load_secondary)
+        self.cloud_image = None
+        self.tree_image = None
+
+        # Difficulty settings
+        self.difficulty = dict(DIFFICULTY)
+        for name, value in (difficulty or {}).items():
+            if name not in DIFFICULTY:
+                raise TypeError(f"Unknown difficulty setting: {name}")
+            self.difficulty[name] = value
+        for name, value in self.difficulty.items():
+            setattr(self, name, value)
 
         # Game state
         self.score = 0
         self.distance = 0
-        self.base_game_speed = 7
         self.game_speed = self.base_game_speed
-        self.max_game_speed = 12
         self.spawn_timer = 0
 
         # Shield effect (from power-up)
@@ -95,20 +201,57 @@ class Game:
 
         # Game difficulty management
         self.difficulty_level = 1
-        self.obstacle_chance = 0.5  # Starting chance
-        self.obstacle_gap = 300
-        self.next_milestone = 500  # Distance for next difficulty increase
+        self.next_milestone = self.milestone_step  # Distance for next difficulty increase
 
-        # Font for game information
-        self.font = pygame.font.Font("assets/fonts/ShareTechMono-Regular.ttf", 36)
-        self.small_font = pygame.font.Font("assets/fonts/ShareTechMono-Regular.ttf", 24)
+        # Font sizes for game information (text itself is rendered via
+        # TEXT_CACHE, which loads the fonts on first use)
+        self.font_size = 36
+        self.small_font_size = 24
 
         # Game over state
         self.game_over = False
         self.game_over_delay = 180  # 3 seconds before restart option
 
-        # Load sounds (placeholders)
-        self.sounds = self.load_sounds()
+        # Sounds are filled in by load_secondary; until then nothing plays
+        self.sounds = {"jump": None, "jetpack": None, "pickup": None,
+                       "crash": None, "whale": None}
+
+        # Input for the frame being simulated
+        self.frame_input = NO_INPUT
+
+        # Optional replay recording of every frame's input
+        self.record_to = record_to
+        self.recorder = ReplayRecorder(self.seed) if record_to else None
+
+        # Optional per-phase frame timing (profiler.FrameProfiler)
+        self.profiler = profiler
+
+        # Optional copy of every drawn frame into shared memory
+        # (frame_export.FrameExporter)
+        self.frame_exporter = frame_exporter
+
+        # HUD surfaces built on first use
+        self.game_over_overlay = None
+        self.deepfake_warning = None
+
+        # Rendering detail (quality.QualityGovernor); without one the game
+        # always draws at the highest tier
+        self.quality = quality or QualityGovernor(adaptive=False)
+        # Last HUD items, reused between rebuilds at lower quality tiers
+        self.hud = None
+        self.hud_age = 0
+
+        # Everything but the deepfake pointers is drawn through a render
+        # queue, one Surface.blits call per layer
+        self.queue = RenderQueue(self.screen.get_rect())
+        # Ground strips (with and without grid lines) and the shield bubble
+        self.ground_strips = {}
+        self.shield_bubble = None
+
+        # Optional dirty-rectangle renderer (static background, partial updates)
+        self.renderer = None
+        if dirty_rendering and not headless:
+            self.renderer = DirtyRenderer(self.screen, self.static_background())
 
         self.slow_timer = 0  # Timer for time slow power-up
         self.magnet_active = False  # Whether the magnet power-up is active
@@ -116,6 +259,88 @@ class Game:
         self.double_points_active = False  # Whether double points power-up is active
         self.double_points_timer = 0  # Timer for double points power-up
 
+        # Headless runs load synchronously so decorations always start at
+        # the same frame. Otherwise the files are read on a thread and step()
+        # finishes loading once it is done
+        self.loader_start = time.perf_counter()
+        self.loader = None
+        self.sound_files = {}
+        if headless:
+            self.load_secondary()
+        else:
+            self.loader = threading.Thread(target=self.read_secondary, daemon=True)
+            self.loader.start()
+        self.mark_startup("game state")
+
+    @property
+    def font(self):
+        return TEXT_CACHE.font(FONT_PATH, self.font_size)
+
+    @property
+    def small_font(self):
+        return TEXT_CACHE.font(FONT_PATH, self.small_font_size)
+
+    def init_display(self):
+        """Initialise the display, on SDL's dummy drivers when headless.
+
+        SDL reads its drivers from the environment when the display is first
+        initialised and keeps them until pygame.quit(), so this is
+        process-wide: every Game made while the display is up shares the
+        first one's drivers, headless or not. The environment itself is only
+        changed for that initialisation and restored afterwards.
+        """
+        if not self.headless or pygame.display.get_init():
+            pygame.display.init()
+            return
+        saved = {name: os.environ.get(name) for name in HEADLESS_DRIVERS}
+        os.environ.update(HEADLESS_DRIVERS)
+        try:
+            pygame.display.init()
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    del os.environ[name]
+                else:
+                    os.environ[name] = value
+
+    def mark_startup(self, stage):
+        if self.startup_profiler:
+            self.startup_profiler.mark(stage)
+
+    def log(self, message):
+        if not self.quiet:
+            print(message)
+
+    def read_secondary(self):
+        """File reading and decoding for load_secondary, run on a thread
+        outside headless mode. SDL expects display and audio calls on the
+        main thread, so this only reads: converting the images and starting
+        the mixer are left to load_secondary"""
+        for name, scale in (("cloud.png", 0.3), ("tree.png", 0.2)):
+            try:
+                ASSETS.decode(name, scale=scale)
+            except:
+                pass  # load_secondary tries again and reports it
+        for sound_name in self.sounds:
+            try:
+                with open(f"assets/{sound_name}.wav", "rb") as f:
+                    self.sound_files[sound_name] = f.read()
+            except OSError:
+                pass
+
+    def load_secondary(self):
+        """Assets the first frame can do without: decoration images and
+        sounds. Outside headless mode read_secondary has read them by now"""
+        try:
+            cloud_image = ASSETS.image("cloud.png", scale=0.3)
+            tree_image = ASSETS.image("tree.png", scale=0.2)
+            self.cloud_image, self.tree_image = cloud_image, tree_image
+        except:
+            self.log("Warning: Could not load cloud or tree assets")
+        self.sounds.update(self.load_sounds())
+        if self.startup_profiler:
+            self.startup_profiler.background("sound and decorations", self.loader_start)
+
     def load_backgrounds(self):
         """Load or create background layers for parallax effect"""
         backgrounds = [
@@ -124,15 +349,12 @@ class Game:
             {"img": None, "speed": 2.0}
         ]
 
-        # Try to load background images if they exist
+        # Try to load background images if they exist. All three layers
+        # share one surface
         try:
-            backgrounds[0]["img"] = pygame.image.load(
-                "assets/background.png").convert()
-            backgrounds[1]["img"] = pygame.image.load(
-                "assets/background.png").convert()
-            backgrounds[2]["img"] = pygame.image.load(
-                "assets/background.png").convert()
-            
+            image = ASSETS.image("background.png", alpha=False)
+            for bg in backgrounds:
+                bg["img"] = image
         except:
             # Create solid color backgrounds if images don't exist
             for i, bg in enumerate(backgrounds):
@@ -146,6 +368,17 @@ class Game:
 
         return backgrounds
 
+    def static_background(self):
+        """Backdrop for dirty rendering: the front parallax layer tiled at
+        rest, with the plain ground strip"""
+        image = self.backgrounds[-1]["img"]
+        background = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        for x in range(0, self.WIDTH, image.get_width()):
+            background.blit(image, (x, 0))
+        pygame.draw.rect(background, (100, 180, 100),
+                         (0, self.HEIGHT - 50, self.WIDTH, 50))
+        return background
+
     def load_sounds(self):
         """Load game sounds if available"""
         sounds = {
@@ -156,34 +389,45 @@ class Game:
             "whale": None
         }
 
+        if self.headless:
+            return sounds
+
         try:
             pygame.mixer.init()
-            # Load sounds if files exist
+            # Load sounds if files exist, from memory when read_secondary
+            # already read them
             for sound_name in sounds:
                 try:
+                    data = self.sound_files.get(sound_name)
                     sounds[sound_name] = pygame.mixer.Sound(
-                        f"assets/{sound_name}.wav")
+                        file=io.BytesIO(data) if data else f"assets/{sound_name}.wav")
                 except:
                     # Skip if sound file doesn't exist
                     pass
         except:
-            print("Sound system not available")
+            self.log("Sound system not available")
 
         return sounds
 
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-
+    def handle_events(self, frame_input=None):
+        # Without scripted input, read this frame's input from the keyboard
+        running = True
+        if frame_input is None:
+            frame_input, quit_requested = poll_input()
+            running = not quit_requested
+        self.frame_input = frame_input
+        if self.recorder:
+            self.recorder.record(frame_input)
+
+        for event in frame_input.key_events():
             if not self.game_over:
                 self.player.handle_event(event)
             else:
                 # Handle restart on game over
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_r and self.game_over_delay <= 0:
+                if event.key == pygame.K_r and self.game_over_delay <= 0:
                     self.reset_game()
 
-        return True
+        return running
 
     def reset_game(self):
         # Reset game state
@@ -198,14 +442,63 @@ class Game:
         # Reset whale
         self.whale = Whale(self.WIDTH, self.HEIGHT)
 
-        # Clear objects
-        self.obstacles = []
-        self.powerups = []
+        # Clear objects, returning them to their pools
+        for obj in self.obstacles + self.powerups:
+            self.release(obj)
+        self.obstacles.clear()
+        self.powerups.clear()
+        if self.obstacle_store:
+            self.obstacle_store.clear()
+            self.powerup_store.clear()
+        self.particles.clear()
+        self.hud = None
 
         # Reset difficulty
         self.difficulty_level = 1
-        self.obstacle_chance = 0.5
-        self.next_milestone = 500
+        self.obstacle_chance = self.difficulty["obstacle_chance"]
+        self.next_milestone = self.milestone_step
+
+    def new_run(self, seed=None):
+        """Start a fresh run, exactly as a new Game(seed=seed) would play it,
+        but keeping the window, assets, pools and options"""
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.decor_rng = random.Random(seed + 1)
+        self.frame = 0
+        self.frame_input = NO_INPUT
+        self.previous_positions = None
+        self.particles.seed(seed + 2)
+        self.effects_frame = 0
+        if self.recorder:
+            self.recorder = ReplayRecorder(seed)
+
+        self.bg_positions = [0, 0, 0]
+        self.clouds.clear()
+        self.trees.clear()
+        self.cloud_spawn_timer = 0
+        self.tree_spawn_timer = 0
+
+        for name, value in self.difficulty.items():
+            setattr(self, name, value)
+        self.spawn_timer = 0
+        self.game_over_delay = 180
+        self.shield_active = False
+        self.shield_timer = 0
+        self.slow_timer = 0
+        self.magnet_active = False
+        self.magnet_timer = 0
+        self.double_points_active = False
+        self.double_points_timer = 0
+        self.reset_game()
+
+    def spawn(self, cls, *args):
+        """New entity of `cls`, recycled from its pool when possible"""
+        return self.pools[cls].acquire(*args)
+
+    def release(self, obj):
+        self.pools[type(obj)].release(obj)
 
     def spawn_objects(self):
         self.spawn_timer += 1
@@ -215,109 +508,125 @@ class Game:
 
         # Check if any obstacle is too close to the right edge
         rightmost_object = 0
-        for obstacle in self.obstacles:
-            rightmost_object = max(
-                rightmost_object, obstacle.rect.x + obstacle.rect.width)
-        for powerup in self.powerups:
-            rightmost_object = max(
-                rightmost_object, powerup.rect.x + powerup.rect.width)
+        if self.obstacle_store:
+            rightmost_object = max(self.obstacle_store.rightmost(),
+                                   self.powerup_store.rightmost())
+        else:
+            for obstacle in self.obstacles:
+                rightmost_object = max(
+                    rightmost_object, obstacle.rect.x + obstacle.rect.width)
+            for powerup in self.powerups:
+                rightmost_object = max(
+                    rightmost_object, powerup.rect.x + powerup.rect.width)
 
         # Only spawn if there's enough space
         can_spawn = (rightmost_object < self.WIDTH - self.obstacle_gap)
 
         if self.spawn_timer >= spawn_rate and can_spawn:
             self.spawn_timer = 0
-            spawn_chance = random.random()
+            spawn_chance = self.rng.random()
 
             # Obstacle with increasing chance based on difficulty
             if spawn_chance < self.obstacle_chance:
-                obstacle_type = random.choice(
+                obstacle_type = self.rng.choice(
                     ["server", "competitor", "regulation", "drone", "laser", "mine"])
                 if obstacle_type == "drone":
                     # Spawn a flying drone at a random height
-                    self.obstacles.append(FlyingDrone(
-                        self.WIDTH, random.randint(100, self.HEIGHT - 150), self.HEIGHT))
+                    self.obstacles.append(self.spawn(
+                        FlyingDrone, self.WIDTH, self.rng.randint(100, self.HEIGHT - 150), self.HEIGHT, self.rng))
                 elif obstacle_type == "laser":
                     # Spawn a laser beam at a random height
                     self.obstacles.append(
-                        LaserBeam(self.WIDTH, random.randint(100, self.HEIGHT - 150), self.WIDTH))
+                        self.spawn(LaserBeam, self.WIDTH, self.rng.randint(100, self.HEIGHT - 150), self.WIDTH))
                 else:
                     # Spawn a regular obstacle (server, competitor, regulation)
                     self.obstacles.append(
-                        Obstacle(self.WIDTH, self.HEIGHT - 50))
+                        self.spawn(Obstacle, self.WIDTH, self.HEIGHT - 50, self.rng))
 
             # Power-ups with decreasing chance based on difficulty
             elif spawn_chance < self.obstacle_chance + 0.2:
                 # Decision point: normal power-up or deepfake?
-                is_deepfake = random.random() < self.deepfake_chance
+                is_deepfake = self.rng.random() < self.deepfake_chance
 
                 if is_deepfake:
                     # Spawn a deepfake power-up that looks like a bonus but is actually an obstacle
-                    height = random.randint(
+                    height = self.rng.randint(
                         self.HEIGHT - 300, self.HEIGHT - 100)
-                    self.powerups.append(DeepfakePowerUp(self.WIDTH, height))
+                    self.powerups.append(
+                        self.spawn(DeepfakePowerUp, self.WIDTH, height, self.rng))
                 else:
                     # Regular power-ups as before
-                    powerup_type = random.choice(
+                    powerup_type = self.rng.choice(
                         ["jetpack_fuel", "shield", "time_slow", "magnet", "double_points"])
                     if powerup_type == "jetpack_fuel":
                         # Spawn jetpack fuel at a random height
-                        height = random.randint(
+                        height = self.rng.randint(
                             self.HEIGHT - 300, self.HEIGHT - 100)
-                        self.powerups.append(JetpackFuel(self.WIDTH, height))
+                        self.powerups.append(
+                            self.spawn(JetpackFuel, self.WIDTH, height, self.rng))
                     elif powerup_type == "shield":
                         # Spawn shield power-up at a random height
-                        height = random.randint(
+                        height = self.rng.randint(
                             self.HEIGHT - 250, self.HEIGHT - 150)
-                        self.powerups.append(ShieldPowerUp(self.WIDTH, height))
+                        self.powerups.append(
+                            self.spawn(ShieldPowerUp, self.WIDTH, height))
                     elif powerup_type == "time_slow":
                         # Spawn time slow power-up at a random height
-                        height = random.randint(
+                        height = self.rng.randint(
                             self.HEIGHT - 300, self.HEIGHT - 100)
                         self.powerups.append(
-                            TimeSlowPowerUp(self.WIDTH, height))
+                            self.spawn(TimeSlowPowerUp, self.WIDTH, height))
                     elif powerup_type == "magnet":
                         # Spawn magnet power-up at a random height
-                        height = random.randint(
+                        height = self.rng.randint(
                             self.HEIGHT - 300, self.HEIGHT - 100)
-                        self.powerups.append(MagnetPowerUp(self.WIDTH, height))
+                        self.powerups.append(
+                            self.spawn(MagnetPowerUp, self.WIDTH, height))
                     elif powerup_type == "double_points":
                         # Spawn double points power-up at a random height
-                        height = random.randint(
+                        height = self.rng.randint(
                             self.HEIGHT - 300, self.HEIGHT - 100)
                         self.powerups.append(
-                            DoublePointsPowerUp(self.WIDTH, height))
+                            self.spawn(DoublePointsPowerUp, self.WIDTH, height, self.rng))
 
     def spawn_decorative_elements(self):
         # Spawn clouds
         self.cloud_spawn_timer += 1
         if self.cloud_spawn_timer >= 120 and self.cloud_image:
             self.cloud_spawn_timer = 0
-            cloud_y = random.randint(20, self.HEIGHT // 2 - 50)
+            cloud_y = self.decor_rng.randint(20, self.HEIGHT // 2 - 50)
             self.clouds.append({
                 'x': self.WIDTH,
                 'y': cloud_y,
-                'speed': random.uniform(0.3, 1.0)
+                'speed': self.decor_rng.uniform(0.3, 1.0)
             })
 
     def update(self):
         if self.game_over:
             self.game_over_delay -= 1
-            self.player.load_grave_image()
+            self.player.show_grave()
             return True
 
-        # Update clouds
-        for cloud in self.clouds[:]:
+        # Update clouds. Lists are compacted in place: survivors are shifted
+        # down over removed entries and the tail is cut once, instead of an
+        # O(n) list.remove per removal
+        kept = 0
+        for cloud in self.clouds:
             cloud['x'] -= cloud['speed'] * self.game_speed
-            if cloud['x'] + self.cloud_image.get_width() < 0:
-                self.clouds.remove(cloud)
+            if cloud['x'] + self.cloud_image.get_width() >= 0:
+                self.clouds[kept] = cloud
+                kept += 1
+        del self.clouds[kept:]
 
         # Update trees
-        for tree in self.trees[:]:
+        kept = 0
+        for tree in self.trees:
             # Trees move faster for foreground effect
             tree['x'] -= self.game_speed * 2
-            if tree['x'] + self.tree_image.get_width() < 0:
-                self.trees.remove(tree)
+            if tree['x'] + self.tree_image.get_width() >= 0:
+                self.trees[kept] = tree
+                kept += 1
+        del self.trees[kept:]
 
         # Update background positions (parallax)
         for i in range(len(self.backgrounds)):
@@ -327,7 +636,10 @@ class Game:
                 self.bg_positions[i] = 0
 
         # Update player
-        self.player.update()
+        player_start = self.player.rect.topleft
+        self.player.update(self.frame_input)
+        player_moved = (self.player.rect.x - player_start[0],
+                        self.player.rect.y - player_start[1])
 
         # Update the whale
         self.whale.update(self.player.rect.x, self.game_speed)
@@ -341,79 +653,129 @@ class Game:
         #     return True
 
         # Update obstacles
-        for obstacle in self.obstacles[:]:
-            obstacle.update(self.game_speed)
-            if obstacle.rect.right < 0:
-                self.obstacles.remove(obstacle)
+        if self.obstacle_store:
+            store = self.obstacle_store
+            store.step(self.game_speed, self.player.rect)
+            for obstacle in store.remove(store.offscreen()):
+                self.release(obstacle)
                 self.score += 5  # Points for passing obstacle
-
-            # Collision detection with player hitbox
-            player_hitbox = pygame.Rect(
-                self.player.rect.x + 5,
-                self.player.rect.y + 5,
-                self.player.rect.width - 10,
-                self.player.rect.height - 10
-            )
-
-            if (player_hitbox.colliderect(obstacle.rect) and
-                not self.shield_active and
-                    not self.player.invincible):
+        else:
+            kept = 0
+            for obstacle in self.obstacles:
+                obstacle.update(self.game_speed)
+                if obstacle.rect.right < 0:
+                    self.release(obstacle)
+                    self.score += 5  # Points for passing obstacle
+                else:
+                    self.obstacles[kept] = obstacle
+                    kept += 1
+            del self.obstacles[kept:]
+
+        # Collision detection: rects pick the candidates, then the sprites'
+        # masks decide, so only drawn pixels touch
+        player_shape = self.player.hit_sprite()
+
+        # Hazards are swept over the frame, from where they and the player
+        # were to where they are, so fast or thin ones cannot pass through
+        # the player between two frames (see hits_player). They move by the
+        # scroll speed plus a few pixels of their own at most, so the
+        # candidates are found within that reach of the player's path
+        reach = int(self.game_speed) + 8
+        zone = swept_bounds(self.player.rect, player_moved).inflate(2 * reach, 2 * reach)
+
+        if not self.shield_active and not self.player.invincible:
+            if self.obstacle_store:
+                store = self.obstacle_store
+                candidates = [store.sync_one(i) for i in store.overlapping(zone)]
+            else:
+                self.obstacle_broadphase.rebuild(self.obstacles)
+                candidates = self.obstacle_broadphase.colliding(zone)
+            if any(self.hits_player(obstacle, player_shape, player_moved)
+                   for obstacle in candidates):
                 self.game_over = True
                 if self.sounds["crash"]:
                     self.sounds["crash"].play()
-                print(f"Game Over! Score: {self.score}")
+                self.log(f"Game Over! Score: {self.score}")
                 return True
 
         # Update power-ups
-        for powerup in self.powerups[:]:
-            # Se for um deepfake, passe a posição do jogador para verificar proximidade
-            if isinstance(powerup, DeepfakePowerUp):
-                powerup.update(self.game_speed, self.player.rect)
-
-                # Se estiver transformando e tiver som de glitch, tocar uma vez
-                if powerup.is_transforming and powerup.glitch_timer == powerup.glitch_duration - 1 and self.glitch_sound:
-                    self.glitch_sound.play()
-            else:
-                powerup.update(self.game_speed)
-
-            if powerup.rect.right < 0:
-                self.powerups.remove(powerup)
+        if self.powerup_store:
+            store = self.powerup_store
+            store.step(self.game_speed, self.player.rect)
+            if store.glitch_started() and self.glitch_sound:
+                self.glitch_sound.play()
+            for powerup in store.remove(store.offscreen()):
+                self.release(powerup)
 
             # Collision detection for power-ups
-            if self.player.rect.colliderect(powerup.rect):
-                self.powerups.remove(powerup)
-
-                # Verificar se é um deepfake e já se transformou em obstáculo
-                if isinstance(powerup, DeepfakePowerUp) and powerup.display_type == "obstacle":
-                    # Colisão com um deepfake que se revelou ser um obstáculo
-                    if not self.shield_active and not self.player.invincible:
-                        self.game_over = True
-                        if self.sounds["crash"]:
-                            self.sounds["crash"].play()
-                        print(
-                            f"Game Over! Caught by a deepfake! Score: {self.score}")
+            hits = [i for i in store.overlapping(zone)
+                    if self.touches_player(store.sync_one(i), player_shape, player_moved)]
+            collected = [store.objects[i] for i in hits]
+            store.remove(hits)
+        else:
+            kept = 0
+            for powerup in self.powerups:
+                # Se for um deepfake, passe a posição do jogador para verificar proximidade
+                if isinstance(powerup, DeepfakePowerUp):
+                    powerup.update(self.game_speed, self.player.rect)
+
+                    # Se estiver transformando e tiver som de glitch, tocar uma vez
+                    if powerup.is_transforming and powerup.glitch_timer == powerup.glitch_duration - 1 and self.glitch_sound:
+                        self.glitch_sound.play()
+                else:
+                    powerup.update(self.game_speed)
+
+                if powerup.rect.right < 0:
+                    self.release(powerup)
                 else:
-                    # Normal power-up pickup logic
-                    if self.sounds["pickup"]:
-                        self.sounds["pickup"].play()
-
-                    if isinstance(powerup, JetpackFuel):
-                        self.player.add_fuel(powerup.fuel_amount)
-                    elif isinstance(powerup, ShieldPowerUp):
-                        self.shield_active = True
-                        self.shield_timer = powerup.duration * 60  # Convert to frames
-                    elif isinstance(powerup, TimeSlowPowerUp):
-                        # Slow down game speed
-                        self.game_speed = max(2, self.game_speed / 2)
-                        self.slow_timer = powerup.duration * 60
-                    elif isinstance(powerup, MagnetPowerUp):
-                        self.magnet_active = True
-                        self.magnet_timer = powerup.duration * 60
-                    elif isinstance(powerup, DoublePointsPowerUp):
-                        self.double_points_active = True
-                        self.double_points_timer = powerup.duration * 60
-                    elif isinstance(powerup, InvestmentBonus):
-                        self.score += powerup.points
+                    self.powerups[kept] = powerup
+                    kept += 1
+            del self.powerups[kept:]
+
+            # Collision detection for power-ups
+            self.powerup_broadphase.rebuild(self.powerups)
+            collected = [powerup for powerup in self.powerup_broadphase.colliding(zone)
+                         if self.touches_player(powerup, player_shape, player_moved)]
+            if collected:
+                for powerup in collected:
+                    self.powerup_broadphase.remove(powerup)
+                self.powerups[:] = [p for p in self.powerups if p not in collected]
+
+        for powerup in collected:
+
+            # Verificar se é um deepfake e já se transformou em obstáculo
+            if isinstance(powerup, DeepfakePowerUp) and powerup.display_type == "obstacle":
+                # Colisão com um deepfake que se revelou ser um obstáculo
+                if not self.shield_active and not self.player.invincible:
+                    self.game_over = True
+                    if self.sounds["crash"]:
+                        self.sounds["crash"].play()
+                    self.log(
+                        f"Game Over! Caught by a deepfake! Score: {self.score}")
+            else:
+                # Normal power-up pickup logic
+                if self.sounds["pickup"]:
+                    self.sounds["pickup"].play()
+
+                if isinstance(powerup, JetpackFuel):
+                    self.player.add_fuel(powerup.fuel_amount)
+                elif isinstance(powerup, ShieldPowerUp):
+                    self.shield_active = True
+                    self.shield_timer = powerup.duration * 60  # Convert to frames
+                elif isinstance(powerup, TimeSlowPowerUp):
+                    # Slow down game speed
+                    self.game_speed = max(2, self.game_speed / 2)
+                    self.slow_timer = powerup.duration * 60
+                elif isinstance(powerup, MagnetPowerUp):
+                    self.magnet_active = True
+                    self.magnet_timer = powerup.duration * 60
+                elif isinstance(powerup, DoublePointsPowerUp):
+                    self.double_points_active = True
+                    self.double_points_timer = powerup.duration * 60
+                elif isinstance(powerup, InvestmentBonus):
+                    self.score += powerup.points
+
+            self.release(powerup)
 
         # Update shield timer
         if self.shield_active:
@@ -440,19 +802,20 @@ class Game:
                 self.double_points_active = False
 
         # Magnet effect: Attract nearby power-ups
-        if self.magnet_active:
-            for powerup in self.powerups[:]:
-                # Attract within 100px radius
-                if powerup.rect.colliderect(self.player.rect.inflate(100, 100)):
-                    # Move power-up toward player
-                    if powerup.rect.x > self.player.rect.x:
-                        powerup.rect.x -= 5
-                    else:
-                        powerup.rect.x += 5
-                    if powerup.rect.y > self.player.rect.y:
-                        powerup.rect.y -= 5
-                    else:
-                        powerup.rect.y += 5
+        if self.magnet_active and self.powerup_store:
+            self.powerup_store.attract(self.player.rect, 50, 5)
+        elif self.magnet_active:
+            # Attract within 50px of the player
+            for powerup in self.powerup_broadphase.within(self.player.rect, 50):
+                # Move power-up toward player
+                if powerup.rect.x > self.player.rect.x:
+                    powerup.rect.x -= 5
+                else:
+                    powerup.rect.x += 5
+                if powerup.rect.y > self.player.rect.y:
+                    powerup.rect.y -= 5
+                else:
+                    powerup.rect.y += 5
 
         # Increase distance and score
         self.distance += self.game_speed / 10
@@ -468,94 +831,242 @@ class Game:
 
         return True
 
+    def hits_player(self, hazard, player_shape, player_moved):
+        """Whether a hazard touched the player at any point of the last
+        frame, given the player's hit sprite and motion"""
+        span = sweep(self.player.rect, player_moved, hazard.rect, hazard.moved)
+        return bool(span) and MASKS.swept_overlap(player_shape, player_moved,
+                                                  hazard.hit_sprite(), hazard.moved, span)
+
+    def touches_player(self, powerup, player_shape, player_moved):
+        """Whether the player collides with a power-up this frame. Revealed
+        deepfakes are hazards and swept like obstacles; pickups only count
+        where they end up"""
+        if isinstance(powerup, DeepfakePowerUp) and powerup.display_type == "obstacle":
+            return self.hits_player(powerup, player_shape, player_moved)
+        return (self.player.rect.colliderect(powerup.rect)
+                and MASKS.overlap(player_shape, powerup.hit_sprite()))
+
     def increase_difficulty(self):
         self.difficulty_level += 1
-        self.next_milestone += 500 * self.difficulty_level
+        self.next_milestone += self.milestone_step * self.difficulty_level
 
         # Make the game harder
         if self.base_game_speed < self.max_game_speed:
-            self.base_game_speed += 0.5
+            self.base_game_speed += self.speed_step
             self.game_speed = self.base_game_speed
 
         # Increase obstacle chance
-        self.obstacle_chance = min(0.7, self.obstacle_chance + 0.05)
-        self.deepfake_chance = min(0.15, self.deepfake_chance + 0.02)
+        self.obstacle_chance = min(self.max_obstacle_chance,
+                                   self.obstacle_chance + self.obstacle_chance_step)
+        self.deepfake_chance = min(self.max_deepfake_chance,
+                                   self.deepfake_chance + self.deepfake_chance_step)
 
         # Reduce obstacle gap for more dense challenges
-        self.obstacle_gap = max(200, self.obstacle_gap - 20)
-
-    def draw(self):
-        # Draw background with parallax effect
-        for i in range(len(self.backgrounds)):
-            # Draw background twice for seamless scrolling
-            self.screen.blit(
-                self.backgrounds[i]["img"], (int(self.bg_positions[i]), 0))
-            self.screen.blit(self.backgrounds[i]["img"], (int(
-                self.bg_positions[i]) + self.WIDTH, 0))
-
-        # Draw a simple ground
-        ground_color = (100, 180, 100)  # Green ground
-        pygame.draw.rect(self.screen, ground_color,
-                         (0, self.HEIGHT - 50, self.WIDTH, 50))
-
-        # Draw clouds
+        self.obstacle_gap = max(self.min_obstacle_gap,
+                                self.obstacle_gap - self.obstacle_gap_step)
+
+    def sync_entities(self):
+        """Copy vectorized entity state back onto the objects before drawing"""
+        if self.obstacle_store:
+            self.obstacle_store.sync()
+            self.powerup_store.sync()
+
+    def remember_positions(self):
+        """Record where everything is before a tick, for interpolated drawing"""
+        self.sync_entities()
+        self.previous_positions = {id(entity): entity.rect.topleft
+                                   for entity in self.moving_entities()}
+        self.previous_decor = {id(decor): decor['x']
+                               for decor in self.clouds + self.trees}
+        self.previous_bg_positions = list(self.bg_positions)
+
+    def moving_entities(self):
+        return self.obstacles + self.powerups + [self.whale, self.player]
+
+    def interpolate(self, alpha):
+        """Move everything `alpha` of the way from its position before the last
+        tick to its current one. Returns what restore_positions() needs.
+
+        Entities spawned by the tick have no previous position and stay put;
+        jumps longer than max_lerp are teleports (a pooled entity recycled at
+        the right edge, a parallax layer wrapping) and are not blended.
+        """
+        moved = []
+        if alpha >= 1 or self.previous_positions is None:
+            return moved
+
+        def blend(previous, current):
+            if abs(current - previous) > self.max_lerp:
+                return current
+            return previous + (current - previous) * alpha
+
+        for entity in self.moving_entities():
+            previous = self.previous_positions.get(id(entity))
+            if previous is not None:
+                current = entity.rect.topleft
+                moved.append((entity.rect, current))
+                entity.rect.topleft = (round(blend(previous[0], current[0])),
+                                       round(blend(previous[1], current[1])))
+        for decor in self.clouds + self.trees:
+            previous = self.previous_decor.get(id(decor))
+            if previous is not None:
+                moved.append((decor, decor['x']))
+                decor['x'] = blend(previous, decor['x'])
+        moved.append((self.bg_positions, list(self.bg_positions)))
+        self.bg_positions[:] = [blend(previous, current) for previous, current
+                                in zip(self.previous_bg_positions, self.bg_positions)]
+        return moved
+
+    def restore_positions(self, moved):
+        for target, value in moved:
+            if isinstance(target, pygame.Rect):
+                target.topleft = value
+            elif isinstance(target, dict):
+                target['x'] = value
+            else:
+                target[:] = value
+
+    def draw(self, alpha=1.0):
+        """Draw the current state, or with alpha < 1 a blend between the
+        last two ticks (see interpolate)"""
+        self.sync_entities()
+        moved = self.interpolate(alpha)
+        self.update_effects()
+        if self.renderer:
+            self.draw_dirty()
+        else:
+            self.draw_full()
+        self.restore_positions(moved)
+        if self.frame_exporter:
+            # Done with the screen's pixels before it is flipped
+            self.frame_exporter.export(self.screen)
+
+    def draw_full(self):
+        queue = self.queue
+        queue.extend(self.background.blits(
+            self.bg_positions, self.quality.settings["parallax_layers"]), BACKGROUND)
+        self.submit_world(queue)
+
+        # Score, timers, game over screen and deepfake warning
+        queue.extend([(surface, position) for _, surface, position in self.current_hud()], HUD)
+        queue.flush(self.screen)
+
+        self.draw_deepfake_indicators()
+
+    def submit_world(self, queue):
+        """Queue everything between the background and the HUD"""
         if self.cloud_image:
-            for cloud in self.clouds:
-                self.screen.blit(self.cloud_image,
-                                 (int(cloud['x']), cloud['y']))
-
-        # Draw ground
-        ground_color = (100, 180, 100)  # Green ground
-        pygame.draw.rect(self.screen, ground_color,
-                         (0, self.HEIGHT - 50, self.WIDTH, 50))
+            queue.extend([(self.cloud_image, (int(cloud['x']), cloud['y']))
+                          for cloud in self.clouds], CLOUDS)
 
-        # Draw grid lines on ground (sci-fi effect)
-        for i in range(0, self.WIDTH, 50):
-            x_pos = i - (int(self.distance * 5) % 50)
-            pygame.draw.line(self.screen, (120, 200, 120),
-                             (x_pos, self.HEIGHT - 50),
-                             (x_pos, self.HEIGHT), 1)
+        queue.submit(self.ground_strip(), (-(int(self.distance * 5) % 50), self.HEIGHT - 50),
+                     GROUND)
 
-        # Draw trees
         if self.tree_image:
-            for tree in self.trees:
-                self.screen.blit(self.tree_image, (int(tree['x']), tree['y']))
-
-        # Draw obstacles
-        for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
-
-        # Draw power-ups
-        for powerup in self.powerups:
-            powerup.draw(self.screen)
+            queue.extend([(self.tree_image, (int(tree['x']), tree['y']))
+                          for tree in self.trees], TREES)
 
-        # Draw the pursuing whale
-        self.whale.draw(self.screen)
+        # Obstacles, then power-ups
+        for entity in self.obstacles:
+            queue.extend(entity.blits(), ENTITIES)
+        for entity in self.powerups:
+            queue.extend(entity.blits(), ENTITIES)
 
-        # Draw player
-        self.player.draw(self.screen)
+        # The pursuing whale, the player and the particles around them
+        queue.extend(self.whale.blits(), WHALE)
+        queue.extend(self.player.blits(), PLAYER)
+        queue.extend(self.particles.blits(), EFFECTS)
 
-        # Draw shield effect if active
+        # Shield effect if active
         if self.shield_active:
+            queue.submit(self.shield_sprite(), self.shield_rect().topleft, SHIELD)
+
+    def update_effects(self):
+        """Bring the particles up to the current tick: age them and emit
+        what each source gave off since the last drawn frame"""
+        ticks = min(self.frame - self.effects_frame, 5)
+        self.effects_frame = self.frame
+        if ticks <= 0:
+            return
+        particles = self.particles
+        particles.update(ticks)
+        detail = self.quality.settings["particles"]
+        glitch = self.quality.settings["glitch"]
+
+        if self.whale.rect.right > 0 and detail:
+            particles.emit(self.effects["splash"], self.whale.rect.x,
+                           self.whale.rect.bottom, ticks, detail)
+        if self.player.is_using_jetpack and detail:
+            particles.emit(self.effects["flame"], self.player.rect.x - 7,
+                           self.player.rect.y + 50, ticks, detail)
+        glitching = [powerup for powerup in self.powerups
+                     if isinstance(powerup, DeepfakePowerUp) and powerup.is_transforming]
+        if glitching and glitch:
+            # One call for all of them
+            particles.emit(self.effects["glitch"],
+                           [powerup.rect.x for powerup in glitching],
+                           [powerup.rect.y for powerup in glitching], ticks,
+                           [powerup.glitch_intensity * glitch for powerup in glitching])
+
+    def ground_strip(self):
+        """The ground, one grid cell wider than the screen so it can scroll
+        by up to a cell. Grid lines (a sci-fi effect) depend on the quality
+        tier"""
+        grid = self.quality.settings["ground_grid"]
+        strip = self.ground_strips.get(grid)
+        if strip is None:
+            strip = pygame.Surface((self.WIDTH + 50, 50)).convert()
+            strip.fill((100, 180, 100))  # Green ground
+            if grid:
+                for x_pos in range(0, self.WIDTH, 50):
+                    pygame.draw.line(strip, (120, 200, 120), (x_pos, 0), (x_pos, 50), 1)
+            self.ground_strips[grid] = strip
+        return strip
+
+    def shield_rect(self):
+        shield_radius = max(self.player.rect.width,
+                            self.player.rect.height) + 5
+        return pygame.Rect(self.player.rect.centerx - shield_radius,
+                           self.player.rect.centery - shield_radius,
+                           shield_radius * 2, shield_radius * 2)
+
+    def shield_sprite(self):
+        """Translucent bubble around the player, built once"""
+        if self.shield_bubble is None:
             shield_color = (100, 100, 255, 128)  # Blue with transparency
-            shield_radius = max(self.player.rect.width,
-                                self.player.rect.height) + 5
-            shield_surface = pygame.Surface(
-                (shield_radius*2, shield_radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(shield_surface, shield_color,
+            rect = self.shield_rect()
+            shield_radius = rect.width // 2
+            self.shield_bubble = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.circle(self.shield_bubble, shield_color,
                                (shield_radius, shield_radius), shield_radius)
-            self.screen.blit(shield_surface,
-                             (self.player.rect.centerx - shield_radius,
-                              self.player.rect.centery - shield_radius))
+        return self.shield_bubble
+
+    def current_hud(self):
+        """hud_items(), rebuilt only every few drawn frames when the
+        quality tier asks for a slower HUD"""
+        self.hud_age -= 1
+        if self.hud is None or self.hud_age <= 0:
+            self.hud = self.hud_items()
+            self.hud_age = self.quality.settings["hud_interval"]
+        return self.hud
+
+    def hud_items(self):
+        """Everything drawn over the world, as (slot, surface, position).
+
+        Surfaces come from TEXT_CACHE or are built once, so an unchanged
+        item returns the very same surface object frame after frame.
+        """
+        items = []
 
         # Draw score and distance
-        score_text = self.font.render(
-            f"Score: {int(self.score)}", True, (30, 30, 30))
-        self.screen.blit(score_text, (10, 10))
+        score_text = TEXT_CACHE.render_field(
+            "score", "Score: ", int(self.score), "", (30, 30, 30))
+        items.append(("score", score_text, (10, 10)))
 
-        distance_text = self.font.render(
-            f"Distance: {int(self.distance)}m", True, (30, 30, 30))
-        self.screen.blit(distance_text, (10, 50))
+        distance_text = TEXT_CACHE.render_field(
+            "distance", "Distance: ", int(self.distance), "m", (30, 30, 30))
+        items.append(("distance", distance_text, (10, 50)))
 
         # Draw jetpack fuel info
         fuel_color = (0, 150, 0)  # Default green
@@ -564,24 +1075,26 @@ class Game:
         elif self.player.jetpack_fuel < 50:
             fuel_color = (200, 200, 50)  # Yellow when medium
 
-        fuel_text = self.font.render(
-            f"Jetpack: {int(self.player.jetpack_fuel)}%", True, fuel_color)
-        self.screen.blit(fuel_text, (10, 90))
+        fuel_text = TEXT_CACHE.render_field(
+            "fuel", "Jetpack: ", int(self.player.jetpack_fuel), "%", fuel_color)
+        items.append(("fuel", fuel_text, (10, 90)))
 
         # Draw shield timer if active
         if self.shield_active:
-            shield_text = self.small_font.render(
-                f"Shield: {self.shield_timer//60 + 1}s", True, (100, 100, 255))
-            self.screen.blit(shield_text, (10, 130))
+            shield_text = TEXT_CACHE.render_field(
+                "shield", "Shield: ", self.shield_timer//60 + 1, "s", (100, 100, 255),
+                size=self.small_font_size)
+            items.append(("shield", shield_text, (10, 130)))
 
         # Draw dash cooldown if available
         if self.player.can_dash:
-            dash_text = self.small_font.render(
-                "Dash: Ready", True, (0, 200, 0))
+            dash_text = TEXT_CACHE.render(
+                "Dash: Ready", (0, 200, 0), size=self.small_font_size)
         else:
-            dash_text = self.small_font.render(
-                f"Dash: {self.player.dash_cooldown//60 + 1}s", True, (150, 150, 150))
-        self.screen.blit(dash_text, (10, 160))
+            dash_text = TEXT_CACHE.render_field(
+                "dash", "Dash: ", self.player.dash_cooldown//60 + 1, "s", (150, 150, 150),
+                size=self.small_font_size)
+        items.append(("dash", dash_text, (10, 160)))
 
         # Draw controls info
         controls_text = [
@@ -591,84 +1104,232 @@ class Game:
         ]
 
         for i, control in enumerate(controls_text):
-            control_text = self.small_font.render(
-                f"{control['key']}: {control['action']}", True, (30, 30, 30))
-            self.screen.blit(control_text, (self.WIDTH - 450, 10 + i * 30))
+            control_text = TEXT_CACHE.render(
+                f"{control['key']}: {control['action']}", (30, 30, 30),
+                size=self.small_font_size)
+            items.append((f"control{i}", control_text,
+                          (self.WIDTH - 450, 10 + i * 30)))
 
         # Draw game over screen
         if self.game_over:
             # Semi-transparent overlay
-            overlay = pygame.Surface(
-                (self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
+            if self.game_over_overlay is None:
+                self.game_over_overlay = pygame.Surface(
+                    (self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+                self.game_over_overlay.fill((0, 0, 0, 128))
+            items.append(("overlay", self.game_over_overlay, (0, 0)))
 
             # Game over text
-            game_over_text = self.font.render("GAME OVER", True, (255, 50, 50))
+            game_over_text = TEXT_CACHE.render("GAME OVER", (255, 50, 50))
             game_over_rect = game_over_text.get_rect(
                 center=(self.WIDTH // 2, self.HEIGHT // 2 - 50))
-            self.screen.blit(game_over_text, game_over_rect)
+            items.append(("game_over", game_over_text, game_over_rect.topleft))
 
             # Final score
-            final_score_text = self.font.render(
-                f"Final Score: {int(self.score)}", True, (255, 255, 255))
+            final_score_text = TEXT_CACHE.render_field(
+                "final_score", "Final Score: ", int(self.score), "", (255, 255, 255))
             final_score_rect = final_score_text.get_rect(
                 center=(self.WIDTH // 2, self.HEIGHT // 2))
-            self.screen.blit(final_score_text, final_score_rect)
+            items.append(("final_score", final_score_text, final_score_rect.topleft))
 
             # Restart prompt (only show after delay)
             if self.game_over_delay <= 0:
-                restart_text = self.small_font.render(
-                    "Press 'R' to restart", True, (255, 255, 255))
+                restart_text = TEXT_CACHE.render(
+                    "Press 'R' to restart", (255, 255, 255), size=self.small_font_size)
                 restart_rect = restart_text.get_rect(
                     center=(self.WIDTH // 2, self.HEIGHT // 2 + 50))
-                self.screen.blit(restart_text, restart_rect)
+                items.append(("restart", restart_text, restart_rect.topleft))
 
         if any(isinstance(p, DeepfakePowerUp) and p.display_type == "obstacle" for p in self.powerups):
+            banner = self.deepfake_banner()
+            items.append(("deepfake_warning", banner,
+                          banner.get_rect(center=(self.WIDTH // 2, 50)).topleft))
+
+        # Frame timing overlay
+        if self.profiler and self.profiler.overlay:
+            items.append(("profiler", self.profiler.overlay_surface(self.small_font),
+                          (self.WIDTH - 450, self.HEIGHT - 300)))
+
+        return items
+
+    def deepfake_banner(self):
+        """Warning text on its red rounded background, built once"""
+        if self.deepfake_warning is None:
             # Text settings
             warning_message = "ALERTA: DEEPFAKE DETECTADO!"
             text_color = (255, 255, 255)  # White text
             bg_color = (200, 0, 0)  # Red background
-            
-            warning_text = self.font.render(warning_message, True, text_color)
-            warning_rect = warning_text.get_rect(center=(self.WIDTH // 2, 50))
-            
+
+            warning_text = TEXT_CACHE.render(warning_message, text_color)
+
             # Background behind text
             padding = 10
-            bg_rect = pygame.Rect(
-                warning_rect.left - padding, 
-                warning_rect.top - padding, 
-                warning_rect.width + (2 * padding), 
-                warning_rect.height + (2 * padding)
-            )
+            banner = pygame.Surface(
+                (warning_text.get_width() + 2 * padding,
+                 warning_text.get_height() + 2 * padding), pygame.SRCALPHA)
+            pygame.draw.rect(banner, bg_color, banner.get_rect(),
+                             border_radius=5)  # Red background with rounded corners
+            banner.blit(warning_text, (padding, padding))  # Render text over background
+            self.deepfake_warning = banner
+        return self.deepfake_warning
+
+    def draw_deepfake_indicators(self):
+        """Draw pointers to transforming deepfakes. Returns the touched rects"""
+        rects = []
+        if not any(isinstance(p, DeepfakePowerUp) and p.display_type == "obstacle" for p in self.powerups):
+            return rects
+
+        # Draw indicator for deepfake location
+        for powerup in self.powerups:
+            if isinstance(powerup, DeepfakePowerUp) and powerup.is_transforming:
+                rects.append(pygame.draw.line(self.screen, (255, 255, 255),
+                                              (self.WIDTH // 2, 80),
+                                              (powerup.rect.centerx, powerup.rect.y - 20),
+                                              3))
+                rects.append(pygame.draw.polygon(self.screen, (255, 255, 255), [
+                    (powerup.rect.centerx, powerup.rect.y - 25),
+                    (powerup.rect.centerx - 10, powerup.rect.y - 40),
+                    (powerup.rect.centerx + 10, powerup.rect.y - 40)
+                ]))
+        return rects
+
+    def draw_dirty(self):
+        """Dirty-rectangle variant of draw() over a static backdrop.
+
+        The parallax layers are frozen into the renderer's background, so only
+        moving elements, the scrolling ground strip and HUD items that changed
+        are redrawn and pushed to the display.
+        """
+        renderer = self.renderer
+        hud = self.current_hud()
+
+        # Nothing moves while the game over screen is idle, except the
+        # profiler overlay. That is translucent, so when it changes the
+        # scene under it is redrawn whole
+        state = (self.game_over, self.game_over_delay <= 0)
+        if state != renderer.state:
+            renderer.state = state
+            renderer.force_full = True
+        elif self.game_over:
+            overlay = [surface for slot, surface, _ in hud if slot == "profiler"]
+            shown = renderer.hud.get("profiler")
+            if not overlay or (shown and shown[0] is overlay[0]):
+                return
+            renderer.force_full = True
+
+        entities = self.obstacles + self.powerups + [self.whale, self.player]
+
+        # Bounds of everything drawn below the HUD this frame
+        world = [pygame.Rect(0, self.HEIGHT - 50, self.WIDTH, 50)]
+        if self.cloud_image:
+            world.extend(self.cloud_image.get_rect(topleft=(int(cloud['x']), cloud['y']))
+                         for cloud in self.clouds)
+        if self.tree_image:
+            world.extend(self.tree_image.get_rect(topleft=(int(tree['x']), tree['y']))
+                         for tree in self.trees)
+        for entity in entities:
+            margin = entity.draw_margin
+            world.append(entity.rect.inflate(2 * margin, 2 * margin))
+        world.extend(self.particles.bounds())
+        if self.shield_active:
+            world.append(self.shield_rect())
 
-            pygame.draw.rect(self.screen, bg_color, bg_rect, border_radius=5)  # Red background with rounded corners
-            self.screen.blit(warning_text, warning_rect)  # Render text over background
+        renderer.begin(world, hud)
 
-            # Draw indicator for deepfake location
-            for powerup in self.powerups:
-                if isinstance(powerup, DeepfakePowerUp) and powerup.is_transforming:
-                    pygame.draw.line(self.screen, (255, 255, 255),
-                                    (self.WIDTH // 2, 80),
-                                    (powerup.rect.centerx, powerup.rect.y - 20),
-                                    3)
-                    pygame.draw.polygon(self.screen, (255, 255, 255), [
-                        (powerup.rect.centerx, powerup.rect.y - 25),
-                        (powerup.rect.centerx - 10, powerup.rect.y - 40),
-                        (powerup.rect.centerx + 10, powerup.rect.y - 40)
-                    ])
-        pygame.display.flip()
-
-    def run(self):
-        running = True
-        while running:
-            running = self.handle_events()
-            if not self.game_over:
-                self.spawn_objects()
-                self.spawn_decorative_elements()
-            running = self.update() and running
-            self.draw()
-            self.clock.tick(self.FPS)
+        self.submit_world(self.queue)
+        self.queue.flush(self.screen)
+
+        renderer.draw_hud(hud)
+
+        for rect in self.draw_deepfake_indicators():
+            renderer.mark(rect)
 
+    def present(self):
+        if self.renderer:
+            self.renderer.present()
+        else:
+            pygame.display.flip()
+
+    def timed(self, phase, func, *args):
+        """Call func, recording its duration under `phase` when profiling"""
+        if not self.profiler:
+            return func(*args)
+        start = time.perf_counter()
+        result = func(*args)
+        self.profiler.record(phase, start)
+        return result
+
+    def step(self, frame_input=None):
+        """Advance the simulation by one frame. Returns False on quit"""
+        # Secondary assets are converted on this (the main) thread once
+        # read_secondary has read them
+        if self.loader and not self.loader.is_alive():
+            self.loader = None
+            self.load_secondary()
+        running = self.timed("events", self.handle_events, frame_input)
+        self.frame += 1
+        if not self.game_over:
+            self.timed("spawn", self.spawn_objects)
+            self.timed("decor", self.spawn_decorative_elements)
+        return self.timed("update", self.update) and running
+
+    def simulate(self, frames, script=None):
+        """Step the simulation `frames` times as fast as possible, without drawing.
+
+        script(frame) returns the FrameInput for each frame; with no script
+        the player does nothing.
+        """
+        for frame in range(frames):
+            frame_start = time.perf_counter()
+            frame_input = script(frame) if script else NO_INPUT
+            running = self.step(frame_input)
+            if self.profiler:
+                self.profiler.end_frame(frame_start)
+            if not running:
+                break
+
+    def shutdown(self):
+        """Write out the replay recording and profile report, if enabled"""
+        if self.recorder:
+            self.recorder.save(self.record_to)
+        if self.profiler:
+            self.profiler.finish()
+        if self.frame_exporter:
+            self.frame_exporter.close()
+
+    def run(self, script=None, frames=None):
+        # With a script (e.g. Replay.input_for) the keyboard is ignored, but
+        # closing the window still ends the run.
+        # The simulation runs in fixed ticks, as many per rendered frame as
+        # wall-clock time calls for (none on a fast display, several on a
+        # slow machine); headless runs just tick as fast as possible.
+        timestep = FixedTimestep(self.FPS)
+        running = True
+        while running and (frames is None or self.frame < frames):
+            frame_start = time.perf_counter()
+            if script:
+                running = not any(event.type == pygame.QUIT
+                                  for event in pygame.event.get())
+            ticks = 1 if self.headless else timestep.ticks()
+            for _ in range(ticks):
+                if not running or (frames is not None and self.frame >= frames):
+                    break
+                frame_input = script(self.frame) if script else None
+                if not self.headless:
+                    self.remember_positions()
+                running = self.step(frame_input) and running
+            if not self.headless:
+                self.timed("draw", self.draw, timestep.alpha)
+                self.timed("flip", self.present)
+                # Work time only: sleeping in clock.tick is not load
+                self.quality.observe(time.perf_counter() - frame_start)
+                if self.startup_profiler and not self.startup_profiler.reported:
+                    self.startup_profiler.first_frame()
+            if self.profiler:
+                self.profiler.end_frame(frame_start)
+            if not self.headless and self.render_fps:
+                self.clock.tick(self.render_fps)
+
+        self.shutdown()
         pygame.quit()
         sys.exit()
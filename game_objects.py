@@ -2,10 +2,32 @@ import pygame
 import random
 import math
 
+from sprite_cache import SPRITES
+from text_cache import TEXT_CACHE
+
+# Simulated milliseconds per frame. Animations run on frame counts instead of
+# wall-clock time so a run plays out the same at any simulation speed
+FRAME_MS = 1000 / 60
+
+# Rotating details are pre-rendered at this many angles
+ANGLE_STEPS = 60
+
+
+def quantize_angle(angle):
+    return int(angle * ANGLE_STEPS / 360) % ANGLE_STEPS
+
 
 class DeepfakePowerUp:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 30, 30)
+    # Pixels desenhados fora do rect em cada lado (o ruído do glitch vai mais longe)
+    draw_margin = 50
+
+    def __init__(self, x, y, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=random):
+        self.rect.update(x, y, 30, 30)
+        self.moved = (0, 0)  # movimento do último frame, para colisões contínuas
         # Inicialmente aparece como um power-up de pontos dourados
         self.display_type = "bonus"  # Tipo mostrado ao jogador: "bonus" ou "obstacle"
         # O tipo verdadeiro (sempre será um obstáculo)
@@ -26,20 +48,25 @@ class DeepfakePowerUp:
         # Animação de movimento
         self.base_y = y
         self.float_offset = 0
-        self.float_speed = random.uniform(0.03, 0.07)
+        self.float_speed = rng.uniform(0.03, 0.07)
+        self.age = 0  # frames since spawn
 
         # Rotação
         self.angle = 0
-        self.rotation_speed = random.uniform(1, 2)
+        self.rotation_speed = rng.uniform(1, 2)
 
     def update(self, speed, player_rect):
+        start = self.rect.topleft
+
         # Movimento básico - mantém a mesma velocidade que outros objetos
         self.rect.x -= speed
 
         # Animação de flutuação
+        self.age += 1
         self.float_offset = math.sin(
-            pygame.time.get_ticks() * self.float_speed) * 8
+            self.age * FRAME_MS * self.float_speed) * 8
         self.rect.y = self.base_y + int(self.float_offset)
+        self.moved = (self.rect.x - start[0], self.rect.y - start[1])
 
         # Rotação
         self.angle += self.rotation_speed
@@ -88,28 +115,22 @@ class DeepfakePowerUp:
                 self.display_type = self.real_type
                 self.is_transforming = False
 
-    def draw(self, screen):
+    def blits(self):
         # Base de desenho dependendo do tipo atual
         if self.display_type == "bonus":
             base_color = self.color
         else:
             base_color = self.real_color
 
-        # Efeito de glitch
+        # Efeito de glitch (puramente visual: usa o random global para não
+        # alterar a sequência do RNG da simulação)
         if self.is_transforming:
             # Alterna entre aparências ou distorce durante o glitch
+            # Os blocos corrompidos e as linhas de ruído em volta são
+            # partículas (Game.update_effects)
             if random.random() < 0.5 * self.glitch_intensity:
                 # Ocasionalmente mostra a aparência real durante o glitch
                 glitch_color = self.real_color
-
-                # Desenha retângulos aleatórios para simular corrupção visual
-                for _ in range(3):
-                    glitch_x = self.rect.x + random.randint(-10, 10)
-                    glitch_y = self.rect.y + random.randint(-10, 10)
-                    glitch_w = random.randint(5, 20)
-                    glitch_h = random.randint(5, 15)
-                    pygame.draw.rect(screen, (random.randint(100, 255), random.randint(0, 100), random.randint(0, 100)),
-                                     (glitch_x, glitch_y, glitch_w, glitch_h))
             else:
                 glitch_color = base_color
 
@@ -122,158 +143,196 @@ class DeepfakePowerUp:
             # Desenha o objeto principal (círculo para bônus, retângulo para obstáculo)
             if random.random() < self.glitch_intensity * 0.3:
                 # Às vezes mostra a forma real durante o glitch
-                pygame.draw.rect(screen, glitch_color,
-                                 (self.rect.x + offset_x, self.rect.y + offset_y,
-                                  self.rect.width, self.rect.height))
-            else:
-                pygame.draw.circle(screen, glitch_color,
-                                   (self.rect.centerx + offset_x, self.rect.centery + offset_y), 15)
-
-            # Linhas de ruído para o efeito de glitch
-            if random.random() < self.glitch_intensity:
-                for _ in range(int(5 * self.glitch_intensity)):
-                    noise_x1 = self.rect.x + random.randint(-20, 20)
-                    noise_y1 = self.rect.y + random.randint(-20, 20)
-                    noise_x2 = noise_x1 + random.randint(10, 30)
-                    noise_y2 = noise_y1 + random.randint(-10, 10)
-                    noise_color = (random.randint(200, 255), random.randint(
-                        0, 100), random.randint(0, 100))
-                    pygame.draw.line(
-                        screen, noise_color, (noise_x1, noise_y1), (noise_x2, noise_y2), 2)
+                sprite = SPRITES.get(("glitch_rect", glitch_color), self.rect.size, 0,
+                                     lambda screen, rect: pygame.draw.rect(screen, glitch_color, rect))
+                return [(sprite, (self.rect.x + offset_x, self.rect.y + offset_y))]
+            # Círculo de raio 15 centrado num sprite de 32x32
+            sprite = SPRITES.get(("glitch_circle", glitch_color), (32, 32), 0,
+                                 lambda screen, rect: pygame.draw.circle(screen, glitch_color, rect.center, 15))
+            return [(sprite, (self.rect.centerx + offset_x - 16,
+                              self.rect.centery + offset_y - 16))]
+        # Desenho normal (sem glitch): sprite pré-renderizado
+        return [self.hit_sprite()]
+
+    def hit_sprite(self):
+        # A colisão usa a aparência atual sem o glitch, que é aleatório
+        return SPRITES.entry(("deepfake", self.display_type),
+                             self.rect, 0, self.paint)
+
+    def paint(self, screen, rect):
+        if self.display_type == "bonus":
+            # Desenha como um bônus (círculo dourado)
+            pygame.draw.circle(screen, self.color, rect.center, 15)
+
+            # Símbolo $ para indicar bônus/moeda
+            text = TEXT_CACHE.render("$", (255, 255, 255), None, 30)
+            text_rect = text.get_rect(center=rect.center)
+            screen.blit(text, text_rect)
         else:
-            # Desenho normal (sem glitch)
-            if self.display_type == "bonus":
-                # Desenha como um bônus (círculo dourado)
-                pygame.draw.circle(screen, base_color, self.rect.center, 15)
-
-                # Símbolo $ para indicar bônus/moeda
-                font = pygame.font.Font(None, 30)
-                text = font.render("$", True, (255, 255, 255))
-                text_rect = text.get_rect(center=self.rect.center)
-                screen.blit(text, text_rect)
-            else:
-                # Desenha como obstáculo (retângulo vermelho)
-                pygame.draw.rect(screen, base_color, self.rect)
+            # Desenha como obstáculo (retângulo vermelho)
+            pygame.draw.rect(screen, self.real_color, rect)
 
-                # X para representar perigo
-                pygame.draw.line(screen, (255, 255, 255),
-                                 (self.rect.x + 5, self.rect.y + 5),
-                                 (self.rect.x + self.rect.width - 5, self.rect.y + self.rect.height - 5), 2)
-                pygame.draw.line(screen, (255, 255, 255),
-                                 (self.rect.x + 5, self.rect.y +
-                                  self.rect.height - 5),
-                                 (self.rect.x + self.rect.width - 5, self.rect.y + 5), 2)
+            # X para representar perigo
+            pygame.draw.line(screen, (255, 255, 255),
+                             (rect.x + 5, rect.y + 5),
+                             (rect.x + rect.width - 5, rect.y + rect.height - 5), 2)
+            pygame.draw.line(screen, (255, 255, 255),
+                             (rect.x + 5, rect.y +
+                              rect.height - 5),
+                             (rect.x + rect.width - 5, rect.y + 5), 2)
 
 
 class Obstacle:
-    def __init__(self, x, y):
+    # Pixels drawn outside rect on each side
+    draw_margin = 0
+
+    def __init__(self, x, y, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=random):
         # Randomize obstacle appearance
-        self.type = random.choice(["server", "competitor", "regulation"])
+        self.type = rng.choice(["server", "competitor", "regulation"])
 
         # Set size based on type
         if self.type == "server":
             width = 30
-            height = random.randint(60, 90)
+            height = rng.randint(60, 90)
             self.color = (150, 150, 150)  # Gray for servers
         elif self.type == "competitor":
             width = 40
-            height = random.randint(40, 70)
+            height = rng.randint(40, 70)
             self.color = (150, 0, 0)  # Red for competitors
         else:  # regulation
             width = 50
-            height = random.randint(30, 50)
+            height = rng.randint(30, 50)
             self.color = (0, 0, 150)  # Blue for regulations
 
         # Adjust to sit on ground correctly
         # This places the bottom of the obstacle at ground level (y)
-        self.rect = pygame.Rect(x, y - height, width, height)
+        self.rect.update(x, y - height, width, height)
+        self.moved = (0, 0)  # last frame's motion, for swept collisions
 
         # Animation variables
         self.animation_frame = 0
         self.animation_speed = 0.1
 
     def update(self, speed):
+        x = self.rect.x
         self.rect.x -= speed
+        self.moved = (self.rect.x - x, 0)
 
         # Simple animation
         self.animation_frame += self.animation_speed
         if self.animation_frame >= 4:
             self.animation_frame = 0
 
-    def draw(self, screen):
+    def light_on(self):
+        return int(self.animation_frame * 4) % 2 == 0
+
+    def hit_sprite(self):
+        # Only servers animate (blinking light)
+        light = self.light_on() if self.type == "server" else None
+        return SPRITES.entry(("obstacle", self.type, self.rect.size, light),
+                             self.rect, 0, self.paint)
+
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
         # Draw base obstacle
-        pygame.draw.rect(screen, self.color, self.rect)
+        pygame.draw.rect(screen, self.color, rect)
 
         # Add details based on type
         if self.type == "server":
             # Draw server lights
-            light_color = (0, 255, 0) if int(
-                self.animation_frame * 4) % 2 == 0 else (255, 0, 0)
+            light_color = (0, 255, 0) if self.light_on() else (255, 0, 0)
             pygame.draw.circle(screen, light_color,
-                               (self.rect.x + self.rect.width//2, self.rect.y + 10), 3)
+                               (rect.x + rect.width//2, rect.y + 10), 3)
 
         elif self.type == "competitor":
             # Draw competitor logo
             pygame.draw.line(screen, (255, 255, 255),
-                             (self.rect.x + 10, self.rect.y + 15),
-                             (self.rect.x + self.rect.width - 10, self.rect.y + 15), 2)
+                             (rect.x + 10, rect.y + 15),
+                             (rect.x + rect.width - 10, rect.y + 15), 2)
 
         else:  # regulation
             # Draw regulation symbol
             pygame.draw.line(screen, (255, 255, 255),
-                             (self.rect.x + 10, self.rect.y + 10),
-                             (self.rect.x + self.rect.width - 10, self.rect.y + 25), 2)
+                             (rect.x + 10, rect.y + 10),
+                             (rect.x + rect.width - 10, rect.y + 25), 2)
             pygame.draw.line(screen, (255, 255, 255),
-                             (self.rect.x + 10, self.rect.y + 25),
-                             (self.rect.x + self.rect.width - 10, self.rect.y + 10), 2)
+                             (rect.x + 10, rect.y + 25),
+                             (rect.x + rect.width - 10, rect.y + 10), 2)
 
 
 class JetpackFuel:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 25, 25)
+    draw_margin = 0
+
+    def __init__(self, x, y, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=random):
+        self.rect.update(x, y, 25, 25)
         self.color = (255, 150, 0)  # Orange
-        self.fuel_amount = random.randint(20, 35)
+        self.fuel_amount = rng.randint(20, 35)
 
         # Floating animation
         self.base_y = y
         self.float_offset = 0
-        self.float_speed = random.uniform(0.05, 0.1)
+        self.float_speed = rng.uniform(0.05, 0.1)
+        self.age = 0  # frames since spawn
 
     def update(self, speed):
         self.rect.x -= speed
 
         # Floating effect
+        self.age += 1
         self.float_offset = math.sin(
-            pygame.time.get_ticks() * self.float_speed) * 8
+            self.age * FRAME_MS * self.float_speed) * 8
         self.rect.y = self.base_y + int(self.float_offset)
 
-    def draw(self, screen):
+    def hit_sprite(self):
+        return SPRITES.entry(("fuel",), self.rect, 0, self.paint)
+
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
         # Draw as a fuel canister
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=5)
+        pygame.draw.rect(screen, self.color, rect, border_radius=5)
 
         # Draw fuel symbol
         pygame.draw.line(screen, (255, 255, 255),
-                         (self.rect.centerx, self.rect.y + 5),
-                         (self.rect.centerx, self.rect.y + self.rect.height - 5), 2)
+                         (rect.centerx, rect.y + 5),
+                         (rect.centerx, rect.y + rect.height - 5), 2)
         pygame.draw.line(screen, (255, 255, 255),
-                         (self.rect.centerx - 5, self.rect.y + 10),
-                         (self.rect.centerx + 5, self.rect.y + 10), 2)
+                         (rect.centerx - 5, rect.y + 10),
+                         (rect.centerx + 5, rect.y + 10), 2)
 
 
 class InvestmentBonus:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 30, 30)
+    draw_margin = 0
+
+    def __init__(self, x, y, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=random):
+        self.rect.update(x, y, 30, 30)
         self.color = (50, 200, 50)  # Green
-        self.points = random.randint(5, 15) * 10
+        self.points = rng.randint(5, 15) * 10
 
         # Rotation animation
         self.angle = 0
-        self.rotation_speed = random.uniform(2, 4)
+        self.rotation_speed = rng.uniform(2, 4)
 
         # Floating animation
         self.base_y = y
         self.float_offset = 0
-        self.float_speed = random.uniform(0.03, 0.07)
+        self.float_speed = rng.uniform(0.03, 0.07)
+        self.age = 0  # frames since spawn
 
     def update(self, speed):
         self.rect.x -= speed
@@ -284,26 +343,39 @@ class InvestmentBonus:
             self.angle = 0
 
         # Floating effect
+        self.age += 1
         self.float_offset = math.sin(
-            pygame.time.get_ticks() * self.float_speed) * 10
+            self.age * FRAME_MS * self.float_speed) * 10
         self.rect.y = self.base_y + int(self.float_offset)
 
-    def draw(self, screen):
+    def hit_sprite(self):
+        return SPRITES.entry(("coin", self.color), self.rect, 0, self.paint)
+
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
         # Draw as a dollar sign
         pygame.draw.circle(screen, self.color,
-                           (self.rect.centerx, self.rect.centery), 15)
+                           (rect.centerx, rect.centery), 15)
 
         # Draw $ symbol
-        font = pygame.font.Font(None, 30)
-        text = font.render("$", True, (255, 255, 255))
+        text = TEXT_CACHE.render("$", (255, 255, 255), None, 30)
         text_rect = text.get_rect(
-            center=(self.rect.centerx, self.rect.centery))
+            center=(rect.centerx, rect.centery))
         screen.blit(text, text_rect)
 
 
 class ShieldPowerUp:
+    # The pulsing ring can grow past the 25px hitbox
+    draw_margin = 4
+
     def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 25, 25)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.rect.update(x, y, 25, 25)
         self.color = (100, 100, 255)  # Blue
         self.duration = 4  # seconds
 
@@ -319,20 +391,36 @@ class ShieldPowerUp:
         if self.pulse >= 1 or self.pulse <= 0:
             self.pulse_direction *= -1
 
-    def draw(self, screen):
+    def pulse_size(self):
+        return 12 + int(self.pulse * 3)
+
+    def hit_sprite(self):
+        return SPRITES.entry(("shield", self.pulse_size()),
+                             self.rect, self.draw_margin, self.paint)
+
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
         # Draw as a shield
-        size = 12 + int(self.pulse * 3)
+        size = self.pulse_size()
         pygame.draw.circle(screen, self.color,
-                           (self.rect.centerx, self.rect.centery), size, width=3)
+                           (rect.centerx, rect.centery), size, width=3)
 
         # Inner circle
         pygame.draw.circle(screen, (200, 200, 255),
-                           (self.rect.centerx, self.rect.centery), 8)
+                           (rect.centerx, rect.centery), 8)
 
 
 class MagnetPowerUp:
+    draw_margin = 0
+
     def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 30, 30)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.rect.update(x, y, 30, 30)
         self.color = (200, 50, 50)  # Red magnet
         self.duration = 10  # Seconds
 
@@ -340,27 +428,40 @@ class MagnetPowerUp:
         # Move left with the game speed
         self.rect.x -= speed
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, self.rect)  # Magnet body
-        pygame.draw.line(screen, (0, 0, 0), (self.rect.centerx - 10, self.rect.centery),
-                         (self.rect.centerx + 10, self.rect.centery), 3)  # Magnet poles
+    def hit_sprite(self):
+        return SPRITES.entry(("magnet",), self.rect, 0, self.paint)
+
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
+        pygame.draw.rect(screen, self.color, rect)  # Magnet body
+        pygame.draw.line(screen, (0, 0, 0), (rect.centerx - 10, rect.centery),
+                         (rect.centerx + 10, rect.centery), 3)  # Magnet poles
 
 
 class DoublePointsPowerUp:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 30, 30)  # Hitbox for collision
+    draw_margin = 0
+
+    def __init__(self, x, y, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=random):
+        self.rect.update(x, y, 30, 30)  # Hitbox for collision
         self.color = (255, 215, 0)  # Gold color for the coin
-        self.points = random.randint(5, 15) * 10  # Points awarded
+        self.points = rng.randint(5, 15) * 10  # Points awarded
         self.duration = 10  # Duration of the double points effect in seconds
 
         # Rotation animation (slower)
         self.angle = 0
-        self.rotation_speed = random.uniform(1, 2)  # Reduced rotation speed
+        self.rotation_speed = rng.uniform(1, 2)  # Reduced rotation speed
 
         # Floating animation (slower)
         self.base_y = y
         self.float_offset = 0
-        self.float_speed = random.uniform(0.01, 0.03)  # Reduced floating speed
+        self.float_speed = rng.uniform(0.01, 0.03)  # Reduced floating speed
+        self.age = 0  # frames since spawn
 
     def update(self, speed):
         # Move left with the game speed (slower)
@@ -373,29 +474,44 @@ class DoublePointsPowerUp:
             self.angle = 0
 
         # Floating animation
+        self.age += 1
         self.float_offset = math.sin(
-            pygame.time.get_ticks() * self.float_speed) * 8  # Reduced amplitude
+            self.age * FRAME_MS * self.float_speed) * 8  # Reduced amplitude
         self.rect.y = self.base_y + int(self.float_offset)
 
-    def draw(self, screen):
+    def hit_sprite(self):
+        return SPRITES.entry(("coin", self.color), self.rect, 0, self.paint)
+
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
         # Draw the coin (golden circle)
-        pygame.draw.circle(screen, self.color, self.rect.center, 15)
+        pygame.draw.circle(screen, self.color, rect.center, 15)
 
-        # Draw the "$" symbol in the center
-        font = pygame.font.Font(None, 30)  # Use a smaller font for the symbol
-        text = font.render("$", True, (255, 255, 255))  # White "$" symbol
-        text_rect = text.get_rect(center=self.rect.center)
+        # Draw the "$" symbol in the center (white, smaller default font)
+        text = TEXT_CACHE.render("$", (255, 255, 255), None, 30)
+        text_rect = text.get_rect(center=rect.center)
         screen.blit(text, text_rect)
 
 
 class FlyingDrone:
-    def __init__(self, x, y, game_height):
-        self.rect = pygame.Rect(x, y, 40, 40)  # Hitbox for collision
+    # Propellers stick out 5px past the hitbox
+    draw_margin = 6
+
+    def __init__(self, x, y, game_height, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, game_height, rng)
+
+    def reset(self, x, y, game_height, rng=random):
+        self.rect.update(x, y, 40, 40)  # Hitbox for collision
+        self.moved = (0, 0)  # last frame's motion, for swept collisions
         self.game_height = game_height  # Store game height for bounds checking
-        self.speed_x = random.choice([-2, 2])  # Horizontal movement
-        self.speed_y = random.choice([-2, 2])  # Vertical movement
+        self.speed_x = rng.choice([-2, 2])  # Horizontal movement
+        self.speed_y = rng.choice([-2, 2])  # Vertical movement
 
     def update(self, game_speed):
+        start = self.rect.topleft
         self.rect.x -= game_speed  # Move left with the game
         self.rect.x += self.speed_x  # Horizontal movement
         self.rect.y += self.speed_y  # Vertical movement
@@ -407,33 +523,46 @@ class FlyingDrone:
         if self.rect.bottom > self.game_height - 50:  # Don't go too low
             self.rect.bottom = self.game_height - 50
             self.speed_y *= -1
+        self.moved = (self.rect.x - start[0], self.rect.y - start[1])
+
+    def hit_sprite(self):
+        return SPRITES.entry(("drone",), self.rect, self.draw_margin, self.paint)
 
-    def draw(self, screen):
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
         # Drone body (central circle)
         pygame.draw.circle(screen, (100, 100, 100),
-                           self.rect.center, 15)  # Gray body
+                           rect.center, 15)  # Gray body
 
         # Propellers (4 small circles)
         propeller_color = (150, 150, 150)  # Dark gray
         pygame.draw.circle(screen, propeller_color,
-                           (self.rect.centerx - 20, self.rect.centery), 5)  # Left
+                           (rect.centerx - 20, rect.centery), 5)  # Left
         pygame.draw.circle(screen, propeller_color,
-                           (self.rect.centerx + 20, self.rect.centery), 5)  # Right
+                           (rect.centerx + 20, rect.centery), 5)  # Right
         pygame.draw.circle(screen, propeller_color,
-                           (self.rect.centerx, self.rect.centery - 20), 5)  # Top
+                           (rect.centerx, rect.centery - 20), 5)  # Top
         pygame.draw.circle(screen, propeller_color,
-                           (self.rect.centerx, self.rect.centery + 20), 5)  # Bottom
+                           (rect.centerx, rect.centery + 20), 5)  # Bottom
 
         # Lights (small colored circles)
-        pygame.draw.circle(screen, (255, 0, 0), (self.rect.centerx -
-                           10, self.rect.centery - 10), 3)  # Red light
-        pygame.draw.circle(screen, (0, 255, 0), (self.rect.centerx +
-                           10, self.rect.centery - 10), 3)  # Green light
+        pygame.draw.circle(screen, (255, 0, 0), (rect.centerx -
+                           10, rect.centery - 10), 3)  # Red light
+        pygame.draw.circle(screen, (0, 255, 0), (rect.centerx +
+                           10, rect.centery - 10), 3)  # Green light
 
 
 class TimeSlowPowerUp:
+    draw_margin = 0
+
     def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, 30, 30)  # Hitbox for collision
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.rect.update(x, y, 30, 30)  # Hitbox for collision
         self.color = (50, 50, 200)  # Blue color for the watch
         self.duration = 5  # Duration of the time slow effect in seconds
 
@@ -450,52 +579,77 @@ class TimeSlowPowerUp:
         if self.angle >= 360:
             self.angle = 0
 
-    def draw(self, screen):
+    def hit_sprite(self):
+        return SPRITES.entry(("clock", quantize_angle(self.angle)),
+                             self.rect, 0, self.paint)
+
+    def blits(self):
+        return [self.hit_sprite()]
+
+    def paint(self, screen, rect):
         # Draw the watch body (circle)
-        pygame.draw.circle(screen, self.color, self.rect.center, 15)
+        pygame.draw.circle(screen, self.color, rect.center, 15)
 
         # Draw the clock face (inner circle)
-        pygame.draw.circle(screen, (200, 200, 255), self.rect.center, 12)
+        pygame.draw.circle(screen, (200, 200, 255), rect.center, 12)
+
+        # Draw the clock hands at the quantized angle
+        angle = quantize_angle(self.angle) * 360 / ANGLE_STEPS
 
-        # Draw the clock hands
         # Hour hand
         hour_hand_length = 8
-        hour_hand_angle = math.radians(self.angle)
+        hour_hand_angle = math.radians(angle)
         hour_hand_end = (
-            self.rect.centerx + hour_hand_length * math.cos(hour_hand_angle),
-            self.rect.centery - hour_hand_length * math.sin(hour_hand_angle)
+            rect.centerx + hour_hand_length * math.cos(hour_hand_angle),
+            rect.centery - hour_hand_length * math.sin(hour_hand_angle)
         )
-        pygame.draw.line(screen, (0, 0, 0), self.rect.center, hour_hand_end, 2)
+        pygame.draw.line(screen, (0, 0, 0), rect.center, hour_hand_end, 2)
 
         # Minute hand
         minute_hand_length = 12
-        minute_hand_angle = math.radians(self.angle * 2)  # Rotate faster
+        minute_hand_angle = math.radians(angle * 2)  # Rotate faster
         minute_hand_end = (
-            self.rect.centerx + minute_hand_length *
+            rect.centerx + minute_hand_length *
             math.cos(minute_hand_angle),
-            self.rect.centery - minute_hand_length *
+            rect.centery - minute_hand_length *
             math.sin(minute_hand_angle)
         )
-        pygame.draw.line(screen, (0, 0, 0), self.rect.center,
+        pygame.draw.line(screen, (0, 0, 0), rect.center,
                          minute_hand_end, 2)
 
 
 class LaserBeam:
+    draw_margin = 0
+
     def __init__(self, x, y, game_width):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, game_width)
+
+    def reset(self, x, y, game_width):
         # Thin beam spanning the screen width
-        self.rect = pygame.Rect(x, y, game_width, 5)
+        self.rect.update(x, y, game_width, 5)
+        self.moved = (0, 0)  # last frame's motion, for swept collisions
         self.color = (255, 0, 0)  # Red laser
         self.active = False
         self.timer = 0
 
     def update(self, game_speed):
+        x = self.rect.x
         if not self.active:
             self.timer += 1
             if self.timer >= 60:  # Activate after 1 second
                 self.active = True
         else:
             self.rect.x -= game_speed  # Move left with the game
+        self.moved = (self.rect.x - x, 0)
+
+    def hit_sprite(self):
+        # Lasers hit while still warming up, before they are drawn
+        return SPRITES.entry(("laser", self.rect.size, self.color), self.rect, 0,
+                             lambda screen, rect: screen.fill(self.color))
 
-    def draw(self, screen):
-        if self.active:
-            pygame.draw.rect(screen, self.color, self.rect)  # Draw laser
+    def blits(self):
+        if not self.active:
+            return []
+        # Draw laser
+        return [self.hit_sprite()]
@@ -1,8 +1,104 @@
 #!/usr/bin/env python3
-import sys
-import pygame
-from game import Game
+import time
+
+# Taken before the heavy imports (pygame, numpy) for --profile-startup
+STARTED = time.perf_counter()
+
+import argparse  # noqa: E402
+
+from frame_export import FrameExporter  # noqa: E402
+from game import Game  # noqa: E402
+from profiler import FrameProfiler, StartupProfiler  # noqa: E402
+from quality import QUALITY_TIERS, QualityGovernor  # noqa: E402
+from replay import Replay  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sam Altman's DeepSeek Escape")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate without a window, sound or frame cap")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="with --headless, stop after this many frames")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for a reproducible run")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="record this run's input to a replay file")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="play back a recorded replay file")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="time each frame phase and write p50/p95/p99 "
+                             "to PATH (.json or .csv) on exit")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print a time-to-first-frame breakdown")
+    parser.add_argument("--profile-overlay", action="store_true",
+                        help="show live frame phase timings on screen")
+    parser.add_argument("--dirty", action="store_true",
+                        help="static background with dirty-rectangle updates, "
+                             "for low-end machines")
+    parser.add_argument("--quality", default="auto",
+                        choices=["auto"] + [tier["name"] for tier in QUALITY_TIERS],
+                        help="rendering detail; auto steps it down when frames "
+                             "take too long and back up when they are fast again")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="move obstacles and power-ups with NumPy arrays")
+    parser.add_argument("--tick-rate", type=int, default=60,
+                        help="simulation ticks per second; the game is tuned "
+                             "for 60, other rates change its speed")
+    parser.add_argument("--render-fps", type=int, default=60,
+                        help="cap on rendered frames per second, "
+                             "interpolated between ticks (0 = uncapped)")
+    parser.add_argument("--export-frames", metavar="NAME", default=None,
+                        help="copy every drawn frame into the shared memory "
+                             "block NAME (see frame_export.FrameReader)")
+    parser.add_argument("--export-downsample", type=int, default=1,
+                        help="keep every Nth pixel of exported frames")
+    parser.add_argument("--export-gray", action="store_true",
+                        help="export grayscale frames")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    args = parse_args()
+    startup_profiler = None
+    if args.profile_startup:
+        startup_profiler = StartupProfiler(STARTED)
+        startup_profiler.mark("imports")
+    seed = args.seed
+    script = None
+    frames = args.frames
+    if args.replay:
+        try:
+            replay = Replay.load(args.replay)
+        except ValueError as error:
+            raise SystemExit(f"Cannot play {args.replay}: {error}")
+        seed = replay.seed
+        script = replay.input_for
+        if frames is None:
+            frames = len(replay)
+
+    profiler = None
+    if args.profile or args.profile_overlay:
+        profiler = FrameProfiler(overlay=args.profile_overlay,
+                                 export_path=args.profile)
+
+    names = [tier["name"] for tier in QUALITY_TIERS]
+    if args.quality == "auto":
+        quality = QualityGovernor(target_fps=args.render_fps or 60)
+    else:
+        quality = QualityGovernor(tier=names.index(args.quality), adaptive=False)
+
+    exporter = None
+    if args.export_frames:
+        exporter = FrameExporter((1200, 600), args.export_downsample,
+                                 args.export_gray, name=args.export_frames)
+
+    game = Game(headless=args.headless, seed=seed, record_to=args.record,
+                profiler=profiler, dirty_rendering=args.dirty,
+                vectorized=args.vectorized, tick_rate=args.tick_rate,
+                render_fps=args.render_fps, frame_exporter=exporter,
+                startup_profiler=startup_profiler, quality=quality)
+    if args.headless and frames is not None:
+        game.simulate(frames, script)
+        game.shutdown()
+    else:
+        game.run(script, frames)
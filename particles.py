@@ -0,0 +1,181 @@
+import numpy as np
+import pygame
+
+
+# Rows of ParticleSystem.data, one column per particle
+X, Y, VX, VY, GRAVITY, LIFE, SPRITE, GROUP = range(8)
+
+
+class Emitter:
+    """Recipe for one kind of particle: its pre-rendered sprites, where
+    around the emission point it appears, its velocity and lifetime ranges
+    (in ticks) and how many are emitted per tick. Made by
+    ParticleSystem.emitter, which owns the sprites."""
+
+    def __init__(self, group, sprite_ids, rate, spread, velocity, gravity, life):
+        self.rate = rate
+        x0, y0, x1, y1 = spread  # box around the emission point
+        (vx0, vx1), (vy0, vy1) = velocity
+        shortest, longest = life  # in ticks
+        # A new particle's column is low + uniform(0, 1) * span, row by row;
+        # life and sprite are floored afterwards
+        self.low = np.array([x0, y0, vx0, vy0, gravity, shortest,
+                             sprite_ids.start, group], float)[:, None]
+        self.span = np.array([x1 - x0, y1 - y0, vx1 - vx0, vy1 - vy0, 0,
+                              longest - shortest + 1, len(sprite_ids), 0], float)[:, None]
+
+
+class ParticleSystem:
+    """Cosmetic particles in a preallocated NumPy array.
+
+    Particles are emitted, moved and expired in bulk, and drawn in a single
+    screen.blits call from sprites rendered once when their emitter is
+    made. `capacity` is a global cap: emissions beyond it are dropped, so
+    effects cost a bounded amount per frame however many sources there
+    are. Randomness comes from the system's own generator, never from the
+    simulation's.
+    """
+
+    def __init__(self, capacity=512, seed=None):
+        self.capacity = capacity
+        self.rng = np.random.default_rng(seed)
+        self.data = np.zeros((8, capacity))
+        self.count = 0
+
+        self.sprites = []
+        self.sprite_sizes = []
+        self.groups = 0
+
+    def emitter(self, sprites, rate=1, spread=(0, 0, 0, 0),
+                velocity=((0, 0), (0, 0)), gravity=0, life=(10, 10)):
+        first = len(self.sprites)
+        self.sprites.extend(sprites)
+        self.sprite_sizes.extend(sprite.get_size() for sprite in sprites)
+        self.groups += 1
+        return Emitter(self.groups - 1, range(first, len(self.sprites)), rate,
+                       spread, velocity, gravity, life)
+
+    def seed(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def emit(self, emitter, x, y, ticks=1, intensity=1.0):
+        """Emit `ticks` ticks' worth of particles at (x, y), scaled by
+        intensity. To emit for many sources in one call, pass x, y and
+        intensity as equal-length sequences. Returns how many fitted under
+        the cap"""
+        expected = emitter.rate * ticks * np.asarray(intensity, float).reshape(-1)
+        per_source = expected.astype(int)
+        per_source += self.rng.random(len(expected)) < expected - per_source
+        n = min(int(per_source.sum()), self.capacity - self.count)
+        if n <= 0:
+            return 0
+
+        new = emitter.low + self.rng.random((8, n)) * emitter.span
+        if len(per_source) == 1:
+            new[X] += x
+            new[Y] += y
+        else:
+            source = np.repeat(np.arange(len(per_source)), per_source)[:n]
+            new[X] += np.asarray(x, float)[source]
+            new[Y] += np.asarray(y, float)[source]
+        np.floor(new[LIFE:SPRITE + 1], out=new[LIFE:SPRITE + 1])
+        self.data[:, self.count:self.count + n] = new
+        self.count += n
+        return n
+
+    def update(self, ticks=1):
+        """Advance every particle by `ticks` ticks and drop expired ones"""
+        n = self.count
+        if not n:
+            return
+        live = self.data[:, :n]
+        for _ in range(ticks):
+            live[X] += live[VX]
+            live[VY] += live[GRAVITY]
+            live[Y] += live[VY]
+        live[LIFE] -= ticks
+
+        alive = live[LIFE] > 0
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            self.data[:, :kept] = live[:, alive]
+            self.count = kept
+
+    def blits(self):
+        """(sprite, position) entries for every live particle"""
+        if not self.count:
+            return []
+        sprites = self.sprites
+        columns = self.data[(X, Y, SPRITE), :self.count].astype(int).T.tolist()
+        return [(sprites[sprite], (x, y)) for x, y, sprite in columns]
+
+    def draw(self, screen):
+        screen.blits(self.blits(), doreturn=False)
+
+    def bounds(self):
+        """One rect per emitter covering its live particles"""
+        n = self.count
+        rects = []
+        if not n:
+            return rects
+        x, y, sprite, group = self.data[(X, Y, SPRITE, GROUP), :n].astype(int)
+        sizes = np.array(self.sprite_sizes)[sprite]
+        right = x + sizes[:, 0]
+        bottom = y + sizes[:, 1]
+        for g in np.unique(group).tolist():
+            mask = group == g
+            left, top = int(x[mask].min()), int(y[mask].min())
+            rects.append(pygame.Rect(left, top, int(right[mask].max()) - left,
+                                     int(bottom[mask].max()) - top))
+        return rects
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+
+def solid_sprite(size, color):
+    sprite = pygame.Surface(size, pygame.SRCALPHA)
+    sprite.fill(color)
+    return sprite
+
+
+def dot_sprite(radius, color):
+    sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+    return sprite
+
+
+def line_sprite(length, rise, color):
+    sprite = pygame.Surface((length + 1, abs(rise) + 2), pygame.SRCALPHA)
+    start = (0, max(0, -rise))
+    pygame.draw.line(sprite, color, start, (length, start[1] + rise), 2)
+    return sprite
+
+
+def game_effects(system):
+    """The game's emitters: whale splash, jetpack flame and deepfake glitch
+    (corruption blocks and noise lines)"""
+    return {
+        # White spray thrown up under the whale
+        "splash": system.emitter(
+            [solid_sprite((2, 2), (255, 255, 255)), solid_sprite((2, 4), (255, 255, 255))],
+            rate=1.5, spread=(10, 0, 60, 0), velocity=((-1.5, 0.5), (-3, -1)),
+            gravity=0.4, life=(6, 12)),
+        # Fire falling out of the jetpack nozzle
+        "flame": system.emitter(
+            [dot_sprite(r, color) for r in (2, 3, 4)
+             for color in ((255, 200, 0, 230), (255, 120, 0, 200))],
+            rate=4, spread=(-2, 0, 2, 2), velocity=((-1, 0.5), (2.5, 4.5)),
+            life=(5, 10)),
+        # Glitch: short-lived corrupted blocks and noise lines around a deepfake
+        "glitch": system.emitter(
+            [solid_sprite((w, h), (r, g, 40)) for w, h in ((6, 5), (12, 8), (20, 15))
+             for r, g in ((230, 40), (140, 90))]
+            + [line_sprite(length, rise, (240, 60, 60))
+               for length, rise in ((12, 4), (20, -6), (30, 8), (24, 0))],
+            rate=4, spread=(-20, -20, 30, 30), velocity=((-1, 1), (-1, 1)),
+            life=(2, 4)),
+    }
@@ -1,8 +1,23 @@
 import pygame
 import math
 
+from assets import ASSETS
+from sprite_cache import SPRITES
+
+FUEL_BAR_WIDTH = 50
+FUEL_BAR_HEIGHT = 5
+
+
+def solid(size, color):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
 
 class Player:
+    # Pixels drawn outside rect on each side: dash trail, fuel bar, grave
+    draw_margin = 40
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -10,9 +25,10 @@ class Player:
         self.height = 80
         self.rect = pygame.Rect(x, y - self.height, self.width, self.height)
 
-        # Load Sam Altman sprite
-        self.sprite = None
-        self.load_default_image()
+        # Sprite for each visual state, shared by all players; the current
+        # one is picked in draw() instead of rebuilt every frame
+        self.sprites = Player.load_sprites(self.width, self.height)
+        self.sprite = self.sprites["default"]
 
         # Movement variables
         self.velocity_y = 0
@@ -47,28 +63,49 @@ class Player:
         self.invincible = False
         self.invincible_timer = 0
 
-    def load_default_image(self):
+    # Sprite states by (width, height)
+    _sprites = {}
+
+    @classmethod
+    def load_sprites(cls, width, height):
+        """Build the player's sprite states once per size: default, its
+        semi-transparent invincibility blink, the game over grave, the
+        trail drawn behind a dash and the jetpack, fuel bar and dash ready
+        details"""
+        sprites = cls._sprites.get((width, height))
+        if sprites is not None:
+            return sprites
         try:
             # Try to load the sprite image - if it exists
-            self.sprite = pygame.image.load(
-                "assets/sam_altman.png").convert_alpha()
-            self.sprite = pygame.transform.scale(
-                self.sprite, (self.width, self.height))
+            default = ASSETS.image("sam_altman.png", size=(width, height))
         except:
             # Create a placeholder if image doesn't exist
-            self.sprite = pygame.Surface(
-                (self.width, self.height), pygame.SRCALPHA)
-            self.sprite.fill((200, 150, 100))  # Placeholder color
-
-    def load_grave_image(self):
+            default = pygame.Surface((width, height), pygame.SRCALPHA)
+            default.fill((200, 150, 100))  # Placeholder color
         try:
-            grave_path = "assets/grave.png"
-            self.sprite = pygame.image.load(
-                grave_path).convert_alpha()
-            self.sprite = pygame.transform.scale(
-                self.sprite, (self.width + 30, self.height + 20))
+            grave = ASSETS.image("grave.png", size=(width + 30, height + 20))
         except:
             print("Could not load grave image")
+            grave = default
+
+        blink = default.copy()
+        blink.set_alpha(128)
+        dash_trail = pygame.Surface((20, height))
+        dash_trail.fill((255, 200, 0))
+        dash_ready = pygame.Surface((12, 12), pygame.SRCALPHA)
+        pygame.draw.circle(dash_ready, (0, 200, 0), (6, 6), 5)
+        sprites = {"default": default, "blink": blink, "grave": grave,
+                   "dash_trail": dash_trail,
+                   "jetpack": solid((10, 20), (200, 100, 0)),
+                   "fuel_empty": solid((FUEL_BAR_WIDTH, FUEL_BAR_HEIGHT), (100, 100, 100)),
+                   "fuel": solid((FUEL_BAR_WIDTH, FUEL_BAR_HEIGHT), (255, 200, 0)),
+                   "fuel_jetpack": solid((FUEL_BAR_WIDTH, FUEL_BAR_HEIGHT), (255, 150, 0)),
+                   "dash_ready": dash_ready}
+        cls._sprites[(width, height)] = sprites
+        return sprites
+
+    def show_grave(self):
+        self.sprite = self.sprites["grave"]
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -89,15 +126,19 @@ class Player:
                 self.invincible = True
                 self.invincible_timer = 25  # slightly longer than dash
 
-        # Turn off jetpack if run out of fuel
-        if self.jetpack_fuel <= 0:
-            self.is_using_jetpack = False
-
     def jump(self):
         self.velocity_y = self.jump_power
         self.is_jumping = True
 
-    def update(self):
+    def update(self, keys=None):
+        # keys: held-key state for this frame, defaults to the live keyboard
+        if keys is None:
+            keys = pygame.key.get_pressed()
+
+        # Turn off jetpack if run out of fuel
+        if self.jetpack_fuel <= 0:
+            self.is_using_jetpack = False
+
         # Handle dash cooldown
         if not self.can_dash:
             self.dash_cooldown -= 1
@@ -122,7 +163,6 @@ class Player:
             self.jetpack_fuel -= self.fuel_consumption_rate / 60
 
             # Check if space bar is held down for flying upward
-            keys = pygame.key.get_pressed()
             if keys[pygame.K_SPACE]:
                 # Add an initial lift if player is on the ground
                 if self.rect.bottom >= self.ground_y:
@@ -169,69 +209,62 @@ class Player:
         if self.jetpack_fuel > self.max_jetpack_fuel:
             self.jetpack_fuel = self.max_jetpack_fuel
 
-    def draw(self, screen):
+    def hit_sprite(self):
+        """The player's shape for pixel collisions, whatever it shows"""
+        return (self.sprites["default"], self.rect.topleft)
+
+    def blits(self):
+        """(surface, position[, area]) entries drawing the player"""
+        rect = self.rect
+        sprites = self.sprites
         if self.sprite:
-            # Use sprite if available, apply transparency for invincibility
-            sprite_copy = self.sprite.copy()
-            if self.invincible and int(self.animation_frame * 4) % 2 == 0:
-                # Make sprite semi-transparent when invincible
-                sprite_copy.set_alpha(128)
-            screen.blit(sprite_copy, self.rect)
+            sprite = self.sprite
+            if (self.invincible and sprite is sprites["default"]
+                    and int(self.animation_frame * 4) % 2 == 0):
+                # Semi-transparent when invincible
+                sprite = sprites["blink"]
+            entries = [(sprite, rect.topleft)]
         else:
             # Fallback to drawing placeholder
             color = (200, 150, 100)
             if self.invincible and int(self.animation_frame * 4) % 2 == 0:
                 color = (255, 255, 255)
-            pygame.draw.rect(screen, color, self.rect)
-
-            # Draw eyes (simple face for placeholder)
-            eye_color = (50, 50, 200)
-            pygame.draw.circle(screen, eye_color,
-                               (self.rect.x + 15, self.rect.y + 20), 5)
-            pygame.draw.circle(screen, eye_color,
-                               (self.rect.x + 35, self.rect.y + 20), 5)
+            entries = [SPRITES.entry(("player", color), rect, 0,
+                                     lambda screen, rect: self.paint(screen, rect, color))]
 
         # Dashing effect
         if self.is_dashing:
-            pygame.draw.rect(screen, (255, 200, 0),
-                             (self.rect.x - 20, self.rect.y, 20, self.rect.height))
+            entries.append((sprites["dash_trail"], (rect.x - 20, rect.y)))
 
         # Draw jetpack if active
         if self.is_using_jetpack:
-            jetpack_color = (200, 100, 0)
-            pygame.draw.rect(screen, jetpack_color,
-                             (self.rect.x - 10, self.rect.y + 30, 10, 20))
-
-            # Draw flame
-            flame_height = 15 + int(self.animation_frame * 10) % 15
-            pygame.draw.polygon(screen, (255, 200, 0), [
-                (self.rect.x - 10, self.rect.y + 50),
-                (self.rect.x - 5, self.rect.y + 50 + flame_height),
-                (self.rect.x, self.rect.y + 50)
-            ])
-
-        # Draw fuel bar above player
-        fuel_bar_width = 50
-        fuel_bar_height = 5
-        fuel_fill = (self.jetpack_fuel / self.max_jetpack_fuel) * \
-            fuel_bar_width
-
-        # Empty bar background
-        pygame.draw.rect(screen, (100, 100, 100),
-                         (self.rect.x, self.rect.y - 10, fuel_bar_width, fuel_bar_height))
-
-        # Filled portion of fuel bar
-        fuel_color = (255, 150, 0) if self.is_using_jetpack else (255, 200, 0)
-        pygame.draw.rect(screen, fuel_color,
-                         (self.rect.x, self.rect.y - 10, fuel_fill, fuel_bar_height))
-
-        # Draw dash cooldown indicator
+            entries.append((sprites["jetpack"], (rect.x - 10, rect.y + 30)))
+            # Its flame is a particle effect (Game.update_effects)
+
+        # Fuel bar above player: empty background, then the filled portion
+        fuel_fill = (self.jetpack_fuel / self.max_jetpack_fuel) * FUEL_BAR_WIDTH
+        entries.append((sprites["fuel_empty"], (rect.x, rect.y - 10)))
+        fuel = sprites["fuel_jetpack" if self.is_using_jetpack else "fuel"]
+        entries.append((fuel, (rect.x, rect.y - 10),
+                        pygame.Rect(0, 0, fuel_fill, FUEL_BAR_HEIGHT)))
+
+        # Dash cooldown indicator (cached per remaining frame)
         if not self.can_dash:
-            cooldown_pct = self.dash_cooldown / 180
-            pygame.draw.arc(screen, (150, 150, 150),
-                            (self.rect.x + self.rect.width -
-                             15, self.rect.y - 15, 10, 10),
-                            0, cooldown_pct * 6.28, 3)
+            cooldown = self.dash_cooldown
+            entries.append(SPRITES.entry(
+                ("dash_cooldown", cooldown),
+                pygame.Rect(rect.x + rect.width - 15, rect.y - 15, 10, 10), 0,
+                lambda screen, arc: pygame.draw.arc(screen, (150, 150, 150), arc,
+                                                    0, cooldown / 180 * 6.28, 3)))
         else:
-            pygame.draw.circle(screen, (0, 200, 0),
-                               (self.rect.x + self.rect.width - 10, self.rect.y - 10), 5)
+            entries.append((sprites["dash_ready"],
+                            (rect.x + rect.width - 16, rect.y - 16)))
+        return entries
+
+    def paint(self, screen, rect, color):
+        pygame.draw.rect(screen, color, rect)
+
+        # Draw eyes (simple face for placeholder)
+        eye_color = (50, 50, 200)
+        pygame.draw.circle(screen, eye_color, (rect.x + 15, rect.y + 20), 5)
+        pygame.draw.circle(screen, eye_color, (rect.x + 35, rect.y + 20), 5)
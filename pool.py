@@ -0,0 +1,21 @@
+class ObjectPool:
+    """Free list of reusable instances of one entity class.
+
+    acquire() takes the same arguments as the class constructor; recycled
+    instances are reinitialized through their reset() method, which keeps
+    their pygame.Rect and consumes the RNG exactly like a fresh instance.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            return obj
+        return self.cls(*args)
+
+    def release(self, obj):
+        self.free.append(obj)
@@ -0,0 +1,152 @@
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+# Phases of one Game.run iteration, in execution order. "frame" is the whole
+# iteration minus the time spent sleeping in Clock.tick
+PHASES = ("events", "spawn", "decor", "update", "draw", "flip", "frame")
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """Per-phase frame timings over a rolling window of recent frames.
+
+    Timings are plain perf_counter deltas appended to bounded deques, so the
+    cost per phase is two clock reads and an append. Percentiles are only
+    computed when the overlay refreshes or the report is exported.
+    """
+
+    def __init__(self, window=600, overlay=False, export_path=None):
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES}
+        self.frames = 0
+        self.overlay = overlay
+        self.export_path = export_path
+
+        # Overlay text is rebuilt a few times per second, not every frame
+        self.overlay_refresh = 30
+        self._overlay_surface = None
+        self._overlay_age = 0
+
+    def record(self, phase, start):
+        """Record the time since `start` (a perf_counter value) for a phase"""
+        self.samples[phase].append(time.perf_counter() - start)
+
+    def end_frame(self, frame_start):
+        self.record("frame", frame_start)
+        self.frames += 1
+
+    def percentiles(self, phase):
+        """Nearest-rank p50/p95/p99 of a phase, in milliseconds"""
+        values = sorted(self.samples[phase])
+        if not values:
+            return {p: 0.0 for p in PERCENTILES}
+        return {p: values[max(0, -(-len(values) * p // 100) - 1)] * 1000
+                for p in PERCENTILES}
+
+    def summary(self):
+        report = {}
+        for phase in PHASES:
+            values = self.samples[phase]
+            stats = {f"p{p}_ms": round(v, 4)
+                     for p, v in self.percentiles(phase).items()}
+            stats["mean_ms"] = round(
+                sum(values) / len(values) * 1000, 4) if values else 0.0
+            stats["max_ms"] = round(max(values) * 1000, 4) if values else 0.0
+            stats["samples"] = len(values)
+            report[phase] = stats
+        return report
+
+    def export(self, path):
+        """Write the summary as JSON, or CSV if the path ends in .csv"""
+        report = self.summary()
+        if path.endswith(".csv"):
+            fields = [f"p{p}_ms" for p in PERCENTILES] + \
+                ["mean_ms", "max_ms", "samples"]
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["phase"] + fields)
+                for phase, stats in report.items():
+                    writer.writerow([phase] + [stats[field] for field in fields])
+        else:
+            with open(path, "w") as f:
+                json.dump({"frames": self.frames, "phases": report}, f, indent=2)
+
+    def finish(self):
+        if self.export_path:
+            self.export(self.export_path)
+
+    def overlay_surface(self, font):
+        self._overlay_age -= 1
+        if self._overlay_surface is None or self._overlay_age <= 0:
+            self._overlay_surface = self._render_overlay(font)
+            self._overlay_age = self.overlay_refresh
+        return self._overlay_surface
+
+    def _render_overlay(self, font):
+        lines = ["phase     p50    p95    p99 ms"]
+        for phase in PHASES:
+            p = self.percentiles(phase)
+            lines.append(f"{phase:<7}{p[50]:6.2f} {p[95]:6.2f} {p[99]:6.2f}")
+
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 20
+        surface = pygame.Surface(
+            (width, line_height * len(lines) + 20), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 160))
+        for i, line in enumerate(lines):
+            text = font.render(line, True, (230, 230, 230))
+            surface.blit(text, (10, 10 + i * line_height))
+        return surface
+
+
+class StartupProfiler:
+    """Time-to-first-frame breakdown.
+
+    mark(stage) records the time since the previous mark (or since `start`,
+    a perf_counter value taken as early as possible) under `stage`, and
+    first_frame() prints the breakdown. Work moved off the critical path
+    reports its duration with background(), printed right away if it ends
+    after the first frame.
+    """
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.stages = []
+        self.background_stages = []
+        self.reported = False
+
+    def mark(self, stage):
+        now = time.perf_counter()
+        self.stages.append((stage, now - self.last))
+        self.last = now
+
+    def background(self, stage, start):
+        """Record background work that began at `start`; it finished this
+        long after startup began"""
+        now = time.perf_counter()
+        entry = (stage, now - start, now - self.start)
+        self.background_stages.append(entry)
+        if self.reported:
+            print(self.background_line(*entry))
+
+    def first_frame(self):
+        self.mark("first frame")
+        print(self.report())
+        self.reported = True
+
+    def background_line(self, stage, seconds, done):
+        return (f"  {stage:<24}{seconds * 1000:8.1f}  "
+                f"(background, done at {done * 1000:.1f})")
+
+    def report(self):
+        lines = ["Startup (ms):"]
+        for stage, seconds in self.stages:
+            lines.append(f"  {stage:<24}{seconds * 1000:8.1f}")
+        lines.append(f"  {'time to first frame':<24}{(self.last - self.start) * 1000:8.1f}")
+        for entry in self.background_stages:
+            lines.append(self.background_line(*entry))
+        return "\n".join(lines)
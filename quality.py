@@ -0,0 +1,77 @@
+from collections import deque
+from itertools import islice
+
+# Rendering detail per tier, best first:
+#   parallax_layers  translucent background layers drawn, front first
+#                    (opaque ones cover the screen once whatever the count)
+#   particles        emission scale for the splash and flame particles
+#   glitch           emission scale for the deepfake glitch particles
+#   ground_grid      whether the scrolling ground lines are drawn
+#   hud_interval     drawn frames between HUD rebuilds
+QUALITY_TIERS = (
+    {"name": "high", "parallax_layers": 3, "particles": 1.0, "glitch": 1.0,
+     "ground_grid": True, "hud_interval": 1},
+    {"name": "medium", "parallax_layers": 3, "particles": 0.5, "glitch": 0.5,
+     "ground_grid": True, "hud_interval": 2},
+    {"name": "low", "parallax_layers": 1, "particles": 0.25, "glitch": 0.25,
+     "ground_grid": False, "hud_interval": 4},
+    {"name": "minimal", "parallax_layers": 1, "particles": 0.0, "glitch": 0.0,
+     "ground_grid": False, "hud_interval": 8},
+)
+
+
+class QualityGovernor:
+    """Picks a rendering quality tier from measured frame times.
+
+    The simulation runs in fixed ticks, so a machine that cannot draw fast
+    enough plays the game in slow motion. Fed the work time of every
+    rendered frame (sleeping excluded), the governor steps down one tier
+    when the recent mean goes over `down_load` of the frame budget, and
+    back up once the mean over a longer window stays under `up_load`. The
+    gap between the two thresholds, the longer window for stepping up and
+    the cooldown after every change keep it from oscillating between two
+    tiers. With adaptive=False it stays at `tier`.
+    """
+
+    def __init__(self, target_fps=60, tier=0, adaptive=True, down_load=0.9,
+                 up_load=0.6, down_frames=30, up_frames=180, cooldown=60):
+        self.budget = 1 / target_fps
+        self.tier = tier
+        self.adaptive = adaptive
+        self.down_load = down_load
+        self.up_load = up_load
+        self.down_frames = down_frames
+        self.cooldown = cooldown
+        self.samples = deque(maxlen=up_frames)
+        self.wait = 0
+
+    @property
+    def settings(self):
+        return QUALITY_TIERS[self.tier]
+
+    def observe(self, seconds):
+        """Record one rendered frame's work time. Returns True when the
+        tier changed"""
+        if not self.adaptive:
+            return False
+        self.samples.append(seconds)
+        if self.wait:
+            self.wait -= 1
+            return False
+
+        samples = self.samples
+        if len(samples) >= self.down_frames and self.tier < len(QUALITY_TIERS) - 1:
+            recent = sum(islice(reversed(samples), self.down_frames)) / self.down_frames
+            if recent > self.budget * self.down_load:
+                return self.set_tier(self.tier + 1)
+        if len(samples) == samples.maxlen and self.tier > 0:
+            if sum(samples) / len(samples) < self.budget * self.up_load:
+                return self.set_tier(self.tier - 1)
+        return False
+
+    def set_tier(self, tier):
+        # Frames measured at the old tier say nothing about the new one
+        self.tier = tier
+        self.samples.clear()
+        self.wait = self.cooldown
+        return True
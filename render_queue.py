@@ -0,0 +1,49 @@
+import pygame
+
+# The game's draw order, back to front
+BACKGROUND, CLOUDS, GROUND, TREES, ENTITIES, WHALE, PLAYER, EFFECTS, SHIELD, HUD = range(10)
+
+
+class RenderQueue:
+    """Collects a frame's blits and draws them layer by layer.
+
+    Drawers submit (surface, position) pairs, optionally with a source
+    area, to a layer. flush() draws the layers in ascending order, each
+    with a single Surface.blits call; within a layer, blits keep their
+    submission order. Entries entirely outside the view are dropped
+    instead of being handed to SDL.
+    """
+
+    def __init__(self, view):
+        self.view = pygame.Rect(view)
+        self.layers = {}
+
+    def submit(self, surface, position, layer, area=None):
+        entry = (surface, position, area) if area is not None else (surface, position)
+        self.layers.setdefault(layer, []).append(entry)
+
+    def extend(self, entries, layer):
+        """Submit several (surface, position[, area]) entries"""
+        self.layers.setdefault(layer, []).extend(entries)
+
+    def flush(self, screen):
+        """Draw and forget everything submitted. Returns the number of
+        blits drawn"""
+        left, top, right, bottom = (self.view.left, self.view.top,
+                                    self.view.right, self.view.bottom)
+        drawn = 0
+        for layer in sorted(self.layers):
+            visible = []
+            for entry in self.layers[layer]:
+                x, y = entry[1]
+                width, height = (entry[2].size if len(entry) > 2
+                                 else entry[0].get_size())
+                if x < right and y < bottom and x + width > left and y + height > top:
+                    visible.append(entry)
+            screen.blits(visible, doreturn=False)
+            drawn += len(visible)
+        self.layers.clear()
+        return drawn
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.layers.values())
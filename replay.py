@@ -0,0 +1,131 @@
+import struct
+
+from controls import NO_INPUT, TRACKED_KEYS, FrameInput
+
+# File layout (little endian):
+#   magic "ERPL" | version u8 | seed u64 | frame count u32
+#   then runs of (varint run length, u8 key mask) until frame count is reached
+# Key mask: low nibble = keys held, high nibble = keys pressed this frame,
+# one bit per entry of TRACKED_KEYS. Consecutive identical frames collapse
+# into a single run, so idle stretches cost two bytes.
+MAGIC = b"ERPL"
+VERSION = 1
+HEADER = struct.Struct("<4sBQI")
+
+PRESSED_SHIFT = 4
+
+
+def encode_input(frame_input):
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if key in frame_input.held:
+            mask |= 1 << bit
+        if key in frame_input.pressed:
+            mask |= 1 << (bit + PRESSED_SHIFT)
+    return mask
+
+
+def decode_input(mask):
+    if mask == 0:
+        return NO_INPUT
+    held = [key for bit, key in enumerate(TRACKED_KEYS) if mask & (1 << bit)]
+    pressed = [key for bit, key in enumerate(TRACKED_KEYS)
+               if mask & (1 << (bit + PRESSED_SHIFT))]
+    return FrameInput(held, pressed)
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Replay file is truncated")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """Seed plus per-frame key masks for one recorded run"""
+
+    def __init__(self, seed, masks):
+        self.seed = seed
+        self.masks = masks
+        self._inputs = {}
+
+    def __len__(self):
+        return len(self.masks)
+
+    def input_for(self, frame):
+        """Script callback for Game.simulate/Game.run"""
+        if frame >= len(self.masks):
+            return NO_INPUT
+        mask = self.masks[frame]
+        if mask not in self._inputs:
+            self._inputs[mask] = decode_input(mask)
+        return self._inputs[mask]
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, len(self.masks)))
+        i = 0
+        while i < len(self.masks):
+            mask = self.masks[i]
+            run = 1
+            while i + run < len(self.masks) and self.masks[i + run] == mask:
+                run += 1
+            _write_varint(out, run)
+            out.append(mask)
+            i += run
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size:
+            raise ValueError("Replay file is truncated")
+        magic, version, seed, frame_count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        masks = bytearray()
+        pos = HEADER.size
+        while len(masks) < frame_count:
+            run, pos = _read_varint(data, pos)
+            if pos >= len(data):
+                raise ValueError("Replay file is truncated")
+            masks.extend(data[pos:pos + 1] * run)
+            pos += 1
+        return cls(seed, masks)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Collects the input of every simulated frame of a game"""
+
+    def __init__(self, seed):
+        self.replay = Replay(seed, bytearray())
+
+    def record(self, frame_input):
+        self.replay.masks.append(encode_input(frame_input))
+
+    def save(self, path):
+        self.replay.save(path)
@@ -0,0 +1,311 @@
+"""Reinforcement learning environments around the headless game.
+
+GameEnv follows the Gymnasium reset()/step() conventions without depending
+on gymnasium. An action is held for `frame_skip` frames and is one of:
+
+    NOOP, JUMP (press space), TOGGLE_JETPACK (press J),
+    THRUST (hold space, flies while the jetpack is on), DASH (press D)
+
+Observations are either a compact feature vector (player state, the nearest
+obstacles and power-ups ahead, the whale) or a downscaled frame. The reward
+is the score gained during the step; an episode terminates at game over and
+is truncated after `max_frames`.
+
+VectorEnv steps many GameEnvs spread over worker processes; observations,
+actions and rewards travel through shared memory, only the step/reset
+commands go through pipes.
+"""
+import multiprocessing
+import os
+import random
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from controls import FrameInput
+from game import Game
+from game_objects import (
+    DeepfakePowerUp,
+    DoublePointsPowerUp,
+    FlyingDrone,
+    InvestmentBonus,
+    JetpackFuel,
+    LaserBeam,
+    MagnetPowerUp,
+    ShieldPowerUp,
+    TimeSlowPowerUp,
+)
+
+NOOP, JUMP, TOGGLE_JETPACK, THRUST, DASH = range(5)
+N_ACTIONS = 5
+
+# (first frame, following frames) of an action held for frame_skip frames.
+# Presses only go in once, a repeated J would switch the jetpack back off
+ACTION_INPUTS = {
+    NOOP: (FrameInput(), FrameInput()),
+    JUMP: (FrameInput([pygame.K_SPACE], [pygame.K_SPACE]), FrameInput([pygame.K_SPACE])),
+    TOGGLE_JETPACK: (FrameInput([], [pygame.K_j]), FrameInput()),
+    THRUST: (FrameInput([pygame.K_SPACE]), FrameInput([pygame.K_SPACE])),
+    DASH: (FrameInput([], [pygame.K_d]), FrameInput()),
+}
+
+# How a power-up looks to the player; an unrevealed deepfake is a bonus coin
+POWERUP_LOOKS = [JetpackFuel, ShieldPowerUp, TimeSlowPowerUp, MagnetPowerUp,
+                 DoublePointsPowerUp, InvestmentBonus]
+WHALE_STATES = ["inactive", "moving_in", "waiting", "moving_out"]
+
+PLAYER_FEATURES = 13
+OBSTACLE_FEATURES = 7
+POWERUP_FEATURES = 5
+WHALE_FEATURES = 6
+
+
+def observation_spec(observation="features", nearest=3, frame_size=(96, 54),
+                     grayscale=True, **_):
+    """(shape, dtype) of GameEnv observations for these options"""
+    if observation == "features":
+        size = (PLAYER_FEATURES + WHALE_FEATURES
+                + nearest * (OBSTACLE_FEATURES + POWERUP_FEATURES))
+        return (size,), np.float32
+    if observation == "frame":
+        width, height = frame_size
+        return ((height, width) if grayscale else (height, width, 3)), np.uint8
+    raise ValueError(f"Unknown observation type: {observation}")
+
+
+class GameEnv:
+    def __init__(self, observation="features", nearest=3, frame_size=(96, 54),
+                 grayscale=True, frame_skip=1, max_frames=36000, difficulty=None,
+                 seed=None, vectorized=False):
+        self.observation = observation
+        self.nearest = nearest
+        self.frame_size = frame_size
+        self.grayscale = grayscale
+        self.observation_shape, self.observation_dtype = observation_spec(
+            observation, nearest, frame_size, grayscale)
+        self.frame_skip = frame_skip
+        self.max_frames = max_frames
+        # Episode seeds come from here unless reset() is given one
+        self.seeds = random.Random(seed)
+        self.game = Game(headless=True, seed=self.seeds.randrange(2**32),
+                         difficulty=difficulty, vectorized=vectorized, quiet=True)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seeds.seed(seed)
+        self.game.new_run(self.seeds.randrange(2**32))
+        return self.observe(), self.info()
+
+    def step(self, action):
+        game = self.game
+        first, rest = ACTION_INPUTS[action]
+        score = game.score
+        game.step(first)
+        for _ in range(self.frame_skip - 1):
+            if game.game_over or game.frame >= self.max_frames:
+                break
+            game.step(rest)
+        terminated = game.game_over
+        truncated = not terminated and game.frame >= self.max_frames
+        return self.observe(), game.score - score, terminated, truncated, self.info()
+
+    def info(self):
+        game = self.game
+        return {"score": game.score, "distance": game.distance, "frame": game.frame,
+                "seed": game.seed}
+
+    def observe(self):
+        if self.observation == "frame":
+            return self.frame()
+        return self.features()
+
+    def features(self):
+        game = self.game
+        game.sync_entities()
+        player = game.player
+        rect = player.rect
+        width, height = game.WIDTH, game.HEIGHT
+        out = np.zeros(self.observation_shape, np.float32)
+        out[:PLAYER_FEATURES] = (
+            rect.y / height, player.velocity_y / player.max_velocity_down,
+            player.is_jumping, player.is_using_jetpack,
+            player.jetpack_fuel / player.max_jetpack_fuel,
+            player.can_dash, player.is_dashing, player.invincible,
+            game.shield_active, game.magnet_active, game.double_points_active,
+            game.slow_timer > 0, game.game_speed / game.max_game_speed,
+        )
+        i = PLAYER_FEATURES
+
+        # Nearest obstacles not yet behind the player, closest first
+        ahead = sorted((o for o in game.obstacles if o.rect.right > rect.x),
+                       key=lambda o: o.rect.x)
+        for obstacle in ahead[:self.nearest]:
+            r = obstacle.rect
+            out[i:i + OBSTACLE_FEATURES] = (
+                1, (r.x - rect.right) / width, r.y / height, r.width / width,
+                r.height / height, isinstance(obstacle, FlyingDrone),
+                isinstance(obstacle, LaserBeam) and not obstacle.active,
+            )
+            i += OBSTACLE_FEATURES
+        i = PLAYER_FEATURES + self.nearest * OBSTACLE_FEATURES
+
+        ahead = sorted((p for p in game.powerups if p.rect.right > rect.x),
+                       key=lambda p: p.rect.x)
+        for powerup in ahead[:self.nearest]:
+            r = powerup.rect
+            if isinstance(powerup, DeepfakePowerUp):
+                looks = InvestmentBonus
+                dangerous = powerup.is_transforming or powerup.display_type == "obstacle"
+            else:
+                looks = type(powerup)
+                dangerous = False
+            out[i:i + POWERUP_FEATURES] = (
+                1, (r.x - rect.right) / width, (r.centery - rect.centery) / height,
+                POWERUP_LOOKS.index(looks) / (len(POWERUP_LOOKS) - 1), dangerous,
+            )
+            i += POWERUP_FEATURES
+        i = PLAYER_FEATURES + self.nearest * (OBSTACLE_FEATURES + POWERUP_FEATURES)
+
+        whale = game.whale
+        out[i + WHALE_STATES.index(whale.state)] = 1
+        out[i + 4] = whale.rect.x / width
+        out[i + 5] = whale.rect.y / height
+        return out
+
+    def frame(self):
+        self.game.draw()
+        small = pygame.transform.smoothscale(self.game.screen, self.frame_size)
+        pixels = pygame.surfarray.pixels3d(small).transpose(1, 0, 2)
+        if self.grayscale:
+            return (pixels @ np.array([0.299, 0.587, 0.114])).astype(np.uint8)
+        return pixels.copy()
+
+    def close(self):
+        self.game = None
+
+
+def _worker(conn, names, n, start, seeds, env_kwargs):
+    blocks, arrays = VectorEnv.attach(names, env_kwargs, n)
+    obs, actions, rewards, terminated, truncated, score, distance = arrays
+    envs = [GameEnv(seed=seed, **env_kwargs) for seed in seeds]
+    while True:
+        command = conn.recv()
+        if command == "close":
+            break
+        for i, env in enumerate(envs, start):
+            if command == "reset":
+                obs[i] = env.reset()[0]
+                continue
+            o, rewards[i], terminated[i], truncated[i], info = env.step(actions[i])
+            score[i] = info["score"]
+            distance[i] = info["distance"]
+            # Finished episodes start over right away, the caller sees
+            # the done flags together with the new episode's first obs
+            obs[i] = env.reset()[0] if terminated[i] or truncated[i] else o
+        conn.send(True)
+    del obs, arrays
+    for block in blocks:
+        block.close()
+    conn.send(True)
+
+
+class VectorEnv:
+    """`n` GameEnvs stepped together by worker processes.
+
+    step(actions) returns (obs, rewards, terminated, truncated, info) as
+    arrays with one row per env; info holds the score and distance each env
+    had at the end of the step. Envs reset themselves when their episode ends.
+    """
+
+    def __init__(self, n, workers=None, seed=None, **env_kwargs):
+        self.n = n
+        workers = min(n, workers or os.cpu_count())
+        self.observation_shape, self.observation_dtype = observation_spec(**env_kwargs)
+
+        self.blocks = []
+        for shape, dtype in self.layout(env_kwargs, n):
+            size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            self.blocks.append(shared_memory.SharedMemory(create=True, size=size))
+        names = [block.name for block in self.blocks]
+        _, arrays = self.attach(names, env_kwargs, n, self.blocks)
+        (self.obs, self.actions, self.rewards, self.terminated, self.truncated,
+         self.score, self.distance) = arrays
+
+        seeds = random.Random(seed)
+        env_seeds = [seeds.randrange(2**32) for _ in range(n)]
+        # spawn, not fork: workers get their own SDL instead of the parent's
+        context = multiprocessing.get_context("spawn")
+        self.conns = []
+        self.processes = []
+        bounds = np.linspace(0, n, workers + 1).astype(int)
+        for start, stop in zip(bounds, bounds[1:]):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker, daemon=True,
+                args=(child, names, n, start, env_seeds[start:stop], env_kwargs))
+            process.start()
+            self.conns.append(parent)
+            self.processes.append(process)
+
+    @staticmethod
+    def layout(env_kwargs, n):
+        shape, dtype = observation_spec(**env_kwargs)
+        return [((n,) + shape, dtype), ((n,), np.int64), ((n,), np.float64),
+                ((n,), np.bool_), ((n,), np.bool_), ((n,), np.float64),
+                ((n,), np.float64)]
+
+    @staticmethod
+    def attach(names, env_kwargs, n, blocks=None):
+        """Numpy views of the shared blocks (opened by name in workers)"""
+        if blocks is None:
+            blocks = [shared_memory.SharedMemory(name=name) for name in names]
+        arrays = [np.ndarray(shape, dtype, buffer=block.buf)
+                  for (shape, dtype), block in zip(VectorEnv.layout(env_kwargs, n), blocks)]
+        return blocks, arrays
+
+    def command(self, command):
+        for conn in self.conns:
+            conn.send(command)
+        for conn in self.conns:
+            conn.recv()
+
+    def reset(self):
+        self.command("reset")
+        return self.obs.copy()
+
+    def step(self, actions):
+        self.actions[:] = actions
+        self.command("step")
+        info = {"score": self.score.copy(), "distance": self.distance.copy()}
+        return (self.obs.copy(), self.rewards.copy(), self.terminated.copy(),
+                self.truncated.copy(), info)
+
+    def close(self):
+        if not self.blocks:
+            return
+        try:
+            # A worker that already died (crashed, or killed by Ctrl+C along
+            # with its parent) can't take the command, the rest still can
+            for conn in self.conns:
+                try:
+                    conn.send("close")
+                    conn.recv()
+                except (BrokenPipeError, ConnectionResetError, EOFError):
+                    pass
+            for process in self.processes:
+                process.join()
+        finally:
+            # Shared memory outlives the processes unless unlinked
+            del self.obs, self.actions, self.rewards, self.terminated, self.truncated
+            del self.score, self.distance
+            for block in self.blocks:
+                block.close()
+                block.unlink()
+            self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
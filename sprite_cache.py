@@ -0,0 +1,40 @@
+import pygame
+
+
+class SpriteCache:
+    """Rasterizes procedurally drawn entities once per visual state.
+
+    Entities describe their current look with a hashable key (type, size,
+    animation state...). The first time a key is seen, the entity's paint
+    function draws it onto a transparent surface; afterwards drawing that
+    state is a single blit.
+    """
+
+    def __init__(self):
+        self._sprites = {}
+
+    def get(self, key, size, pad, paint):
+        """Surface for `key`, built with paint(surface, rect) on first use.
+
+        `rect` is the entity rect in sprite coordinates; `pad` extra pixels on
+        every side leave room for details drawn outside the hitbox.
+        """
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            width, height = size
+            sprite = pygame.Surface(
+                (width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+            paint(sprite, pygame.Rect(pad, pad, width, height))
+            self._sprites[key] = sprite
+        return sprite
+
+    def entry(self, key, rect, pad, paint):
+        """(sprite, position) drawing `key` at `rect`, for Surface.blits"""
+        return (self.get(key, rect.size, pad, paint), (rect.x - pad, rect.y - pad))
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+# Shared by all entity classes
+SPRITES = SpriteCache()
@@ -0,0 +1,73 @@
+import random
+
+import pygame
+import pytest
+
+from background import ParallaxBackground
+from game import Game
+from quality import QUALITY_TIERS, QualityGovernor
+
+WIDTH, HEIGHT = 1200, 600
+SENTINEL = (255, 0, 255)
+
+
+def full_redraw(screen, layers, positions):
+    """The drawing ParallaxBackground replaces: every layer blitted whole,
+    twice"""
+    for layer, position in zip(layers, positions):
+        screen.blit(layer["img"], (int(position), 0))
+        screen.blit(layer["img"], (int(position) + WIDTH, 0))
+
+
+def solid_layers(sizes):
+    layers = []
+    for i, size in enumerate(sizes):
+        image = pygame.Surface(size)
+        image.fill((i * 80, 50, 100 + i * 40))
+        layers.append({"img": image, "speed": i + 1})
+    return layers
+
+
+@pytest.fixture(scope="module")
+def display():
+    pygame.display.init()
+    return pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+@pytest.mark.parametrize("layers", [
+    lambda: [{"img": image, "speed": speed} for image in
+             [pygame.image.load("assets/background.png").convert()] for speed in (0.5, 1, 2)],
+    lambda: solid_layers([(WIDTH, HEIGHT)] * 3),
+    lambda: solid_layers([(1500, 700), (1024, 1024)]),
+], ids=["game", "solid", "mixed"])
+def test_plan_matches_full_redraw(display, layers):
+    layers = layers()
+    background = ParallaxBackground(layers, WIDTH, HEIGHT)
+    rng = random.Random(0)
+    expected = pygame.Surface((WIDTH, HEIGHT))
+    drawn = pygame.Surface((WIDTH, HEIGHT))
+    for _ in range(150):
+        positions = [-rng.uniform(0, WIDTH) for _ in layers]
+        # Columns no layer covers get the backdrop, never what was there
+        expected.fill(background.fill)
+        drawn.fill(SENTINEL)
+        full_redraw(expected, layers, positions)
+        background.draw(drawn, positions)
+        assert pygame.image.tobytes(drawn, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def stale_pixels(screen):
+    return pygame.mask.from_threshold(screen, SENTINEL, (1, 1, 1, 255)).count()
+
+
+@pytest.mark.parametrize("tier", range(len(QUALITY_TIERS)))
+def test_full_draw_covers_screen(tier):
+    game = Game(headless=True, seed=5, quality=QualityGovernor(tier=tier, adaptive=False))
+    rng = random.Random(tier)
+    # Start with every layer at 0 (all their gaps line up), then random
+    # positions
+    for _ in range(30):
+        game.screen.fill(SENTINEL)
+        game.draw_full()
+        assert stale_pixels(game.screen) == 0, game.bg_positions
+        game.bg_positions = [-rng.uniform(0, WIDTH) for _ in game.bg_positions]
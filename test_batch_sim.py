@@ -0,0 +1,29 @@
+import numpy as np
+
+from batch_sim import BatchSim, idle
+from game import Game
+
+
+def mean_and_error(values):
+    values = np.asarray(values, float)
+    return values.mean(), values.std() / np.sqrt(len(values))
+
+
+def test_batch_matches_game_statistics():
+    # Idle runs are short, so a few dozen Games give a usable mean
+    games = []
+    for seed in range(40):
+        game = Game(headless=True, seed=seed, quiet=True)
+        game.simulate(36000)
+        assert game.game_over
+        games.append(game)
+
+    sim = BatchSim(2000, seed=0)
+    distance, score = sim.run(idle)
+    assert not sim.alive.any()
+
+    for game_values, batch_values in ([[game.distance for game in games], distance],
+                                      [[game.score for game in games], score]):
+        game_mean, game_error = mean_and_error(game_values)
+        batch_mean, batch_error = mean_and_error(batch_values)
+        assert abs(game_mean - batch_mean) < 3 * np.hypot(game_error, batch_error)
@@ -0,0 +1,59 @@
+import random
+
+import pygame
+
+from broadphase import SweepAndPrune
+from game import Game
+
+
+class Box:
+    def __init__(self, rect):
+        self.rect = rect
+
+
+def brute_force(entities, rect):
+    return [entity for entity in entities if rect.colliderect(entity.rect)]
+
+
+def check_queries(index, entities, queries):
+    for rect in queries:
+        assert (sorted(map(id, index.colliding(rect)))
+                == sorted(map(id, brute_force(entities, rect))))
+        assert (sorted(map(id, index.within(rect, 50)))
+                == sorted(map(id, brute_force(entities, rect.inflate(100, 100)))))
+
+
+def random_rect(rng, max_size=300):
+    return pygame.Rect(rng.randrange(-300, 1200), rng.randrange(-100, 600),
+                       rng.randrange(1, max_size), rng.randrange(1, max_size))
+
+
+def test_random_queries_match_brute_force():
+    rng = random.Random(1)
+    index = SweepAndPrune()
+    for _ in range(300):
+        # Mostly entity-sized boxes, some wider than a laser beam's cutoff
+        entities = [Box(random_rect(rng, 1200 if rng.random() < 0.1 else 120))
+                    for _ in range(rng.randrange(0, 40))]
+        index.rebuild(entities)
+        check_queries(index, entities, [random_rect(rng) for _ in range(10)])
+
+        # Removed entities stop turning up
+        if entities:
+            gone = entities.pop(rng.randrange(len(entities)))
+            index.remove(gone)
+            check_queries(index, entities, [gone.rect] + [random_rect(rng) for _ in range(5)])
+
+
+def test_game_queries_match_brute_force(script):
+    game = Game(headless=True, seed=3, difficulty={"obstacle_chance": 0.7})
+    # Shielded for the whole run, so the screen keeps filling up
+    game.shield_active = True
+    game.shield_timer = 10 ** 9
+    index = SweepAndPrune()
+    for frame in range(600):
+        game.step(script(frame))
+        for entities in (game.obstacles, game.powerups):
+            index.rebuild(entities)
+            check_queries(index, entities, [game.player.rect] + [
+                entity.rect for entity in entities])
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from game import Game
+from game_objects import DeepfakePowerUp, LaserBeam, Obstacle
+
+
+def fast_game(speed, vectorized):
+    """Game at a fixed speed with spawning held off and the player on the
+    ground"""
+    game = Game(headless=True, seed=1, vectorized=vectorized,
+                difficulty={"base_game_speed": speed, "max_game_speed": speed})
+    game.spawn_timer = -10 ** 9
+    for _ in range(3):
+        game.step()
+    return game
+
+
+def crosses_player(game, entity, entities):
+    """Put `entity` just ahead of the player and step once. Returns whether
+    the run ended, after checking the entity really passed through: it
+    ends the frame clear of the player"""
+    entities.append(entity)
+    game.step()
+    game.sync_entities()
+    assert not entity.rect.colliderect(game.player.rect)
+    assert entity.rect.right <= game.player.rect.left
+    return game.game_over
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "arrays"])
+@pytest.mark.parametrize("speed", [100, 150])
+def test_fast_obstacle_cannot_tunnel(vectorized, speed):
+    game = fast_game(speed, vectorized)
+    obstacle = Obstacle(0, game.HEIGHT - 50, random.Random(0))
+    obstacle.rect.x = game.player.rect.right + 5
+    # Narrow enough to clear the player within one frame
+    obstacle.rect.width = 30
+    assert crosses_player(game, obstacle, game.obstacles)
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "arrays"])
+def test_thin_laser_cannot_tunnel(vectorized):
+    game = fast_game(150, vectorized)
+    player = game.player.rect
+    laser = LaserBeam(player.right + 5, player.centery, 20)
+    laser.active = True
+    assert crosses_player(game, laser, game.obstacles)
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "arrays"])
+def test_revealed_deepfake_cannot_tunnel(vectorized):
+    game = fast_game(100, vectorized)
+    player = game.player.rect
+    deepfake = DeepfakePowerUp(player.right + 5, player.centery - 15, random.Random(0))
+    deepfake.display_type = "obstacle"
+    assert crosses_player(game, deepfake, game.powerups)
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["objects", "arrays"])
+def test_passing_obstacle_behind_player_is_missed(vectorized):
+    game = fast_game(100, vectorized)
+    # Starts clear of the player on the far side, so its path never
+    # crosses it
+    obstacle = Obstacle(0, game.HEIGHT - 50, random.Random(0))
+    obstacle.rect.x = game.player.rect.left - 40
+    game.obstacles.append(obstacle)
+    game.step()
+    assert not game.game_over
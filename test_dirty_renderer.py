@@ -0,0 +1,41 @@
+import random
+
+import pygame
+
+from game import Game
+from profiler import FrameProfiler
+
+
+def test_dirty_frames_match_full_redraw(script):
+    game = Game(seed=11, dirty_rendering=True)
+    for frame in range(400):
+        game.step(script(frame))
+        # Deepfake glitch offsets come from the global random module
+        random.seed(frame)
+        game.draw()
+        dirty = pygame.image.tobytes(game.screen, "RGB")
+        game.present()
+        if frame % 5 == 0:
+            game.renderer.force_full = True
+            random.seed(frame)
+            game.draw()
+            game.renderer.dirty = []
+            assert pygame.image.tobytes(game.screen, "RGB") == dirty, frame
+
+
+def test_profiler_overlay_refreshes_on_game_over_screen():
+    game = Game(seed=3, dirty_rendering=True, profiler=FrameProfiler(overlay=True))
+    while not game.game_over:
+        game.step()
+    shown = set()
+    for frame in range(100):
+        # Timings that change every frame, so every overlay rebuild differs
+        game.profiler.record("draw", -frame * 0.01)
+        game.step()
+        game.draw()
+        game.present()
+        overlay = [pygame.Rect(position, surface.get_size())
+                   for slot, surface, position in game.hud if slot == "profiler"][0]
+        overlay = overlay.clip(game.screen.get_rect())
+        shown.add(pygame.image.tobytes(game.screen.subsurface(overlay), "RGB"))
+    assert len(shown) > 1
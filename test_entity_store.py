@@ -0,0 +1,35 @@
+import pytest
+
+from game import Game
+
+# Busier than the default game: more obstacles and deepfakes
+DIFFICULTY = {"obstacle_chance": 0.6, "deepfake_chance": 0.5, "max_deepfake_chance": 0.5}
+
+
+def snapshot(game):
+    game.sync_entities()
+    entities = [(type(entity).__name__, tuple(entity.rect), getattr(entity, "display_type", None),
+                 getattr(entity, "is_transforming", None), getattr(entity, "glitch_intensity", None),
+                 round(getattr(entity, "angle", 0), 9), getattr(entity, "active", None))
+                for entity in game.obstacles + game.powerups]
+    return (game.frame, game.score, game.distance, game.game_over, tuple(game.player.rect),
+            game.game_speed, game.shield_active, game.magnet_active, entities)
+
+
+def run(seed, vectorized, shielded):
+    game = Game(headless=True, seed=seed, vectorized=vectorized, difficulty=DIFFICULTY)
+    if shielded:
+        game.shield_active = True
+        game.shield_timer = 10 ** 9
+    return game
+
+
+@pytest.mark.parametrize("seed, shielded", [(0, False), (1, False), (2, True), (3, True)])
+def test_vectorized_matches_object_path(script, seed, shielded):
+    inputs = [script(frame) for frame in range(800)]
+    objects = run(seed, False, shielded)
+    arrays = run(seed, True, shielded)
+    for frame_input in inputs:
+        objects.step(frame_input)
+        arrays.step(frame_input)
+        assert snapshot(arrays) == snapshot(objects)
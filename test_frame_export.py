@@ -0,0 +1,35 @@
+import numpy as np
+import pygame
+
+from frame_export import FrameExporter, FrameReader, convert, frame_shape, screen_view
+
+# (pixel, ITU-R 601 luma in 1/256ths, rounded down)
+LUMA = [((0, 0, 0), 0), ((255, 255, 255), 255), ((255, 0, 0), 76),
+        ((0, 255, 0), 149), ((0, 0, 255), 28), ((200, 100, 50), 124)]
+
+
+def test_grayscale_luma_of_known_pixels():
+    surface = pygame.Surface((len(LUMA), 1))
+    for x, (pixel, _) in enumerate(LUMA):
+        surface.set_at((x, 0), pixel)
+    out = np.empty(frame_shape((len(LUMA), 1), grayscale=True), np.uint8)
+    with screen_view(surface) as view:
+        convert(view, out, grayscale=True)
+    assert out[0].tolist() == [luma for _, luma in LUMA]
+
+
+def test_reader_sees_exported_frame():
+    surface = pygame.Surface((8, 6))
+    surface.fill((200, 100, 50))
+    exporter = FrameExporter((8, 6), downsample=2, grayscale=True)
+    try:
+        exporter.export(surface)
+        reader = FrameReader(exporter.name)
+        frame, pixels = reader.latest()
+        assert frame == 0
+        assert pixels.shape == (3, 4)
+        assert (pixels == 124).all()
+        del pixels
+        reader.close()
+    finally:
+        exporter.close()
@@ -0,0 +1,35 @@
+import pytest
+
+from game import Game
+from replay import Replay
+
+
+def state(game):
+    return (game.frame, game.score, game.distance, game.game_over, tuple(game.player.rect),
+            game.player.jetpack_fuel,
+            [(type(entity).__name__, tuple(entity.rect)) for entity in game.obstacles + game.powerups])
+
+
+def test_recorded_run_plays_back_identically(script, tmp_path):
+    path = tmp_path / "run.erpl"
+    recorded = Game(headless=True, seed=21, record_to=str(path))
+    recorded.simulate(900, script)
+    recorded.shutdown()
+
+    replay = Replay.load(str(path))
+    assert replay.seed == 21
+    assert len(replay) == 900
+    assert Replay.from_bytes(replay.to_bytes()).masks == replay.masks
+
+    played = Game(headless=True, seed=replay.seed)
+    played.simulate(len(replay), replay.input_for)
+    assert state(played) == state(recorded)
+
+
+def test_truncated_replay_raises_value_error(script, tmp_path):
+    recorded = Game(headless=True, seed=4, record_to=str(tmp_path / "run.erpl"))
+    recorded.simulate(300, script)
+    data = recorded.recorder.replay.to_bytes()
+    for end in range(len(data)):
+        with pytest.raises(ValueError):
+            Replay.from_bytes(data[:end])
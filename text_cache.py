@@ -0,0 +1,99 @@
+from collections import OrderedDict
+
+import pygame
+
+FONT_PATH = "assets/fonts/ShareTechMono-Regular.ttf"
+
+# Characters pre-rendered into each numeric glyph atlas
+DIGITS = "0123456789-"
+
+
+class TextCache:
+    """Shared cache for fonts and rendered text.
+
+    - fonts are loaded once per (path, size)
+    - static strings are rendered once and kept in a bounded LRU
+    - numeric fields are assembled from a per-font/colour digit atlas and only
+      rebuilt when their value changes
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._rendered = OrderedDict()
+        self._atlases = {}
+        self._fields = {}
+
+    def font(self, path=FONT_PATH, size=36):
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            # The font module is only started once text is first needed
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self._fonts[key] = pygame.font.Font(path, size)
+        return font
+
+    def render(self, text, color, path=FONT_PATH, size=36):
+        """Rendered surface for a string, reused until evicted"""
+        key = (text, color, path, size)
+        surface = self._rendered.get(key)
+        if surface is not None:
+            self._rendered.move_to_end(key)
+            return surface
+
+        surface = self.font(path, size).render(text, True, color)
+        self._rendered[key] = surface
+        if len(self._rendered) > self.max_entries:
+            self._rendered.popitem(last=False)
+        return surface
+
+    def render_field(self, name, prefix, value, suffix, color,
+                     path=FONT_PATH, size=36):
+        """Surface for "<prefix><value><suffix>", rebuilt only when it changes.
+
+        `name` identifies the HUD slot, so each slot keeps just its latest
+        surface instead of filling the LRU with every number it has shown.
+        """
+        key = (prefix, value, suffix, color, path, size)
+        cached = self._fields.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        surface = self._compose(prefix, str(value), suffix, color, path, size)
+        self._fields[name] = (key, surface)
+        return surface
+
+    def _atlas(self, color, path, size):
+        key = (color, path, size)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            font = self.font(path, size)
+            atlas = self._atlases[key] = {
+                char: font.render(char, True, color) for char in DIGITS}
+        return atlas
+
+    def _compose(self, prefix, digits, suffix, color, path, size):
+        atlas = self._atlas(color, path, size)
+        parts = []
+        if prefix:
+            parts.append(self.render(prefix, color, path, size))
+        parts.extend(atlas[char] for char in digits)
+        if suffix:
+            parts.append(self.render(suffix, color, path, size))
+
+        width = sum(part.get_width() for part in parts)
+        height = max(part.get_height() for part in parts)
+        # Transparent pixels carry the text colour so antialiased edges
+        # blend without dark fringes
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((*color, 0))
+        x = 0
+        for part in parts:
+            surface.blit(part, (x, 0))
+            x += part.get_width()
+        return surface
+
+
+# Shared by the HUD and every entity that draws text
+TEXT_CACHE = TextCache()
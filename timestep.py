@@ -0,0 +1,37 @@
+import time
+
+
+class FixedTimestep:
+    """Turns elapsed wall-clock time into a whole number of simulation ticks.
+
+    Call ticks() once per rendered frame and step the simulation that many
+    times; the leftover time is exposed as `alpha` (0..1), how far the
+    display is between the last two ticks. After a stall (window drag, slow
+    machine) at most `max_steps` ticks are run in one frame and the rest of
+    the backlog is dropped, so the game slows down instead of spiralling
+    into ever longer catch-up frames.
+    """
+
+    def __init__(self, rate=60, max_steps=5):
+        self.dt = 1 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0
+        self.last = None
+
+    def ticks(self):
+        now = time.perf_counter()
+        if self.last is None:
+            self.last = now - self.dt  # the first frame runs one tick
+        self.accumulator += now - self.last
+        self.last = now
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = steps * self.dt
+        self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.dt, 1.0)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Monte Carlo difficulty tuner.
+
+Sweeps combinations of difficulty settings (game.DIFFICULTY) over seeded
+headless games on every core. Work is split into chunks of seeds per
+setting combination; each finished chunk is appended to a JSONL results
+file as soon as it comes back, so an interrupted sweep resumes where it
+stopped when run again with the same arguments. Aggregated survival
+curves are written to a summary JSON at the end.
+
+    python tuner.py --set obstacle_gap=200,300,400 \\
+        --set obstacle_chance=0.4,0.5,0.6 --seeds 500 --out sweep.jsonl
+"""
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import pygame
+
+from controls import NO_INPUT, FrameInput
+from game import DIFFICULTY, Game
+
+PRESS_SPACE = FrameInput([pygame.K_SPACE], [pygame.K_SPACE])
+
+
+def idle(game):
+    return NO_INPUT
+
+
+def jumper(game):
+    """Jump when an obstacle is about to reach the player"""
+    player = game.player.rect
+    reach = player.right + 10 * game.game_speed
+    if any(o.rect.right > player.x and o.rect.x < reach for o in game.obstacles):
+        return PRESS_SPACE
+    return NO_INPUT
+
+
+POLICIES = {"idle": idle, "jumper": jumper}
+
+
+# Game each worker process plays all its chunks on, see run_chunk
+worker_game = None
+
+
+def play(game, settings, seed, frames, policy):
+    """One game with these settings until game over or `frames`. Returns
+    (distance, score, frames played)"""
+    game.difficulty = dict(DIFFICULTY, **settings)
+    game.new_run(seed)
+    act = POLICIES[policy]
+    while not game.game_over and game.frame < frames:
+        game.step(act(game))
+    return game.distance, game.score, game.frame
+
+
+def run_chunk(settings, seeds, frames, policy):
+    # Worker process entry point. Building a Game loads the display and
+    # assets, so a worker builds one and starts it over for every seed
+    global worker_game
+    if worker_game is None:
+        worker_game = Game(headless=True, quiet=True)
+    return [play(worker_game, settings, seed, frames, policy) for seed in seeds]
+
+
+def sweep_settings(assignments):
+    """Every combination of the --set values, as dicts"""
+    names = [name for name, _ in assignments]
+    for values in itertools.product(*(values for _, values in assignments)):
+        yield dict(zip(names, values))
+
+
+def parse_assignment(text):
+    name, _, values = text.partition("=")
+    if name not in DIFFICULTY:
+        raise argparse.ArgumentTypeError(
+            f"unknown difficulty setting {name!r}, expected one of: "
+            + ", ".join(DIFFICULTY))
+    try:
+        values = [float(value) for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad values in {text!r}")
+    return name, [int(value) if value.is_integer() else value for value in values]
+
+
+def chunk_key(settings, seeds, args):
+    """Identifies a chunk's work, for skipping it on resume"""
+    return json.dumps([settings, seeds[0], seeds[-1] + 1, args.frames, args.policy],
+                      sort_keys=True)
+
+
+def load_results(path):
+    records = []
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    records.append(json.loads(line))
+    return records
+
+
+def survival_curve(distances, step):
+    """[(distance, share of runs that got at least that far)]"""
+    distances = sorted(distances)
+    n = len(distances)
+    curve = []
+    d = 0
+    i = 0
+    while i < n:
+        while i < n and distances[i] < d:
+            i += 1
+        curve.append((d, (n - i) / n))
+        d += step
+    return curve
+
+
+def summarize(records, step):
+    groups = {}
+    for record in records:
+        key = json.dumps(record["settings"], sort_keys=True)
+        group = groups.setdefault(key, {"settings": record["settings"],
+                                        "distance": [], "score": [], "frames": []})
+        for name in ("distance", "score", "frames"):
+            group[name].extend(record[name])
+
+    summary = []
+    for group in groups.values():
+        distances = sorted(group["distance"])
+        n = len(distances)
+        summary.append({
+            "settings": group["settings"],
+            "runs": n,
+            "mean_distance": sum(distances) / n,
+            "median_distance": distances[n // 2],
+            "mean_score": sum(group["score"]) / n,
+            "mean_frames": sum(group["frames"]) / n,
+            "survival": survival_curve(distances, step),
+        })
+    summary.sort(key=lambda entry: entry["mean_distance"])
+    return summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Monte Carlo difficulty tuner")
+    parser.add_argument("--set", dest="assignments", metavar="NAME=V1,V2,...",
+                        type=parse_assignment, action="append", default=[],
+                        help="difficulty setting to sweep (repeatable)")
+    parser.add_argument("--seeds", type=int, default=100,
+                        help="games per setting combination")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=20,
+                        help="games per work unit")
+    parser.add_argument("--frames", type=int, default=36000,
+                        help="stop a game after this many frames")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="jumper")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="tuning.jsonl",
+                        help="per-chunk results, appended as they finish")
+    parser.add_argument("--summary", default=None,
+                        help="survival curves (default: OUT with .summary.json)")
+    parser.add_argument("--curve-step", type=float, default=100,
+                        help="distance between survival curve points")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    summary_path = args.summary or os.path.splitext(args.out)[0] + ".summary.json"
+
+    # Chunks already in the results file are not run again
+    records = load_results(args.out)
+    done = {record["key"] for record in records}
+
+    seeds = list(range(args.first_seed, args.first_seed + args.seeds))
+    chunks = [seeds[i:i + args.chunk_size]
+              for i in range(0, len(seeds), args.chunk_size)]
+    work = []
+    for settings in sweep_settings(args.assignments):
+        for chunk in chunks:
+            key = chunk_key(settings, chunk, args)
+            if key not in done:
+                work.append((key, settings, chunk))
+    total = len(work) + len(done)
+    print(f"{len(work)} of {total} chunks to run on {args.workers} workers")
+
+    with open(args.out, "a") as out, \
+            ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(run_chunk, settings, chunk, args.frames, args.policy):
+                   (key, settings, chunk) for key, settings, chunk in work}
+        broken = False
+        try:
+            for finished, future in enumerate(as_completed(futures), 1):
+                key, settings, chunk = futures[future]
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    # A worker died (e.g. killed for memory). Chunks other
+                    # workers finished are still collected and written
+                    broken = True
+                    continue
+                distance, score, frames = zip(*results)
+                record = {"key": key, "settings": settings, "seeds": chunk,
+                          "distance": distance, "score": score, "frames": frames}
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                records.append(record)
+                print(f"[{finished}/{len(work)}] {settings} seeds "
+                      f"{chunk[0]}-{chunk[-1]}: mean distance "
+                      f"{sum(distance) / len(distance):.0f}")
+        except KeyboardInterrupt:
+            pool.shutdown(cancel_futures=True)
+            print(f"Interrupted, finished chunks are in {args.out}; "
+                  "run again to resume")
+            return
+        if broken:
+            print(f"A worker process died, finished chunks are in {args.out}; "
+                  "run again to resume")
+            return
+
+    # Only summarize this sweep's chunks, the file may hold others
+    wanted = {chunk_key(settings, chunk, args)
+              for settings in sweep_settings(args.assignments) for chunk in chunks}
+    summary = summarize([r for r in records if r["key"] in wanted], args.curve_step)
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2)
+    for entry in summary:
+        print(f"{entry['settings']}: {entry['runs']} runs, mean distance "
+              f"{entry['mean_distance']:.0f}, median {entry['median_distance']:.0f}, "
+              f"mean score {entry['mean_score']:.0f}")
+    print(f"Survival curves written to {summary_path}")
+
+
+if __name__ == "__main__":
+    main()
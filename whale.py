@@ -1,10 +1,15 @@
 import math
-import random
 
 import pygame
 
+from assets import ASSETS
+from sprite_cache import SPRITES
+
 
 class Whale:
+    # Pixels drawn outside rect on each side (the tail reaches 40px back)
+    draw_margin = 40
+
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -42,11 +47,7 @@ class Whale:
     def try_load_sprite(self):
         try:
             # Try to load the sprite image - if it exists
-            self.sprite = pygame.image.load("assets/whale.png").convert_alpha()
-            self.sprite = pygame.transform.scale(
-                self.sprite, (self.rect.width, self.rect.height)
-            )
-            self.sprite = pygame.transform.flip(self.sprite, True, False)
+            self.sprite = ASSETS.image("whale.png", size=self.rect.size, flip=True)
 
         except:
             # No sprite available, will use drawn shape
@@ -95,42 +96,38 @@ class Whale:
         if self.animation_frame >= 4:
             self.animation_frame = 0
 
-    def draw(self, screen):
+    def tail_height(self):
+        return 60 + int(10 * math.sin(self.animation_frame))
+
+    def blits(self):
+        """(surface, position) entries drawing the whale. The splash under
+        it is a particle effect (Game.update_effects)"""
         if self.sprite:
-            screen.blit(self.sprite, self.rect)
-        else:
-            # Draw whale shape
-            pygame.draw.ellipse(screen, self.color, self.rect)
-
-            # Eye
-            eye_x = self.rect.x + self.rect.width - 40
-            eye_y = self.rect.y + 30
-            pygame.draw.circle(screen, (255, 255, 255), (eye_x, eye_y), 15)
-            pygame.draw.circle(screen, (0, 0, 0), (eye_x + 5, eye_y), 8)
-
-            # Tail
-            tail_x = self.rect.x
-            tail_y = self.rect.y + 40
-            tail_height = 60 + int(10 * math.sin(self.animation_frame))
-            pygame.draw.polygon(
-                screen,
-                self.color,
-                [
-                    (tail_x, tail_y),
-                    (tail_x - 40, tail_y - tail_height / 2),
-                    (tail_x - 40, tail_y + tail_height / 2),
-                ],
-            )
-
-        # Splash effect
-        splash_height = 2 + int(3 * math.sin(self.animation_frame * 2))
-        for i in range(3):
-            x_pos = self.rect.x + 10 + i * 20
-            height = splash_height + random.randint(0, 4)
-            pygame.draw.line(
-                screen,
-                (255, 255, 255),
-                (x_pos, self.rect.y + self.rect.height),
-                (x_pos, self.rect.y + self.rect.height + height),
-                2,
-            )
+            return [(self.sprite, self.rect.topleft)]
+        # Drawn shape is cached per tail height
+        return [SPRITES.entry(("whale", self.tail_height()),
+                              self.rect, self.draw_margin, self.paint)]
+
+    def paint(self, screen, rect):
+        # Draw whale shape
+        pygame.draw.ellipse(screen, self.color, rect)
+
+        # Eye
+        eye_x = rect.x + rect.width - 40
+        eye_y = rect.y + 30
+        pygame.draw.circle(screen, (255, 255, 255), (eye_x, eye_y), 15)
+        pygame.draw.circle(screen, (0, 0, 0), (eye_x + 5, eye_y), 8)
+
+        # Tail
+        tail_x = rect.x
+        tail_y = rect.y + 40
+        tail_height = self.tail_height()
+        pygame.draw.polygon(
+            screen,
+            self.color,
+            [
+                (tail_x, tail_y),
+                (tail_x - 40, tail_y - tail_height / 2),
+                (tail_x - 40, tail_y + tail_height / 2),
+            ],
+        )